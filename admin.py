@@ -0,0 +1,58 @@
+import streamlit as st
+from datetime import datetime
+from circuit_breaker import get_breaker_states
+from health import get_health_status
+from warmup import get_warmup_status
+import journal
+from sheets_service import sheets_service
+
+def is_admin(email):
+    """Check the email against the [admin] EMAILS allowlist in secrets"""
+    if not email:
+        return False
+    try:
+        allowlist = st.secrets.get("admin", {}).get("EMAILS", [])
+    except Exception:
+        return False
+    return email.lower() in {e.lower() for e in allowlist}
+
+def display_admin_panel():
+    """Show backend status to organizers in the sidebar"""
+    st.sidebar.page_link("pages/admin_analytics.py", label="Registration analytics", icon="📊")
+    with st.sidebar.expander("🛠️ Backend Status", expanded=False):
+        states = get_breaker_states()
+        if not states:
+            st.caption("No backend calls made yet in this process.")
+        for name, state in states.items():
+            icon = {"closed": "🟢", "half_open": "🟡", "open": "🔴"}.get(state["state"], "⚪")
+            since = datetime.fromtimestamp(state["since"]).strftime("%H:%M:%S")
+            st.markdown(f"{icon} **{name}**: {state['state']} since {since}")
+            if state["last_error"]:
+                st.caption(f"Last error: {state['last_error']}")
+
+        st.markdown(f"📒 Journaled entries waiting: **{len(journal.pending())}**")
+
+        if sheets_service.pool:
+            pool = sheets_service.pool.stats()
+            st.markdown(f"🔌 Sheets clients: **{pool['in_use']}/{pool['size']}** in use, "
+                        f"{pool['waiting']} waiting")
+            st.caption(f"{pool['contended']} of {pool['acquires']} checkouts waited, "
+                       f"mean {pool['wait_ms_mean']:.1f} ms, max {pool['wait_ms_max']:.1f} ms, "
+                       f"{pool['timeouts']} timed out")
+
+        st.markdown("**Health probes**")
+        for name, status in get_health_status()["backends"].items():
+            if status["ok"] is None:
+                st.markdown(f"⚪ **{name}**: not probed yet")
+                continue
+            icon = "🟢" if status["ok"] else "🔴"
+            checked = datetime.fromtimestamp(status["checked_at"]).strftime("%H:%M:%S")
+            st.markdown(f"{icon} **{name}**: {status['latency_ms']} ms at {checked}")
+            if status["last_error"]:
+                st.caption(f"Last error: {status['last_error']}")
+
+        warmup = get_warmup_status()
+        st.markdown(f"**Warm-up**: {warmup['state']}")
+        for name, step in warmup["steps"].items():
+            if not step["ok"]:
+                st.caption(f"{name} failed after {step['duration_ms']} ms: {step['error']}")
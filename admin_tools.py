@@ -0,0 +1,87 @@
+"""Command line tools for organizers.
+
+Run from the project root so Streamlit secrets are picked up, e.g.:
+
+    python admin_tools.py archive "2025 Fall"
+    python admin_tools.py resend --since 2025-09-01T10:00 --until 2025-09-01T14:00
+"""
+import argparse
+import sys
+
+from logging_config import configure_logging
+
+def archive_command(args):
+    """Archive a closed intake partition"""
+    from sheets_service import archive_partition
+
+    if archive_partition(args.partition):
+        print(f"Archived partition '{args.partition}'")
+        return 0
+    print(f"Could not archive partition '{args.partition}'")
+    return 1
+
+def flush_journal_command(args):
+    """Retry submissions and emails journaled while a backend was unavailable"""
+    import journal
+
+    entries = journal.pending()
+    if not entries:
+        print("Journal is empty")
+        return 0
+    done = journal.flush()
+    print(f"Flushed {done} of {len(entries)} journaled entries")
+    return 0 if done == len(entries) else 1
+
+def _row_range(value):
+    start, _, end = value.partition("-")
+    return int(start), int(end or start)
+
+def resend_command(args):
+    """Re-send confirmation emails for rows already in the response sheets"""
+    from bulk_resend import collect_jobs, run_resend
+
+    sheets = ("individual", "team") if args.sheet == "both" else (args.sheet,)
+    jobs = collect_jobs(args.since, args.until, args.rows, sheets, args.include_archived)
+    if args.dry_run:
+        count = 0
+        for job in jobs:
+            print(f"{job.key} ({job.email_type})")
+            count += 1
+        print(f"{count} messages would be sent")
+        return 0
+
+    report = run_resend(jobs, args.connections, args.rate, args.checkpoint)
+    for line in report.lines():
+        print(line)
+    return 0 if not report.failed else 1
+
+def main(argv=None):
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Knowledge Sharing Circle admin tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    archive_parser = subparsers.add_parser("archive", help="Roll a closed partition out of the live path")
+    archive_parser.add_argument("partition", help="Worksheet title of the partition (intake term or team)")
+    archive_parser.set_defaults(func=archive_command)
+
+    flush_parser = subparsers.add_parser("flush-journal", help="Retry journaled submissions and emails")
+    flush_parser.set_defaults(func=flush_journal_command)
+
+    resend_parser = subparsers.add_parser("resend", help="Re-send confirmation emails from the response sheets")
+    resend_parser.add_argument("--since", help="Earliest submission timestamp (ISO, e.g. 2025-09-01T10:00)")
+    resend_parser.add_argument("--until", help="Latest submission timestamp (ISO)")
+    resend_parser.add_argument("--rows", type=_row_range, help="Sheet row range in each worksheet, e.g. 2-150")
+    resend_parser.add_argument("--sheet", choices=["individual", "team", "both"], default="both")
+    resend_parser.add_argument("--include-archived", action="store_true", help="Also read archived partitions")
+    resend_parser.add_argument("--connections", type=int, default=2, help="SMTP connections to send over")
+    resend_parser.add_argument("--rate", type=float, default=1.0, help="Messages per second across all connections")
+    resend_parser.add_argument("--checkpoint", default="resend_checkpoint.jsonl",
+                               help="File recording sent messages, so a rerun resumes")
+    resend_parser.add_argument("--dry-run", action="store_true", help="List the messages without sending")
+    resend_parser.set_defaults(func=resend_command)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Registration aggregates for the organizers' analytics page.
+
+Counters live in the coordination database as (metric, bucket) -> count:
+every successful save adds to them, and the leader rebuilds them from both
+response sheets, archived partitions included, every SYNC_SECONDS so they
+cannot drift. The analytics page only reads the counters, so it renders in
+the same time however many rows the sheets hold.
+"""
+import logging
+import time
+from typing import Dict, Any, Tuple
+
+import coordination
+
+logger = logging.getLogger(__name__)
+
+# Metrics, each a set of buckets
+TEAM_REGISTRANTS = "team_registrants"  # bucket: selected team, count: people
+TYPE_REGISTRANTS = "type_registrants"  # bucket: Individual/Team, count: people
+TYPE_SUBMISSIONS = "type_submissions"  # bucket: Individual/Team, count: submissions
+TEAM_SIZES = "team_sizes"  # bucket: member count, count: team submissions
+DAILY_REGISTRANTS = "daily_registrants"  # bucket: YYYY-MM-DD, count: people
+
+# Longest the counters go without a full rebuild from the sheets
+SYNC_SECONDS = 60 * 60
+SYNC_CHECK_SECONDS = 60
+
+def _count(counters: Dict[Tuple[str, str], int], submission_type: str, selected_team: str,
+           timestamp: str, people: int):
+    """Add one submission of people registrants to counters"""
+    increments = [
+        ((TYPE_REGISTRANTS, submission_type), people),
+        ((TYPE_SUBMISSIONS, submission_type), 1),
+        # Timestamps are ISO 8601, so the date is the first ten characters
+        ((DAILY_REGISTRANTS, timestamp[:10]), people),
+    ]
+    if selected_team:
+        increments.append(((TEAM_REGISTRANTS, selected_team), people))
+    if submission_type == "Team":
+        increments.append(((TEAM_SIZES, str(people)), 1))
+    for key, count in increments:
+        counters[key] = counters.get(key, 0) + count
+
+def record_submission(submission_type: str, response_data: Dict[str, Any]):
+    """Count a submission just saved to the sheets; failures are only logged"""
+    people = len(response_data["members"]) if submission_type == "Team" else 1
+    counters = {}
+    _count(counters, submission_type, response_data["selected_team"], response_data["timestamp"], people)
+    try:
+        coordination.add_to_aggregates(counters)
+    except Exception as e:
+        logger.error("Could not update registration aggregates: %s", e)
+
+def rebuild_aggregates() -> bool:
+    """Recount every submission in both response sheets"""
+    from schema import INDIVIDUAL_LAYOUT
+    from sheets_service import INDIVIDUAL_SHEET_ID, iter_rows, iter_team_groups, sheets_service
+
+    if not sheets_service.pool:
+        logger.error("Google Sheets client not initialized, aggregates not rebuilt")
+        return False
+    try:
+        baseline = coordination.get_aggregates()
+        counters = {}
+        columns = INDIVIDUAL_LAYOUT.indexes("timestamp", "selected_team")
+        for _, _, (timestamp, team) in iter_rows(INDIVIDUAL_SHEET_ID, columns, include_archived=True):
+            if timestamp:
+                _count(counters, "Individual", team, timestamp, 1)
+        for team in iter_team_groups(include_archived=True):
+            people = sum(1 for member in team["members"] if member["email"])
+            if team["timestamp"] and people:
+                _count(counters, "Team", team["selected_team"], team["timestamp"], people)
+
+        coordination.replace_aggregates(counters, baseline)
+        logger.info("Registration aggregates rebuilt: %s counters", len(counters))
+        return True
+    except Exception as e:
+        logger.error("Error rebuilding registration aggregates: %s", e)
+        return False
+
+def request_rebuild():
+    """Have the leader rebuild the counters on its next check"""
+    coordination.set_meta("aggregates_synced_at", None)
+
+def get_analytics() -> Dict[str, Any]:
+    """Every metric as {bucket: count}, plus when the counters were last rebuilt"""
+    analytics = {metric: {} for metric in
+                 (TEAM_REGISTRANTS, TYPE_REGISTRANTS, TYPE_SUBMISSIONS, TEAM_SIZES, DAILY_REGISTRANTS)}
+    for (metric, bucket), count in coordination.get_aggregates().items():
+        analytics.setdefault(metric, {})[bucket] = count
+    analytics["synced_at"] = coordination.get_meta("aggregates_synced_at")
+    return analytics
+
+def _rebuild_if_due():
+    synced_at = coordination.get_meta("aggregates_synced_at")
+    if synced_at is None or time.time() - synced_at > SYNC_SECONDS:
+        rebuild_aggregates()
+
+coordination.register_leader_task("aggregates_sync", SYNC_CHECK_SECONDS, _rebuild_if_due)
@@ -2,14 +2,56 @@ import streamlit as st
 from display_utils import add_custom_css, display_header, display_team_guidelines
 from individual_form import individual_form
 from team_form import team_form
+from edit_form import edit_application
 from auth_service import initialize_auth, get_user_info
-from utils import initialize_session_state
-from sheets_service import check_email_exists
+from utils import initialize_session_state, get_team_data
+from prefetch import start_email_check, email_already_registered
+from profiling import profile_rerun, span
+from admin import is_admin, display_admin_panel
+from coordination import start_worker
+from health import start_health_server, start_prober
+from capacity import remaining_seats
+from warmup import start_warmup
+from session_budget import start_sweeper, touch_session, compact_after_submission
+from logging_config import configure_logging
+
+configure_logging()
+
+@st.fragment
+def registration_section(user_email):
+    """Registration type and forms, rerun on their own without the rest of the page"""
+    selected = st.radio(
+        '📝 Registration Type:', 
+        options=['Individual', 'Team'], 
+        horizontal=True,
+        help="Individual: Solo application | Team: Group application (max 5 members)"
+    )
+
+    if selected == 'Individual':
+        individual_form(user_email)
+    else:
+        team_form(user_email)
 
 def main():
     # Initialize session state
     initialize_session_state()
 
+    # Join leader election for the shared flush and sync jobs (once per process)
+    start_worker()
+
+    # Backend health is probed in the background and served on HEALTH_PORT,
+    # unless launch.py already started both (once per process)
+    start_health_server()
+    start_prober()
+
+    # Caches and connections are warmed up in the background, unless launch.py
+    # already did before the server started (once per process)
+    start_warmup()
+
+    # Idle sessions are compacted in the background (once per process)
+    start_sweeper()
+    touch_session()
+
     # Page configuration
     st.set_page_config(
         page_title="Knowledge Sharing Circle - Team Selection",
@@ -23,33 +65,47 @@ def main():
         }
     )
 
-    # Initialize authentication
-    initialize_auth()
+    # Initialize authentication; a finished submission needs no login
+    if not st.session_state.get("form_submitted", False):
+        with span("auth"):
+            initialize_auth()
 
     # Add custom CSS
-    add_custom_css()
+    with span("css"):
+        add_custom_css()
 
     # Display header
-    display_header()
+    with span("header"):
+        display_header()
+
+    # Get user info
+    with span("userinfo"):
+        user_info = get_user_info()
+
+    # Start the duplicate check now so it runs while the page renders
+    if user_info:
+        start_email_check(user_info["email"])
 
     # Display About Circle expander always
     with st.expander("About Circle", expanded=False):
         col1, col2 = st.columns(2)
-        with col1:
+        with col1, span("image"):
             try:
                 st.image("assets/executives.png", use_column_width=True)
             except FileNotFoundError:
                 st.error("⚠️ Image file 'assets/executives.png' not found. Please ensure the file exists.")
             except Exception as e:
                 st.error(f"⚠️ Error loading image: {str(e)}")
-        with col2:
+        with col2, span("guidelines"):
             display_team_guidelines()  # Shows circle info since no team selected
 
-    # Get user info
-    user_info = get_user_info()
+    if user_info and is_admin(user_info["email"]):
+        display_admin_panel()
 
     # Check if form is submitted
     if st.session_state.get("form_submitted", False):
+        # Drop everything the confirmation page does not need
+        compact_after_submission(st.session_state)
         if st.session_state.get("submission_type") == "individual":
             st.success("🎉 Individual application submitted successfully!")
             if st.session_state.get("email_sent", False):
@@ -77,9 +133,12 @@ def main():
 
     if user_info:
         # Check if email already exists
-        if check_email_exists(user_info["email"]):
+        with span("dedupe"):
+            email_exists = email_already_registered(user_info["email"])
+        if email_exists:
             st.success("Your form has already been submitted.")
-            st.info("For further details or updates, please contact KSC.")
+            with span("edit"):
+                edit_application(user_info["email"])
             return
 
         st.info("""
@@ -87,11 +146,13 @@ def main():
         We can schedule meetings later as per your convenience and availability.
         """)
 
-        # Team selection
+        # Team selection; full teams are left out
         st.markdown("### 🎯 Select Your Team")
+        seats = remaining_seats(get_team_data().keys())
         team = st.selectbox(
             "Choose your preferred team*", 
-            [""] + list(st.session_state.data.keys()), 
+            [""] + [name for name, left in seats.items() if left != 0], 
+            format_func=lambda name: name if not name or seats[name] is None else f"{name} ({seats[name]} seats left)",
             key="team_selectbox",
             help="Select the team you want to join. Guidelines will appear on the right."
         )
@@ -110,23 +171,14 @@ def main():
         if st.session_state.selectedTeam:  # Only show forms if team is selected
             col1, col2 = st.columns([1, 2])
 
-            with col1:
+            with col1, span("guidelines"):
                 display_team_guidelines()
 
-            with col2:
-                selected = st.radio(
-                    '📝 Registration Type:', 
-                    options=['Individual', 'Team'], 
-                    horizontal=True,
-                    help="Individual: Solo application | Team: Group application (max 5 members)"
-                )
-
-                if selected == 'Individual':
-                    individual_form(user_info["email"])
-                else:
-                    team_form(user_info["email"])
+            with col2, span("forms"):
+                registration_section(user_info["email"])
     else:
         st.error("⚠️ Please log in with Google to continue.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with profile_rerun():
+        main()
\ No newline at end of file
@@ -0,0 +1,97 @@
+// In-browser mirror of utils.validate_form_data, driven by the same
+// validation_rules.json. Loaded by client_validation.py into a zero-height
+// component iframe, it checks the form fields of the page as they are typed.
+// The server still validates every submission.
+(function () {
+  const RULES = window.KSC_RULES;
+  const FIELDS = window.KSC_FIELDS;
+  const host = window.parent;
+  const doc = host.document;
+
+  const isDigits = (value) => /^[0-9]+$/.test(value);
+  const isLetters = (value) => /^\p{L}+$/u.test(value);
+  const isAlnumOr = (value, extra) => Array.from(value).every(
+    (c) => /[\p{L}\p{N}]/u.test(c) || extra.includes(c)
+  );
+
+  const validators = {
+    name(value, rules) {
+      const messages = rules.messages;
+      if (!value.trim()) return [messages.required];
+      const parts = value.trim().split(/\s+/);
+      if (parts.length < rules.min_words) return [messages.min_words];
+      return parts.filter((part) => !isLetters(part)).map(() => messages.letters);
+    },
+    crn(value, rules) {
+      const messages = rules.messages;
+      if (!value.trim()) return [messages.required];
+      if (!isDigits(value)) return [messages.digits];
+      if (value.length !== rules.length) return [messages.length];
+      const year = rules.years[value.slice(0, 2)];
+      if (!year) return [messages.year];
+      const section = value.slice(2, 4);
+      if (!year.sections.includes(section)) return [year.message];
+      const roll = rules.rolls[section];
+      const number = parseInt(value.slice(4), 10);
+      if (number < roll.min || number > roll.max) return [roll.message];
+      return [];
+    },
+    contact(value, rules) {
+      const messages = rules.messages;
+      if (!value.trim()) return [messages.required];
+      if (!isDigits(value)) return [messages.digits];
+      if (value.length !== rules.length) return [messages.length];
+      if (!rules.prefixes.some((prefix) => value.startsWith(prefix))) return [messages.prefix];
+      return [];
+    },
+    email(value, rules) {
+      const messages = rules.messages;
+      if (!value.trim()) return [messages.required];
+      if (!value.includes("@") || !value.includes(".")) return [messages.format];
+      const at = value.indexOf("@");
+      const local = value.slice(0, at);
+      const domain = value.slice(at + 1);
+      if (!local || !domain) return [messages.parts];
+      if (!domain.includes(".")) return [messages.domain_dot];
+      if (!isAlnumOr(local, rules.local_chars)) return [messages.local_chars];
+      if (!isAlnumOr(domain, rules.domain_chars)) return [messages.domain_chars];
+      return [];
+    },
+  };
+
+  function showErrors(input, errors) {
+    const container = input.closest('[data-testid="stTextInput"]') || input.parentElement;
+    let box = container.querySelector(".ksc-field-errors");
+    if (!box) {
+      box = doc.createElement("div");
+      box.className = "ksc-field-errors";
+      box.style.cssText = "color:#d33;font-size:0.85rem;margin-top:0.25rem;white-space:pre-line;";
+      container.appendChild(box);
+    }
+    // Duplicate messages (one per bad name part) are shown once
+    box.textContent = Array.from(new Set(errors)).map((error) => "⚠ " + error).join("\n");
+    input.setAttribute("aria-invalid", errors.length ? "true" : "false");
+  }
+
+  function check(input, field) {
+    // An empty field may be an optional team member left out; the server
+    // reports required fields on submit
+    showErrors(input, input.value ? validators[field](input.value, RULES[field]) : []);
+  }
+
+  function attach(root) {
+    root.querySelectorAll("input[aria-label]").forEach((input) => {
+      const field = FIELDS[input.getAttribute("aria-label")];
+      if (!field || input.disabled || input.dataset.kscValidation) return;
+      input.dataset.kscValidation = field;
+      input.addEventListener("input", () => check(input, field));
+    });
+  }
+
+  // Reruns and added team members replace the inputs, so keep watching
+  if (host.__kscValidationObserver) host.__kscValidationObserver.disconnect();
+  const observer = new MutationObserver(() => attach(doc.body));
+  observer.observe(doc.body, { childList: true, subtree: true });
+  host.__kscValidationObserver = observer;
+  attach(doc.body);
+})();
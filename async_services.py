@@ -0,0 +1,118 @@
+"""Async counterparts of the Sheets and email operations.
+
+A team submission used to save its rows and then send one confirmation
+email per member in turn, so its latency was the sum of every network wait.
+Here the member emails go out concurrently, at most MAX_CONCURRENT_SENDS at
+a time, as soon as the rows are saved.
+
+gspread and smtplib are blocking libraries, so each operation runs on a
+worker thread and is awaited from one event loop on a dedicated background
+thread. Streamlit script threads call into it with run(), which blocks
+until the coroutine finishes.
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, List, Optional, TypeVar
+
+from email_service import send_confirmation_email
+from sheets_service import save_individual_response, save_team_response
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Concurrent SMTP connections across all sessions; providers throttle more
+MAX_CONCURRENT_SENDS = 3
+# Blocking calls in flight at once, sends and saves together
+IO_WORKERS = 8
+
+_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="async-io")
+_send_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its thread on first use"""
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="async-services", daemon=True).start()
+        return _loop
+
+def run(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine on the background loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result(timeout)
+
+async def _to_thread(func, *args, **kwargs):
+    return await asyncio.get_running_loop().run_in_executor(_executor, lambda: func(*args, **kwargs))
+
+async def save_individual_response_async(response_data: Dict[str, Any]) -> bool:
+    return await _to_thread(save_individual_response, response_data)
+
+async def save_team_response_async(response_data: Dict[str, Any]) -> bool:
+    return await _to_thread(save_team_response, response_data)
+
+async def send_confirmation_email_async(**kwargs) -> bool:
+    """send_confirmation_email, waiting for one of the shared send slots"""
+    async with _send_semaphore:
+        try:
+            return await _to_thread(send_confirmation_email, **kwargs)
+        except Exception as e:
+            logger.error("Error sending email to %s: %s", kwargs.get("recipient_email"), e)
+            return False
+
+@dataclass
+class SubmissionResult:
+    saved: bool
+    emails_sent: List[bool] = field(default_factory=list)
+
+    @property
+    def successful_emails(self) -> int:
+        return sum(self.emails_sent)
+
+async def submit_team(response_data: Dict[str, Any]) -> SubmissionResult:
+    """Save a team submission, then email every member concurrently"""
+    started = time.perf_counter()
+    if not await save_team_response_async(response_data):
+        return SubmissionResult(saved=False)
+
+    members = response_data["members"]
+    team_details = {
+        "team_name": response_data["team_name"],
+        "member_count": len(members),
+        "team_lead_name": members[0]["name"],
+    }
+    emails_sent = await asyncio.gather(*(
+        send_confirmation_email_async(
+            recipient_email=member["email"],
+            recipient_name=member["name"],
+            team_name=response_data["selected_team"],
+            submission_type="Team",
+            team_details=team_details,
+            # Different templates for the team lead and the members
+            email_type="team_lead" if i == 0 else "team_member",
+        )
+        for i, member in enumerate(members)
+    ))
+    logger.info("Team submission processed", extra={
+        "event": "submission.team", "count": sum(emails_sent), "rows": len(members),
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+    })
+    return SubmissionResult(saved=True, emails_sent=list(emails_sent))
+
+async def submit_individual(response_data: Dict[str, Any]) -> SubmissionResult:
+    """Save an individual submission, then send its confirmation email"""
+    if not await save_individual_response_async(response_data):
+        return SubmissionResult(saved=False)
+    email_sent = await send_confirmation_email_async(
+        recipient_email=response_data["email"],
+        recipient_name=response_data["name"],
+        team_name=response_data["selected_team"],
+        submission_type="Individual",
+    )
+    return SubmissionResult(saved=True, emails_sent=[email_sent])
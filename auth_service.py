@@ -1,12 +1,92 @@
 import streamlit as st
 from google_auth_oauthlib.flow import Flow
+from google.oauth2.credentials import Credentials
 import google.auth.transport.requests
+from google.auth import jwt
 import requests
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from metrics import increment
+from prefetch import start_email_check
+
+logger = logging.getLogger(__name__)
+
+# Pooled HTTP transport shared by all sessions
+_http_session = requests.Session()
+_http_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=20))
+_token_request = google.auth.transport.requests.Request(session=_http_session)
+
+# Refresh tokens this long before they expire
+REFRESH_MARGIN = timedelta(minutes=5)
+
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="token-refresh")
+
+def _refresh_copy(creds):
+    """Refresh a copy of the credentials so the session's object is never mutated mid-request"""
+    increment("backend.google.token_refresh")
+    refreshed = Credentials.from_authorized_user_info(json.loads(creds.to_json()))
+    refreshed.refresh(_token_request)
+    return refreshed
+
+class TokenRefresher:
+    """Refreshes one session's credentials on a background thread"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._future = None
+
+    def schedule(self, creds):
+        """Start a background refresh unless one is already running"""
+        with self._lock:
+            if self._future is None:
+                self._future = _refresh_executor.submit(_refresh_copy, creds)
+
+    def collect(self):
+        """Return (credentials, error) of a finished refresh, or (None, None)"""
+        with self._lock:
+            if self._future is None or not self._future.done():
+                return None, None
+            future, self._future = self._future, None
+        try:
+            return future.result(), None
+        except Exception as e:
+            return None, e
+
+def _expires_soon(creds):
+    if not creds.expiry:
+        return False
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - REFRESH_MARGIN <= now
+
+def _require_relogin(reason):
+    """Drop the session credentials and show the login link again"""
+    logger.warning("Session credentials dropped: %s", reason)
+    st.session_state.credentials = None
+    st.session_state.session_expired = True
+    st.rerun()
+
+def _prefetch_from_id_token(creds):
+    """Start the duplicate-email check with the email in the ID token.
+
+    The token is not verified here: the email only warms up a lookup, and
+    the page still checks the email returned by the userinfo endpoint.
+    """
+    try:
+        email = jwt.decode(creds.id_token, verify=False).get("email") if creds.id_token else None
+        if email:
+            start_email_check(email)
+    except Exception as e:
+        logger.warning("Could not prefetch email check from ID token: %s", e)
 
 def initialize_auth():
     # Initialize session state for credentials
     if "credentials" not in st.session_state:
         st.session_state.credentials = None
+    if "token_refresher" not in st.session_state:
+        st.session_state.token_refresher = TokenRefresher()
 
     # Config
     CLIENT_ID = st.secrets["gcp_oauth"]["client_id"]
@@ -21,6 +101,8 @@ def initialize_auth():
 
     if not st.session_state.credentials:
         # st.write("## 🔑 Login with Google")
+        if st.session_state.pop("session_expired", False):
+            st.warning("⚠️ Your session has expired. Please log in again.")
 
         # Construct Flow
         flow = Flow.from_client_config(
@@ -46,6 +128,7 @@ def initialize_auth():
             try:
                 flow.fetch_token(code=code)
                 st.session_state.credentials = flow.credentials
+                _prefetch_from_id_token(flow.credentials)
                 st.query_params.clear()
                 st.rerun()
             except Exception as e:
@@ -55,18 +138,43 @@ def initialize_auth():
 
 def get_user_info():
     if st.session_state.credentials:
+        # Idle sessions drop their refresher, and pages other than the
+        # registration page never run initialize_auth
+        if "token_refresher" not in st.session_state:
+            st.session_state.token_refresher = TokenRefresher()
+        refresher = st.session_state.token_refresher
+
+        # Swap in credentials refreshed in the background since the last rerun
+        refreshed, error = refresher.collect()
+        if error:
+            _require_relogin(f"background token refresh failed: {error}")
+        if refreshed:
+            st.session_state.credentials = refreshed
+
         creds = st.session_state.credentials
-        request_session = requests.Session()
-        token_request = google.auth.transport.requests.Request(session=request_session)
 
-        if creds.expired and creds.refresh_token:
-            creds.refresh(token_request)
+        if creds.expired:
+            # Only reached when the session was idle past the refresh window
+            if not creds.refresh_token:
+                _require_relogin("token expired without a refresh token")
+            try:
+                creds = _refresh_copy(creds)
+            except Exception as e:
+                _require_relogin(f"token refresh failed: {e}")
+            st.session_state.credentials = creds
+        elif creds.refresh_token and _expires_soon(creds):
+            refresher.schedule(creds)
 
-        user_info = requests.get(
+        increment("backend.google.userinfo")
+        response = _http_session.get(
             "https://www.googleapis.com/oauth2/v1/userinfo",
             params={"alt": "json"},
-            headers={"Authorization": f"Bearer {creds.token}"}
-        ).json()
+            headers={"Authorization": f"Bearer {creds.token}"},
+            timeout=10
+        )
+        if response.status_code == 401:
+            _require_relogin("userinfo request unauthorized")
+        user_info = response.json()
 
         return {
             "name": user_info.get("name", ""),
@@ -0,0 +1,717 @@
+"""Micro-benchmarks for the request hot paths.
+
+Runs against the in-process fakes in fakes.py, so no network or secrets are
+needed:
+
+    python benchmarks.py                           # run and print results
+    python benchmarks.py --save baseline.json      # store a baseline
+    python benchmarks.py --compare baseline.json   # report deltas against it
+    python benchmarks.py --stress --threads 32     # concurrent sessions against the client pool
+    python benchmarks.py --sessions 1000           # session memory before and after compaction
+    python benchmarks.py --sweep 200               # idle sweeper against live Streamlit sessions
+    python benchmarks.py --reruns                  # backend calls of add/remove member clicks
+    python benchmarks.py --submission              # team submission latency, sequential vs concurrent sends
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import fakes
+
+# Keep benchmark writes out of the app's coordination database
+os.environ.setdefault("KSC_COORDINATION_DB", os.path.join(tempfile.mkdtemp(), "benchmarks.db"))
+
+# Existing rows preloaded into each fake sheet, roughly one intake cycle
+PRELOADED_ROWS = 300
+
+LONG_COMMENT = ("I have helped organise two tech fests and ran our class page for a year. " * 30).strip()
+
+TEAM_MEMBERS = [
+    {"name": "Aarav Shrestha", "crn": "7801000012", "contact": "9812345670", "email": "aarav.shrestha@example.com"},
+    {"name": "Bina Maharjan", "crn": "7802000045", "contact": "9823456781", "email": "bina.maharjan@example.com"},
+    {"name": "Chirag Prajapati", "crn": "7903000021", "contact": "9712345672", "email": "chirag.p@example.com"},
+    {"name": "Diya Suwal", "crn": "8004000011", "contact": "9845678903", "email": "diya.suwal@example.com"},
+    {"name": "Eshan Karmacharya", "crn": "8101000033", "contact": "9856789014", "email": "eshan.k@example.com"},
+]
+
+INDIVIDUAL_HEADERS = ["Timestamp", "Name", "CRN", "Contact", "Email", "Selected Team", "Feedback"]
+TEAM_HEADERS = [
+    "Timestamp", "Team Name", "Selected Team", "Member Count",
+    "Comments", "Member Name", "CRN", "Contact", "Email", "Team Lead"
+]
+
+BENCHMARKS = {}
+
+def benchmark(name, iterations=100, setup=None):
+    """Register a benchmark; setup runs untimed before every round"""
+    def decorator(func):
+        BENCHMARKS[name] = (func, iterations, setup)
+        return func
+    return decorator
+
+def _crn(i):
+    return f"78{(i % 4) + 1:02d}{(i % 49) + 1:06d}"
+
+def _fresh_sheets_client(team_storage="merged"):
+    """Build a fake client whose sheets hold PRELOADED_ROWS earlier responses"""
+    import sheets_service
+
+    client = fakes.FakeClient()
+    individual = client.open_by_key(sheets_service.INDIVIDUAL_SHEET_ID).get_worksheet(0)
+    individual.append_rows([INDIVIDUAL_HEADERS] + [
+        ["2025-09-01T10:00:00", f"Student {i}", _crn(i), f"98{i:08d}", f"student{i}@example.com",
+         "Technical Team", ""]
+        for i in range(PRELOADED_ROWS)
+    ])
+    team = client.open_by_key(sheets_service.TEAM_SHEET_ID).get_worksheet(0)
+    team.append_rows([TEAM_HEADERS] + [
+        ["2025-09-01T10:00:00", f"Team {i // 5}", "Technical Team", "5", "",
+         f"Member {i}", _crn(i), f"97{i:08d}", f"member{i}@example.com", "Yes" if i % 5 == 0 else "No"]
+        for i in range(PRELOADED_ROWS)
+    ])
+    sheets_service.sheets_service.use_client(client)
+    sheets_service.sheets_service.team_storage = team_storage
+    return client
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+@benchmark("validate_form_data.valid", iterations=2000)
+def bench_validate_valid():
+    from utils import validate_form_data
+    for member in TEAM_MEMBERS:
+        validate_form_data(member["name"], member["crn"], member["contact"], member["email"])
+
+@benchmark("validate_form_data.invalid", iterations=2000)
+def bench_validate_invalid():
+    from utils import validate_form_data
+    validate_form_data("Aarav", "7705099", "9612345678", "aarav@@example")
+
+@benchmark("create_email_content.all_types", iterations=500)
+def bench_email_content():
+    from email_service import create_email_content
+    team_details = {"team_name": "Night Owls", "member_count": 5, "team_lead_name": TEAM_MEMBERS[0]["name"]}
+    create_email_content(TEAM_MEMBERS[0]["name"], "Technical Team", "Individual")
+    create_email_content(TEAM_MEMBERS[0]["name"], "Technical Team", "Team", team_details, "team_lead")
+    for member in TEAM_MEMBERS[1:]:
+        create_email_content(member["name"], "Technical Team", "Team", team_details, "team_member")
+
+@benchmark("send_confirmation_email.fake_smtp", iterations=200)
+def bench_send_email():
+    import email_service
+    email_service.send_confirmation_email(
+        TEAM_MEMBERS[0]["email"], TEAM_MEMBERS[0]["name"], "Technical Team", "Individual"
+    )
+
+@benchmark("save_individual_response.fake_sheets", iterations=50, setup=_fresh_sheets_client)
+def bench_save_individual():
+    from sheets_service import save_individual_response
+    member = TEAM_MEMBERS[0]
+    # replay=True skips the idempotency claim, so every iteration writes
+    save_individual_response({
+        "submission_type": "individual",
+        "timestamp": "2026-01-10T09:30:00",
+        "name": member["name"],
+        "crn": member["crn"],
+        "contact": member["contact"],
+        "email": member["email"],
+        "selected_team": "Technical Team",
+        "comments": LONG_COMMENT,
+    }, replay=True)
+
+def _team_response():
+    return {
+        "submission_type": "team",
+        "timestamp": "2026-01-10T09:30:00",
+        "team_name": "Night Owls",
+        "selected_team": "Technical Team",
+        "members": TEAM_MEMBERS,
+        "member_count": len(TEAM_MEMBERS),
+        "comments": LONG_COMMENT,
+    }
+
+@benchmark("save_team_response.five_members", iterations=50, setup=_fresh_sheets_client)
+def bench_save_team():
+    from sheets_service import save_team_response
+    save_team_response(_team_response(), replay=True)
+
+@benchmark("save_team_response.five_members_flat", iterations=50, setup=lambda: _fresh_sheets_client("flat"))
+def bench_save_team_flat():
+    from sheets_service import save_team_response
+    save_team_response(_team_response(), replay=True)
+
+class _FakeStreamlit:
+    """Counts the elements display_team_guidelines sends to the browser"""
+
+    def __init__(self):
+        self.session_state = SimpleNamespace(selectedTeam=None)
+        self.elements = 0
+
+    def markdown(self, *args, **kwargs):
+        self.elements += 1
+
+_guidelines_st = None
+
+def _setup_guidelines():
+    global _guidelines_st
+    import display_utils
+    _guidelines_st = _FakeStreamlit()
+    display_utils.st = _guidelines_st
+
+@benchmark("display_team_guidelines.every_team", iterations=200, setup=_setup_guidelines)
+def bench_guidelines():
+    from display_utils import display_team_guidelines
+    from utils import load_json
+    for team in [None] + list(load_json("team_guidelines.json")):
+        _guidelines_st.session_state.selectedTeam = team
+        display_team_guidelines()
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _install_fakes():
+    import email_service
+    email_service.smtplib.SMTP = fakes.FakeSMTP
+    email_service.get_smtp_config = lambda: dict(fakes.FAKE_SMTP_CONFIG)
+
+# ---------------------------------------------------------------------------
+# Session memory
+# ---------------------------------------------------------------------------
+
+def _simulated_session(i, private_copies):
+    """Session state of a visitor who submitted a five-member team.
+
+    private_copies=True reproduces the old layout, where every session
+    parsed its own copy of the guideline files.
+    """
+    from concurrent.futures import Future
+    from google.oauth2.credentials import Credentials
+    from auth_service import TokenRefresher
+
+    check = Future()
+    check.set_result(False)
+    state = {
+        "num_tabs": len(TEAM_MEMBERS),
+        "selectedTeam": "Technical Team",
+        "team_selectbox": "Technical Team",
+        "credentials": Credentials(
+            token=f"ya29.{'a' * 180}{i}", refresh_token=f"1//{'r' * 100}{i}", id_token=f"eyJ{'i' * 900}{i}",
+            token_uri="https://oauth2.googleapis.com/token", client_id="client-id", client_secret="client-secret",
+            scopes=["openid", "https://www.googleapis.com/auth/userinfo.email"],
+        ),
+        "token_refresher": TokenRefresher(),
+        "email_check": {"email": TEAM_MEMBERS[0]["email"], "future": check, "started": 0.0},
+        "form_submitted": True,
+        "submission_type": "team",
+        "team_name": "Night Owls",
+        "member_count": len(TEAM_MEMBERS),
+        "successful_emails": len(TEAM_MEMBERS),
+        "special_message": "",
+    }
+    for j, member in enumerate(TEAM_MEMBERS):
+        state.update({f"team_name_{j}": member["name"], f"team_crn_{j}": member["crn"],
+                      f"team_contact_{j}": member["contact"], f"team_email_{j}": member["email"]})
+    if private_copies:
+        with open("team_guidelines.json") as f:
+            state["data"] = json.load(f)
+        with open("circle_info.json") as f:
+            state["circle_data"] = json.load(f)
+    return state
+
+def run_session_memory(count):
+    """Memory held by count sessions in the old layout and after compaction"""
+    import gc
+    import tracemalloc
+    from session_budget import measure_session, compact_after_submission, SESSION_BUDGET_BYTES
+    from utils import get_team_data, get_circle_data
+
+    shared = (get_team_data(), get_circle_data())
+    print(f"{count} simulated sessions, budget {SESSION_BUDGET_BYTES} bytes per session")
+    for label, private_copies, compact in (("before", True, False), ("after", False, True)):
+        gc.collect()
+        tracemalloc.start()
+        sessions = [_simulated_session(i, private_copies) for i in range(count)]
+        if compact:
+            for state in sessions:
+                compact_after_submission(state)
+        gc.collect()
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        sizes = [sum(measure_session(state, shared).values()) for state in sessions]
+        largest = measure_session(sessions[0], shared)
+        top = ", ".join(f"{key} {size}" for key, size in sorted(largest.items(), key=lambda item: -item[1])[:3])
+        print(f"  {label:7} traced {traced / 1024 / 1024:8.2f} MiB  "
+              f"per session {statistics.mean(sizes) / 1024:7.1f} KiB  "
+              f"over budget {sum(size > SESSION_BUDGET_BYTES for size in sizes):5}  largest: {top}")
+        del sessions
+    return 0
+
+# Script each live session runs in the sweep check: the state an idle
+# visitor's session holds, then the activity record app.py makes
+_SWEEP_SCRIPT = """
+import streamlit as st
+from session_budget import touch_session
+
+st.session_state.setdefault("selectedTeam", "Technical Team")
+st.session_state.setdefault("email_check", {"email": "aarav.shrestha@example.com", "rows": ["x" * 100] * 300})
+st.session_state.setdefault("edit_submission", {"email": "aarav.shrestha@example.com", "submission": None})
+touch_session()
+"""
+
+class _NullClient:
+    """SessionClient that drops every message the session sends"""
+
+    def write_forward_msg(self, msg):
+        pass
+
+    @property
+    def client_context(self):
+        return None
+
+async def _start_runtime(script_path):
+    """Start a Streamlit Runtime serving script_path, without a web server"""
+    from streamlit.runtime import Runtime, RuntimeConfig
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+
+    runtime = Runtime(RuntimeConfig(
+        script_path=script_path,
+        media_file_storage=MemoryMediaFileStorage("/media"),
+        uploaded_file_manager=MemoryUploadedFileManager("/upload"),
+    ))
+    await runtime.start()
+    return runtime
+
+async def _run_sweep_check(count):
+    import gc
+    import session_budget
+
+    script_path = os.path.join(tempfile.mkdtemp(), "sweep_app.py")
+    with open(script_path, "w") as f:
+        f.write(_SWEEP_SCRIPT)
+    runtime = await _start_runtime(script_path)
+    try:
+        session_ids = [runtime.connect_session(client=_NullClient(), user_info={"email": None})
+                       for _ in range(count)]
+        for session_id in session_ids:
+            runtime._session_mgr.get_session_info(session_id).session.request_rerun(None)
+        deadline = time.monotonic() + 60
+        while len(session_budget._sessions) < count and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        # Script runners are gone once their run ends, as between visits
+        await asyncio.sleep(0.5)
+        gc.collect()
+
+        states = [runtime._session_mgr.get_session_info(session_id).session.session_state
+                  for session_id in session_ids]
+        before = statistics.mean(sum(session_budget.measure_session(state.filtered_state).values())
+                                 for state in states)
+        with session_budget._lock:
+            for entry in session_budget._sessions.values():
+                entry["last_active"] -= session_budget.IDLE_SECONDS + 1
+        result = session_budget.sweep()
+        after = statistics.mean(sum(session_budget.measure_session(state.filtered_state).values())
+                                for state in states)
+        left = sum(any(key in state for key in session_budget.REBUILDABLE_KEYS) for state in states)
+    finally:
+        runtime.stop()
+
+    print(f"{count} live sessions idle past {session_budget.IDLE_SECONDS}s: tracked {result['tracked']}, "
+          f"compacted {result['compacted']}, over budget {result['over_budget']}")
+    print(f"  per session {before / 1024:7.1f} KiB before the sweep, {after / 1024:7.1f} KiB after")
+    ok = result["tracked"] == count and result["compacted"] == count and not left
+    print(f"Sweeper: {'OK' if ok else f'FAILED, {left} sessions still hold rebuildable state'}")
+    return 0 if ok else 1
+
+def run_sweep_check(count):
+    """Run the real idle sweeper against count live Streamlit sessions"""
+    return asyncio.run(_run_sweep_check(count))
+
+# ---------------------------------------------------------------------------
+# Rerun cost
+# ---------------------------------------------------------------------------
+
+class _RecordingClient:
+    """SessionClient that keeps the messages of the current rerun"""
+
+    def __init__(self):
+        self.messages = []
+
+    def write_forward_msg(self, msg):
+        self.messages.append(msg)
+
+    @property
+    def client_context(self):
+        return None
+
+def _install_app_fakes(user_email):
+    """Serve app.py from the fakes: signed in as user_email, no background jobs"""
+    import streamlit as st
+    import auth_service
+    import coordination
+    import health
+    import session_budget
+    import sheets_service
+    import warmup
+
+    warmup._started = True
+    warmup._done.set()
+    health._prober_started = True
+    coordination._worker_started = True
+    session_budget._sweeper_started = True
+    sheets_service.sheets_service.use_client(fakes.FakeClient())
+    st.secrets._secrets = {"gcp_oauth": {"client_id": "id", "client_secret": "secret",
+                                         "redirect_uri": "http://localhost:8501"}}
+    userinfo = SimpleNamespace(status_code=200, json=lambda: {"email": user_email, "name": "Team Lead"})
+    auth_service._http_session.get = lambda *args, **kwargs: userinfo
+
+async def _rerun(session, client, widget_states, fragment_id=""):
+    """Rerun a session the way the browser does and wait until it settles"""
+    from streamlit.proto.ClientState_pb2 import ClientState
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    client_state = ClientState(fragment_id=fragment_id)
+    client_state.widget_states.widgets.extend(widget_states)
+    client.messages.clear()
+    session.request_rerun(client_state)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+        # A run stopped by st.rerun() is followed by another one
+        if any(msg.WhichOneof("type") == "script_finished"
+               and msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN for msg in client.messages):
+            break
+    runs = sum(msg.WhichOneof("type") == "new_session" for msg in client.messages)
+    widgets = {}
+    for msg in client.messages:
+        if msg.WhichOneof("type") == "delta" and msg.delta.WhichOneof("type") == "new_element":
+            element = getattr(msg.delta.new_element, msg.delta.new_element.WhichOneof("type"))
+            if getattr(element, "id", ""):
+                widgets[element.label] = (element.id, msg.delta.fragment_id)
+    return runs, widgets
+
+async def _run_rerun_costs():
+    import metrics
+    from google.oauth2.credentials import Credentials
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+    _install_app_fakes(TEAM_MEMBERS[0]["email"])
+    runtime = await _start_runtime(os.path.abspath("app.py"))
+    try:
+        client = _RecordingClient()
+        session_id = runtime.connect_session(client=client, user_info={"email": None})
+        session = runtime._session_mgr.get_session_info(session_id).session
+        session.session_state["credentials"] = Credentials(token="token")
+
+        _, widgets = await _rerun(session, client, [])
+        team = WidgetState(id=widgets["Choose your preferred team*"][0], string_value="Technical Team")
+        _, widgets = await _rerun(session, client, [team])
+        kind = WidgetState(id=widgets["📝 Registration Type:"][0], string_value="Team")
+        _, widgets = await _rerun(session, client, [team, kind])
+
+        print("Backend calls per team member add/remove click")
+        for label in ("➕ Add Team Member", "➕ Add Team Member", "🗑️ Remove Last Member"):
+            # The browser reruns only the fragment a widget is in; a full
+            # rerun is what every click cost before the fragment
+            for scope in ("fragment", "full"):
+                widget_id, fragment_id = widgets[label]
+                metrics.reset_counters()
+                click = WidgetState(id=widget_id, trigger_value=True)
+                runs, rendered = await _rerun(session, client, [team, kind, click],
+                                              fragment_id if scope == "fragment" else "")
+                widgets.update(rendered)
+                calls = {name: count for name, count in metrics.get_counters().items() if name.startswith("backend.")}
+                print(f"  {label:24} {scope:8} runs {runs}  members {session.session_state['num_tabs']}  "
+                      f"backend calls {sum(calls.values()):2}  {calls}")
+    finally:
+        runtime.stop()
+    return 0
+
+def run_rerun_costs():
+    """Count backend calls of add/remove member clicks in a live Streamlit session"""
+    return asyncio.run(_run_rerun_costs())
+
+# ---------------------------------------------------------------------------
+# Stress test
+# ---------------------------------------------------------------------------
+
+class _SlowClient:
+    """A pooled client over shared fake sheets, with a fixed delay per spreadsheet open"""
+
+    def __init__(self, client, latency):
+        self.client = client
+        self.latency = latency
+
+    def open_by_key(self, key):
+        time.sleep(self.latency)
+        return self.client.open_by_key(key)
+
+    def set_timeout(self, timeout=None):
+        pass
+
+def _percentile(samples, pct):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))] if samples else 0.0
+
+def run_stress(threads, operations, latency_ms, pool_size):
+    """Hammer save_* and check_email_exists from many threads against the fake sheets.
+
+    Prints throughput, latency per operation, pool contention and whether
+    every successful save landed in the sheets exactly once.
+    """
+    import sheets_service
+
+    shared = _fresh_sheets_client()
+    service = sheets_service.sheets_service
+    service.pool_size = pool_size
+    service._set_pool(lambda: _SlowClient(shared, latency_ms / 1000))
+    # The leader replica keeps the shared email index fresh, so email checks
+    # are answered without a client
+    service.sync_email_index()
+    service.pool.reset_stats()
+
+    timings = {"save_individual": [], "save_team": [], "check_email": []}
+    failures = []
+    saved_rows = {"individual": 0, "team": 0}
+    lock = threading.Lock()
+    # Fresh submissions each run, so none are dropped as duplicates of an earlier run
+    run = f"{time.time_ns():x}"
+
+    def operation(i):
+        kind = random.choices(list(timings), weights=(3, 1, 6))[0]
+        email = f"stress{i}.{run}@example.com"
+        started = time.perf_counter()
+        if kind == "save_individual":
+            ok = sheets_service.save_individual_response({
+                "timestamp": "2026-01-10T09:30:00", "name": f"Stress {i} {run}", "crn": _crn(i),
+                "contact": f"96{i:08d}", "email": email, "selected_team": "Technical Team", "comments": "",
+            })
+            rows = ("individual", 1)
+        elif kind == "save_team":
+            members = [dict(member, email=f"stress{i}.{j}.{run}@example.com") for j, member in enumerate(TEAM_MEMBERS)]
+            ok = sheets_service.save_team_response({
+                "timestamp": "2026-01-10T09:30:00", "team_name": f"Stress Team {i}",
+                "selected_team": "Technical Team", "members": members, "comments": "",
+            })
+            rows = ("team", len(members))
+        else:
+            sheets_service.check_email_exists(f"member{i % PRELOADED_ROWS}@example.com")
+            ok, rows = True, None
+        elapsed = (time.perf_counter() - started) * 1000
+        with lock:
+            timings[kind].append(elapsed)
+            if not ok:
+                failures.append(kind)
+            elif rows:
+                saved_rows[rows[0]] += rows[1]
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(operation, range(operations)))
+    elapsed = time.perf_counter() - started
+
+    print(f"{operations} operations from {threads} threads, pool of {pool_size}, "
+          f"{latency_ms} ms per spreadsheet open")
+    print(f"Throughput {operations / elapsed:.1f} ops/s over {elapsed:.2f}s, {len(failures)} failed")
+    for kind, samples in timings.items():
+        print(f"  {kind:18} n={len(samples):5}  p50 {_percentile(samples, 50):8.1f}ms  "
+              f"p95 {_percentile(samples, 95):8.1f}ms  max {max(samples, default=0.0):8.1f}ms")
+
+    stats = service.pool.stats()
+    print(f"Pool: {stats['created']} clients created, {stats['contended']} of {stats['acquires']} checkouts waited, "
+          f"wait mean {stats['wait_ms_mean']:.1f}ms max {stats['wait_ms_max']:.1f}ms, "
+          f"up to {stats['waiting_max']} threads waiting")
+
+    intact = True
+    for name, sheet_id in (("individual", sheets_service.INDIVIDUAL_SHEET_ID), ("team", sheets_service.TEAM_SHEET_ID)):
+        written = len(shared.open_by_key(sheet_id).get_worksheet(0).get_all_values()) - 1 - PRELOADED_ROWS
+        if written != saved_rows[name]:
+            intact = False
+        print(f"  {name} rows written {written}, expected {saved_rows[name]}")
+    print("Integrity: OK" if intact else "Integrity: MISMATCH")
+    return 0 if intact and not failures else 1
+
+# ---------------------------------------------------------------------------
+# Team submission latency
+# ---------------------------------------------------------------------------
+
+class _SlowSMTP(fakes.FakeSMTP):
+    """Fake SMTP server with a fixed delay per round trip"""
+
+    latency = 0.0
+
+    def login(self, username, password):
+        time.sleep(self.latency)
+        return super().login(username, password)
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        time.sleep(self.latency)
+        return super().sendmail(from_addr, to_addrs, msg)
+
+def _team_submission(tag):
+    return {
+        "submission_type": "team",
+        "timestamp": f"2026-01-10T09:30:{tag:02d}",
+        "team_name": f"Night Owls {tag}",
+        "selected_team": "Technical Team",
+        "members": TEAM_MEMBERS,
+        "member_count": len(TEAM_MEMBERS),
+        "comments": LONG_COMMENT,
+    }
+
+def _submit_sequentially(response_data):
+    """The team form's flow before async_services: save, then one send after another"""
+    from email_service import send_confirmation_email
+    from sheets_service import save_team_response
+
+    if not save_team_response(response_data):
+        return 0
+    members = response_data["members"]
+    team_details = {"team_name": response_data["team_name"], "member_count": len(members),
+                    "team_lead_name": members[0]["name"]}
+    return sum(
+        send_confirmation_email(member["email"], member["name"], response_data["selected_team"], "Team",
+                                team_details, "team_lead" if i == 0 else "team_member")
+        for i, member in enumerate(members)
+    )
+
+def run_submission_latency(latency_ms, rounds):
+    """Time one five-member team submission with sequential and with concurrent sends"""
+    import email_service
+    from async_services import run, submit_team
+
+    _SlowSMTP.latency = latency_ms / 1000
+    email_service.smtplib.SMTP = _SlowSMTP
+    _fresh_sheets_client()
+
+    timings = {"sequential": [], "concurrent": []}
+    for i in range(rounds):
+        started = time.perf_counter()
+        sent = _submit_sequentially(_team_submission(2 * i))
+        timings["sequential"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        result = run(submit_team(_team_submission(2 * i + 1)))
+        timings["concurrent"].append(time.perf_counter() - started)
+        if sent != len(TEAM_MEMBERS) or result.successful_emails != len(TEAM_MEMBERS):
+            print("Not every confirmation email was sent")
+            return 1
+
+    print(f"Five-member team submission, {latency_ms} ms per SMTP round trip, {rounds} rounds")
+    for label, samples in timings.items():
+        print(f"  {label:10} mean {statistics.mean(samples) * 1000:8.1f}ms  min {min(samples) * 1000:8.1f}ms")
+    return 0
+
+def run_benchmark(name, rounds):
+    """Return per-call timings in microseconds for one benchmark"""
+    func, iterations, setup = BENCHMARKS[name]
+    samples = []
+    for _ in range(rounds):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        samples.append((time.perf_counter() - start) / iterations * 1e6)
+    return {
+        "mean_us": statistics.mean(samples),
+        "min_us": min(samples),
+        "stdev_us": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "rounds": rounds,
+        "iterations": iterations,
+    }
+
+def compare(results, baseline, threshold):
+    """Print deltas against a baseline; return True if any benchmark regressed"""
+    regressed = False
+    print(f"\n{'benchmark':45} {'baseline':>12} {'current':>12} {'delta':>9}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:45} {'-':>12} {result['min_us']:>10.1f}us {'new':>9}")
+            continue
+        before = baseline[name]["min_us"]
+        delta = (result["min_us"] - before) / before * 100 if before else 0.0
+        marker = ""
+        if delta > threshold:
+            marker = "  REGRESSION"
+            regressed = True
+        print(f"{name:45} {before:>10.1f}us {result['min_us']:>10.1f}us {delta:>+8.1f}%{marker}")
+    return regressed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for the request hot paths")
+    parser.add_argument("-k", dest="pattern", default="", help="Only run benchmarks containing this text")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per benchmark")
+    parser.add_argument("--save", metavar="PATH", help="Write results as a baseline JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="Compare results against a baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Percent slowdown of the best round counted as a regression")
+    parser.add_argument("--stress", action="store_true", help="Run the concurrent stress test instead")
+    parser.add_argument("--threads", type=int, default=32, help="Concurrent sessions in the stress test")
+    parser.add_argument("--operations", type=int, default=2000, help="Total operations in the stress test")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Simulated Sheets latency in the stress test")
+    parser.add_argument("--pool-size", type=int, default=4, help="Client pool size in the stress test")
+    parser.add_argument("--sessions", type=int, metavar="N",
+                        help="Measure memory of N simulated sessions before and after compaction instead")
+    parser.add_argument("--sweep", type=int, metavar="N",
+                        help="Run the idle-session sweeper against N live Streamlit sessions instead")
+    parser.add_argument("--reruns", action="store_true",
+                        help="Count backend calls of add/remove member clicks in a live session instead")
+    parser.add_argument("--submission", action="store_true",
+                        help="Time a team submission with sequential and concurrent email sends instead")
+    parser.add_argument("--smtp-latency-ms", type=float, default=50.0,
+                        help="Simulated SMTP round trip in the submission test")
+    args = parser.parse_args(argv)
+
+    _install_fakes()
+
+    if args.submission:
+        return run_submission_latency(args.smtp_latency_ms, args.rounds)
+
+    if args.sessions:
+        return run_session_memory(args.sessions)
+
+    if args.sweep:
+        return run_sweep_check(args.sweep)
+
+    if args.reruns:
+        return run_rerun_costs()
+
+    if args.stress:
+        return run_stress(args.threads, args.operations, args.latency_ms, args.pool_size)
+
+    results = {}
+    for name in BENCHMARKS:
+        if args.pattern not in name:
+            continue
+        results[name] = run_benchmark(name, args.rounds)
+        result = results[name]
+        print(f"{name:45} min {result['min_us']:>10.1f}us  mean {result['mean_us']:>10.1f}us  "
+              f"± {result['stdev_us']:.1f}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
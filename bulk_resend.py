@@ -0,0 +1,258 @@
+"""Re-send confirmation emails for submissions already in the response sheets.
+
+Used after an SMTP outage: rows are streamed from both worksheets in paged
+reads, each message is rebuilt exactly as the forms would have sent it, and
+the sends go out over a few reused SMTP connections at a fixed rate. The key
+of every sent message is appended to a checkpoint file so an interrupted run
+resumes where it stopped.
+"""
+import json
+import logging
+import os
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterator, Iterable, Optional, Dict, Any, List, Tuple
+
+from email_service import get_smtp_config, open_smtp_connection, build_confirmation_message
+from schema import INDIVIDUAL_LAYOUT
+from sheets_service import INDIVIDUAL_SHEET_ID, iter_rows, iter_team_groups
+
+logger = logging.getLogger(__name__)
+
+# Only the columns a confirmation email needs
+INDIVIDUAL_FIELDS = ("timestamp", "name", "email", "selected_team")
+
+@dataclass(slots=True)
+class ResendJob:
+    key: str  # sheet:worksheet:row:email, stable across runs
+    recipient_email: str
+    recipient_name: str
+    team_name: str
+    submission_type: str
+    team_details: Optional[Dict[str, Any]] = None
+    email_type: str = "general"
+
+@dataclass
+class ResendReport:
+    sent: int = 0
+    skipped: int = 0
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Messages sent per second"""
+        return self.sent / self.elapsed if self.elapsed else 0.0
+
+    def lines(self) -> List[str]:
+        lines = [
+            f"Sent {self.sent}, skipped {self.skipped} (already sent), failed {len(self.failed)}",
+            f"Elapsed {self.elapsed:.1f}s, {self.throughput:.2f} messages/s",
+        ]
+        lines += [f"  FAILED {key}: {error}" for key, error in self.failed]
+        return lines
+
+def _in_range(timestamp: str, row_number: int, since: Optional[str], until: Optional[str],
+              rows: Optional[Tuple[int, int]]) -> bool:
+    # Timestamps are ISO 8601, so string order is time order
+    if since and timestamp < since:
+        return False
+    if until and timestamp > until:
+        return False
+    if rows and not rows[0] <= row_number <= rows[1]:
+        return False
+    return True
+
+def collect_jobs(since: Optional[str] = None, until: Optional[str] = None,
+                 rows: Optional[Tuple[int, int]] = None, sheets: Iterable[str] = ("individual", "team"),
+                 include_archived: bool = False) -> Iterator[ResendJob]:
+    """Rebuild the confirmation emails of every submission in the time and row range.
+
+    The row range applies to each worksheet; a team is included when its
+    first row is in range.
+    """
+    if "individual" in sheets:
+        columns = INDIVIDUAL_LAYOUT.indexes(*INDIVIDUAL_FIELDS)
+        for title, row_number, values in iter_rows(INDIVIDUAL_SHEET_ID, columns, include_archived=include_archived):
+            row = dict(zip(INDIVIDUAL_FIELDS, values))
+            if not row["email"] or not _in_range(row["timestamp"], row_number, since, until, rows):
+                continue
+            yield ResendJob(
+                key=f"individual:{title}:{row_number}:{row['email'].lower()}",
+                recipient_email=row["email"],
+                recipient_name=row["name"],
+                team_name=row["selected_team"],
+                submission_type="Individual",
+            )
+
+    if "team" in sheets:
+        for team in iter_team_groups(include_archived=include_archived):
+            if not _in_range(team["timestamp"], team["start_row"], since, until, rows):
+                continue
+            members = [member for member in team["members"] if member["email"]]
+            if not members:
+                continue
+            team_details = {
+                "team_name": team["team_name"],
+                "member_count": len(members),
+                "team_lead_name": members[0]["name"],
+            }
+            for i, member in enumerate(members):
+                yield ResendJob(
+                    key=f"team:{team['worksheet']}:{team['start_row'] + i}:{member['email'].lower()}",
+                    recipient_email=member["email"],
+                    recipient_name=member["name"],
+                    team_name=team["selected_team"],
+                    submission_type="Team",
+                    team_details=team_details,
+                    email_type="team_lead" if i == 0 else "team_member",
+                )
+
+class Checkpoint:
+    """Keys of messages already sent, appended one JSON line per send"""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._lock = threading.Lock()
+        self._sent = set()
+        self._file = None
+        complete = True
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    complete = line.endswith("\n")
+                    try:
+                        key = json.loads(line)
+                    except ValueError:
+                        # A line cut short when an earlier run was killed
+                        continue
+                    if isinstance(key, dict):
+                        # Checkpoints written as one {"sent": [...]} document
+                        self._sent.update(key.get("sent", []))
+                    else:
+                        self._sent.add(key)
+        if path:
+            self._file = open(path, "a", encoding="utf-8")
+            if not complete:
+                # Start the next key on a line of its own
+                self._file.write("\n")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._sent
+
+    def mark(self, key: str):
+        with self._lock:
+            self._sent.add(key)
+            if self._file is None:
+                return
+            self._file.write(json.dumps(key) + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+class RateLimiter:
+    """Space calls evenly at rate per second across all threads"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+class _ConnectionPool:
+    """One SMTP connection per sender thread, reopened if the server drops it"""
+
+    def __init__(self, smtp_config: Dict[str, Any]):
+        self.smtp_config = smtp_config
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all = []
+
+    def get(self, reconnect: bool = False) -> smtplib.SMTP:
+        server = getattr(self._local, "server", None)
+        if server is None or reconnect:
+            server = open_smtp_connection(self.smtp_config)
+            self._local.server = server
+            with self._lock:
+                self._all.append(server)
+        return server
+
+    def close(self):
+        with self._lock:
+            servers, self._all = self._all, []
+        for server in servers:
+            try:
+                server.quit()
+            except Exception:
+                pass
+
+def run_resend(jobs: Iterable[ResendJob], connections: int = 2, rate: float = 1.0,
+               checkpoint_path: Optional[str] = None, smtp_config: Optional[Dict[str, Any]] = None) -> ResendReport:
+    """Send every job not yet in the checkpoint and report the outcome"""
+    smtp_config = smtp_config or get_smtp_config()
+    if not smtp_config:
+        raise RuntimeError("Failed to get SMTP configuration")
+
+    checkpoint = Checkpoint(checkpoint_path)
+    limiter = RateLimiter(rate)
+    pool = _ConnectionPool(smtp_config)
+    report = ResendReport()
+    report_lock = threading.Lock()
+
+    def send(job: ResendJob):
+        try:
+            msg = build_confirmation_message(
+                smtp_config, job.recipient_email, job.recipient_name, job.team_name,
+                job.submission_type, job.team_details, job.email_type
+            )
+            if msg is None:
+                raise RuntimeError("Failed to create email content")
+            text = msg.as_string()
+            limiter.acquire()
+            try:
+                pool.get().sendmail(smtp_config['sender_email'], job.recipient_email, text)
+            except smtplib.SMTPServerDisconnected:
+                pool.get(reconnect=True).sendmail(smtp_config['sender_email'], job.recipient_email, text)
+            checkpoint.mark(job.key)
+            with report_lock:
+                report.sent += 1
+        except Exception as e:
+            logger.error("Re-send failed for %s: %s", job.key, e)
+            with report_lock:
+                report.failed.append((job.key, str(e)))
+
+    workers = max(1, connections)
+    # Jobs queued or sending at once, so the job stream is read only as fast
+    # as the connections send instead of being drained into the executor
+    slots = threading.BoundedSemaphore(workers)
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="resend") as executor:
+            for job in jobs:
+                if job.key in checkpoint:
+                    report.skipped += 1
+                    continue
+                slots.acquire()
+                executor.submit(send, job).add_done_callback(lambda _: slots.release())
+    finally:
+        pool.close()
+        checkpoint.close()
+    report.elapsed = time.perf_counter() - started
+    logger.info("Bulk re-send finished: %s sent, %s failed", report.sent, len(report.failed),
+                extra={"event": "email.bulk_resend", "count": report.sent,
+                       "duration_ms": round(report.elapsed * 1000, 1)})
+    return report
@@ -0,0 +1,121 @@
+"""Per-team seat limits and the live registration counts they are checked against.
+
+Capacities come from the [team_capacity] section of secrets, one entry per
+team name; teams without an entry are unlimited. Counts live in the
+coordination database: every save reserves its seats atomically, so
+rendering the team selector never reads the sheets, and the leader
+re-seeds them from both response sheets every RESEED_SECONDS, so rows
+deleted by hand or submissions that never landed free their seats.
+"""
+import logging
+import time
+from typing import Dict, Iterable, Optional
+
+import streamlit as st
+
+import coordination
+
+logger = logging.getLogger(__name__)
+
+# Longest the counts go without a re-seed from the sheets
+RESEED_SECONDS = 15 * 60
+SEED_CHECK_SECONDS = 60
+
+def get_team_capacities() -> Dict[str, int]:
+    try:
+        return {team: int(seats) for team, seats in st.secrets.get("team_capacity", {}).items()}
+    except Exception as e:
+        logger.warning("Could not read team capacities: %s", e)
+        return {}
+
+def remaining_seats(teams: Iterable[str]) -> Dict[str, Optional[int]]:
+    """Seats left per team, None for unlimited teams"""
+    capacities = get_team_capacities()
+    try:
+        counts = coordination.get_team_counts()
+    except Exception as e:
+        logger.error("Team counts unavailable: %s", e)
+        counts = {}
+    return {
+        team: max(0, capacities[team] - counts.get(team, 0)) if team in capacities else None
+        for team in teams
+    }
+
+def seats_error(team: str, seats: int) -> Optional[str]:
+    """Message for the form when the team cannot take this many more members, else None"""
+    left = remaining_seats([team])[team]
+    if left is None or left >= seats:
+        return None
+    if left == 0:
+        return f"{team} is full and no longer accepting registrations"
+    return f"{team} has only {left} seat{'s' if left != 1 else ''} left"
+
+def reserve_seats(team: str, seats: int) -> bool:
+    """Count a submission's seats against its team; False if the team has no room left.
+
+    If the counts cannot be reached the submission is let through rather
+    than turned away.
+    """
+    try:
+        return coordination.reserve_team_seats(team, seats, get_team_capacities().get(team))
+    except Exception as e:
+        logger.error("Could not reserve team seats: %s", e)
+        return True
+
+def release_seats(team: str, seats: int):
+    try:
+        coordination.release_team_seats(team, seats)
+    except Exception as e:
+        logger.error("Could not release team seats: %s", e)
+
+def _journaled_seats(before: float) -> Dict[str, int]:
+    """Seats held by submissions journaled before a time, not in the sheets yet"""
+    seats = {}
+    for entry in coordination.pending_jobs():
+        # Later entries reserved their seats after the time, so they are counted as changes
+        if entry["kind"] in ("individual", "team") and entry["created_at"] < before:
+            team = entry["payload"]["selected_team"]
+            people = len(entry["payload"]["members"]) if entry["kind"] == "team" else 1
+            seats[team] = seats.get(team, 0) + people
+    return seats
+
+def seed_team_counts() -> bool:
+    """Count the registrations per team in the live partitions of both sheets"""
+    from schema import INDIVIDUAL_LAYOUT, FLAT_TEAM_LAYOUT
+    from sheets_service import INDIVIDUAL_SHEET_ID, TEAM_SHEET_ID, iter_rows, sheets_service
+
+    if not sheets_service.pool:
+        logger.error("Google Sheets client not initialized, team counts not seeded")
+        return False
+    try:
+        read_started_at = time.time()
+        counts = _journaled_seats(read_started_at)
+        for _, _, (team,) in iter_rows(INDIVIDUAL_SHEET_ID, INDIVIDUAL_LAYOUT.indexes("selected_team")):
+            if team:
+                counts[team] = counts.get(team, 0) + 1
+        # Flat-layout rows are one member each; in the merged layout only the
+        # first row of a team carries the team columns
+        columns = FLAT_TEAM_LAYOUT.indexes("selected_team", "member_count", "team_id")
+        for _, _, (team, member_count, team_id) in iter_rows(TEAM_SHEET_ID, columns):
+            if team and team_id:
+                counts[team] = counts.get(team, 0) + 1
+            elif team and member_count.isdigit():
+                counts[team] = counts.get(team, 0) + int(member_count)
+
+        coordination.replace_team_counts(counts, read_started_at)
+        logger.info("Team counts seeded for %s teams", len(counts))
+        return True
+    except Exception as e:
+        logger.error("Error seeding team counts: %s", e)
+        return False
+
+def reset_team_counts():
+    """Have the leader seed the counts again, e.g. after a partition is archived"""
+    coordination.set_meta("team_counts_seeded_at", None)
+
+def _seed_if_due():
+    seeded_at = coordination.get_meta("team_counts_seeded_at")
+    if seeded_at is None or time.time() - seeded_at > RESEED_SECONDS:
+        seed_team_counts()
+
+coordination.register_leader_task("team_counts_seed", SEED_CHECK_SECONDS, _seed_if_due)
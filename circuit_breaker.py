@@ -0,0 +1,126 @@
+import logging
+import threading
+import time
+from typing import Dict, Any
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# Defaults, overridable under [resilience] in secrets.toml
+DEFAULT_RESILIENCE_CONFIG = {
+    "SHEETS_CONNECT_TIMEOUT": 5.0,
+    "SHEETS_READ_TIMEOUT": 20.0,
+    "SHEETS_POOL_TIMEOUT": 10.0,
+    "SMTP_CONNECT_TIMEOUT": 5.0,
+    "SMTP_READ_TIMEOUT": 15.0,
+    "FAILURE_THRESHOLD": 5,
+    "RESET_TIMEOUT": 30.0,
+}
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+def get_resilience_config() -> Dict[str, Any]:
+    """Get timeout and breaker settings from Streamlit secrets, falling back to defaults"""
+    config = dict(DEFAULT_RESILIENCE_CONFIG)
+    try:
+        overrides = st.secrets.get("resilience", {})
+        for key, default in DEFAULT_RESILIENCE_CONFIG.items():
+            if key in overrides:
+                config[key] = type(default)(overrides[key])
+    except Exception as e:
+        logger.warning("Could not read resilience config: %s", e)
+    return config
+
+class CircuitBreaker:
+    """Stops calling a backend after repeated failures and retries it after a cool-down.
+
+    closed: calls go through. open: calls fail fast until reset_timeout has
+    passed. half_open: one trial call is let through; success closes the
+    breaker, failure opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._last_error = ""
+        self._last_change = time.time()
+
+    def _set_state(self, state: str):
+        if state != self._state:
+            logger.warning("Circuit breaker '%s' %s -> %s", self.name, self._state, state)
+            self._state = state
+            self._last_change = time.time()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._set_state(HALF_OPEN)
+            return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may be made now"""
+        state = self.state
+        with self._lock:
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self._set_state(CLOSED)
+
+    def release(self):
+        """Give back a call that was allowed but never made, recording no outcome"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self, error: Exception):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            self._last_error = str(error)
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._set_state(OPEN)
+
+    def snapshot(self) -> Dict[str, Any]:
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "failures": self._failures,
+                "last_error": self._last_error,
+                "since": self._last_change,
+            }
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Return the process-wide breaker for a backend, creating it on first use"""
+    with _registry_lock:
+        if name not in _breakers:
+            config = get_resilience_config()
+            _breakers[name] = CircuitBreaker(name, config["FAILURE_THRESHOLD"], config["RESET_TIMEOUT"])
+        return _breakers[name]
+
+def get_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every breaker, for the admin panel"""
+    with _registry_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
@@ -0,0 +1,126 @@
+"""Bounded pool of API clients shared by all Streamlit sessions.
+
+Every session runs in its own thread, so a single client would either be
+used concurrently or serialize every request. The pool hands each caller
+its own client for the duration of one operation, creating clients lazily
+up to size, and records how long callers waited for one. A caller that
+waits longer than its timeout gets PoolTimeout instead of a client.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Optional, Tuple
+
+from metrics import increment
+
+class PoolTimeout(TimeoutError):
+    """No pooled client became free within the caller's timeout"""
+
+class ClientPool:
+    def __init__(self, name: str, factory: Callable[[], Any], size: int = 4,
+                 prepare: Optional[Callable[[], None]] = None):
+        self.name = name
+        self.size = max(1, size)
+        self._factory = factory
+        self._prepare = prepare
+        self._lock = threading.Lock()
+        self._idle = []
+        # Waiters are served first come, first served; a released client is
+        # handed straight to the oldest one so returning threads cannot barge
+        self._waiters = deque()
+        self._created = 0
+        # Clients checked out; callers still waiting are counted in _waiters
+        self._in_use = 0
+        self.reset_stats()
+
+    def _checkout(self, timeout: Optional[float]) -> Tuple[Any, bool]:
+        """Return (idle client or None to create one, whether the caller had to wait)"""
+        with self._lock:
+            if self._idle:
+                self._in_use += 1
+                return self._idle.pop(), False
+            if self._created < self.size:
+                self._created += 1
+                self._in_use += 1
+                return None, False
+            waiter = [threading.Event(), None]
+            self._waiters.append(waiter)
+            self._stats["waiting_max"] = max(self._stats["waiting_max"], len(self._waiters))
+        if not waiter[0].wait(timeout):
+            with self._lock:
+                # A client may have been handed over just as the wait ran out
+                if not waiter[0].is_set():
+                    self._waiters.remove(waiter)
+                    self._stats["timeouts"] += 1
+                    increment(f"backend.{self.name}.pool.timeout")
+                    raise PoolTimeout(f"No {self.name} client free within {timeout}s")
+        return waiter[1], True
+
+    def _checkin(self, client: Any, discard: bool = False):
+        with self._lock:
+            if discard:
+                self._created -= 1
+                if self._waiters:
+                    # Let the oldest waiter create a replacement
+                    self._created += 1
+                    client = None
+                else:
+                    self._in_use -= 1
+                    return
+            if self._waiters:
+                # The client passes to the oldest waiter still checked out
+                waiter = self._waiters.popleft()
+                waiter[1] = client
+                waiter[0].set()
+            else:
+                self._in_use -= 1
+                if client is not None:
+                    self._idle.append(client)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None):
+        """Check out a client for the duration of the with block.
+
+        Waits at most timeout seconds for a client, forever when None.
+        """
+        started = time.perf_counter()
+        client, contended = self._checkout(timeout)
+        try:
+            if client is None:
+                client = self._factory()
+        except Exception:
+            self._checkin(None, discard=True)
+            raise
+
+        wait_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._stats["acquires"] += 1
+            self._stats["wait_ms_total"] += wait_ms
+            self._stats["wait_ms_max"] = max(self._stats["wait_ms_max"], wait_ms)
+            if contended:
+                self._stats["contended"] += 1
+        increment(f"backend.{self.name}.pool.acquire")
+        if contended:
+            increment(f"backend.{self.name}.pool.contended")
+
+        try:
+            if self._prepare:
+                self._prepare()
+            yield client
+        finally:
+            self._checkin(client)
+
+    def reset_stats(self):
+        """Start the wait statistics afresh, e.g. after a warm-up"""
+        with self._lock:
+            self._stats = {"acquires": 0, "contended": 0, "timeouts": 0, "wait_ms_total": 0.0,
+                           "wait_ms_max": 0.0, "waiting_max": 0}
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, current use and wait statistics since start"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update(size=self.size, created=self._created, in_use=self._in_use, waiting=len(self._waiters))
+        stats["wait_ms_mean"] = stats["wait_ms_total"] / stats["acquires"] if stats["acquires"] else 0.0
+        return stats
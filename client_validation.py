@@ -0,0 +1,40 @@
+"""Instant form validation in the browser, from the same rules the server uses.
+
+Streamlit only sees form values on submit, so a typo in a CRN used to cost a
+full rerun. add_client_validation renders a zero-height component whose
+script (assets/form_validation.js) checks the page's text inputs against
+validation_rules.json as they are typed and shows the errors under each
+field. utils.validate_form_data remains the final check on submit.
+"""
+import json
+from functools import lru_cache
+from typing import Dict
+
+import streamlit.components.v1 as components
+
+from utils import get_validation_rules
+
+SCRIPT_PATH = "assets/form_validation.js"
+
+@lru_cache(maxsize=None)
+def _read_script() -> str:
+    with open(SCRIPT_PATH, "r", encoding="utf-8") as f:
+        return f.read()
+
+@lru_cache(maxsize=8)
+def _component_html(fields_json: str) -> str:
+    # "</" would end the script element early
+    rules_json = json.dumps(get_validation_rules()).replace("</", "<\\/")
+    return (
+        f"<script>window.KSC_RULES = {rules_json}; window.KSC_FIELDS = {fields_json};</script>"
+        f"<script>{_read_script()}</script>"
+    )
+
+def add_client_validation(fields: Dict[str, str]):
+    """Validate the text inputs with these labels in the browser.
+
+    fields maps an input's label to its rule in validation_rules.json
+    (name, crn, contact or email).
+    """
+    fields_json = json.dumps(fields, sort_keys=True).replace("</", "<\\/")
+    components.html(_component_html(fields_json), height=0)
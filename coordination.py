@@ -0,0 +1,423 @@
+"""State shared by every app replica on a host, kept in one SQLite database.
+
+Holds the registered-email index, submission idempotency keys, per-team
+seat counts, the registration aggregates, where each submission sits in
+the response sheets and the work queue, and elects a single leader that runs periodic flush and sync jobs.
+Replicas on different hosts need the database on shared storage.
+"""
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Any, List, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DB_PATH = os.environ.get("KSC_COORDINATION_DB", "ksc_coordination.db")
+
+# Leader lease length; the leader renews it on every worker tick
+LEASE_SECONDS = 30
+WORKER_TICK_SECONDS = 5
+# Jobs claimed by a replica that dies become available again after this
+JOB_CLAIM_SECONDS = 120
+
+# Unique for this process, used as lease holder and job owner
+REPLICA_ID = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS registered_emails (
+    email TEXT PRIMARY KEY,
+    added_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    key TEXT PRIMARY KEY,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    claimed_by TEXT,
+    claimed_until REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS team_counts (
+    team TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS team_count_changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    team TEXT NOT NULL,
+    seats INTEGER NOT NULL,
+    changed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS aggregates (
+    metric TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (metric, bucket)
+);
+CREATE TABLE IF NOT EXISTS row_locations (
+    submission_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    sheet_id TEXT NOT NULL,
+    worksheet TEXT NOT NULL,
+    start_row INTEGER NOT NULL,
+    end_row INTEGER NOT NULL,
+    saved_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS submission_emails (
+    email TEXT PRIMARY KEY,
+    submission_id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready = False
+
+def _connect() -> sqlite3.Connection:
+    """Return this thread's connection, creating the schema on first use"""
+    global _schema_ready
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _local.conn = conn
+    if not _schema_ready:
+        with _schema_lock:
+            if not _schema_ready:
+                conn.executescript(_SCHEMA)
+                _schema_ready = True
+    return conn
+
+class _transaction:
+    """BEGIN IMMEDIATE ... COMMIT, so writers across processes are serialized"""
+
+    def __enter__(self):
+        self.conn = _connect()
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+# ---------------------------------------------------------------------------
+# Metadata
+# ---------------------------------------------------------------------------
+
+def set_meta(key: str, value: Any):
+    _connect().execute(
+        "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (key, json.dumps(value))
+    )
+
+def get_meta(key: str, default: Any = None) -> Any:
+    row = _connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return json.loads(row[0]) if row else default
+
+# ---------------------------------------------------------------------------
+# Registered-email index
+# ---------------------------------------------------------------------------
+
+def add_registered_emails(emails: Iterable[str]):
+    now = time.time()
+    _connect().executemany(
+        "INSERT OR IGNORE INTO registered_emails (email, added_at) VALUES (?, ?)",
+        [(email.strip().lower(), now) for email in emails if email.strip()]
+    )
+
+def is_email_registered(email: str) -> bool:
+    row = _connect().execute(
+        "SELECT 1 FROM registered_emails WHERE email = ?", (email.strip().lower(),)
+    ).fetchone()
+    return row is not None
+
+def replace_registered_emails(emails: Iterable[str], read_started_at: float):
+    """Replace the index with a full read of the sheets.
+
+    Entries added after the read started are kept, they may not have been
+    in the sheets yet when they were read.
+    """
+    now = time.time()
+    with _transaction() as conn:
+        conn.execute("DELETE FROM registered_emails WHERE added_at < ?", (read_started_at,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO registered_emails (email, added_at) VALUES (?, ?)",
+            [(email.strip().lower(), now) for email in emails if email.strip()]
+        )
+    set_meta("email_index_synced_at", now)
+
+def clear_registered_emails():
+    """Empty the index, so lookups read the sheets until the next sync"""
+    with _transaction() as conn:
+        conn.execute("DELETE FROM registered_emails")
+        set_meta("email_index_synced_at", None)
+
+def email_index_age() -> Optional[float]:
+    """Seconds since the index was last synced from the sheets, None if never"""
+    synced_at = get_meta("email_index_synced_at")
+    return None if synced_at is None else time.time() - synced_at
+
+# ---------------------------------------------------------------------------
+# Idempotency keys
+# ---------------------------------------------------------------------------
+
+def claim_idempotency_key(key: str) -> bool:
+    """Return True if this caller is the first to claim the key"""
+    cursor = _connect().execute(
+        "INSERT OR IGNORE INTO idempotency_keys (key, created_at) VALUES (?, ?)", (key, time.time())
+    )
+    return cursor.rowcount == 1
+
+def release_idempotency_key(key: str):
+    """Give a key back after the work it guarded failed"""
+    _connect().execute("DELETE FROM idempotency_keys WHERE key = ?", (key,))
+
+# ---------------------------------------------------------------------------
+# Team seat counts
+# ---------------------------------------------------------------------------
+
+def reserve_team_seats(team: str, seats: int, capacity: Optional[int] = None) -> bool:
+    """Add seats to a team's count; False, with nothing added, if that would exceed capacity"""
+    with _transaction() as conn:
+        row = conn.execute("SELECT count FROM team_counts WHERE team = ?", (team,)).fetchone()
+        if capacity is not None and (row[0] if row else 0) + seats > capacity:
+            return False
+        conn.execute(
+            "INSERT INTO team_counts (team, count) VALUES (?, ?) "
+            "ON CONFLICT(team) DO UPDATE SET count = count + excluded.count",
+            (team, seats)
+        )
+        conn.execute("INSERT INTO team_count_changes (team, seats, changed_at) VALUES (?, ?, ?)",
+                     (team, seats, time.time()))
+    return True
+
+def release_team_seats(team: str, seats: int):
+    """Give seats back after the submission that reserved them failed"""
+    with _transaction() as conn:
+        conn.execute("UPDATE team_counts SET count = MAX(0, count - ?) WHERE team = ?", (seats, team))
+        conn.execute("INSERT INTO team_count_changes (team, seats, changed_at) VALUES (?, ?, ?)",
+                     (team, -seats, time.time()))
+
+def get_team_counts() -> Dict[str, int]:
+    return dict(_connect().execute("SELECT team, count FROM team_counts").fetchall())
+
+def replace_team_counts(counts: Dict[str, int], read_started_at: float):
+    """Replace the counts with a full read of the sheets.
+
+    Seats reserved or released after the read started are applied on top,
+    they may not have been in the sheets yet when they were read. Changes
+    from before it are in the read, so they are dropped.
+    """
+    with _transaction() as conn:
+        changes = dict(conn.execute(
+            "SELECT team, SUM(seats) FROM team_count_changes WHERE changed_at >= ? GROUP BY team",
+            (read_started_at,)
+        ).fetchall())
+        conn.execute("DELETE FROM team_count_changes WHERE changed_at < ?", (read_started_at,))
+        conn.execute("DELETE FROM team_counts")
+        conn.executemany(
+            "INSERT INTO team_counts (team, count) VALUES (?, ?)",
+            [(team, max(0, counts.get(team, 0) + changes.get(team, 0))) for team in set(counts) | set(changes)]
+        )
+    set_meta("team_counts_seeded_at", time.time())
+
+# ---------------------------------------------------------------------------
+# Registration aggregates
+# ---------------------------------------------------------------------------
+
+def add_to_aggregates(increments: Dict[Tuple[str, str], int]):
+    """Add to the (metric, bucket) counters in one transaction"""
+    with _transaction() as conn:
+        conn.executemany(
+            "INSERT INTO aggregates (metric, bucket, count) VALUES (?, ?, ?) "
+            "ON CONFLICT(metric, bucket) DO UPDATE SET count = count + excluded.count",
+            [(metric, bucket, count) for (metric, bucket), count in increments.items()]
+        )
+
+def get_aggregates() -> Dict[Tuple[str, str], int]:
+    rows = _connect().execute("SELECT metric, bucket, count FROM aggregates").fetchall()
+    return {(metric, bucket): count for metric, bucket, count in rows}
+
+def replace_aggregates(aggregates: Dict[Tuple[str, str], int], baseline: Dict[Tuple[str, str], int]):
+    """Replace the counters with a full read of the sheets.
+
+    baseline is get_aggregates() from just before the read started;
+    whatever was added on top of it while the sheets were read is kept.
+    """
+    with _transaction() as conn:
+        current = {(metric, bucket): count for metric, bucket, count
+                   in conn.execute("SELECT metric, bucket, count FROM aggregates").fetchall()}
+        conn.execute("DELETE FROM aggregates")
+        conn.executemany(
+            "INSERT INTO aggregates (metric, bucket, count) VALUES (?, ?, ?)",
+            [(metric, bucket, aggregates.get((metric, bucket), 0)
+              + max(0, current.get((metric, bucket), 0) - baseline.get((metric, bucket), 0)))
+             for metric, bucket in set(aggregates) | set(current)]
+        )
+    set_meta("aggregates_synced_at", time.time())
+
+# ---------------------------------------------------------------------------
+# Submission row locations
+# ---------------------------------------------------------------------------
+
+_LOCATION_COLUMNS = ("submission_id", "kind", "sheet_id", "worksheet", "start_row", "end_row", "saved_at")
+
+def record_row_location(submission_id: str, kind: str, sheet_id: str, worksheet: str,
+                        start_row: int, end_row: int, emails: Iterable[str]):
+    """Remember the rows a submission was written to, findable by ID and by each email"""
+    with _transaction() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO row_locations "
+            "(submission_id, kind, sheet_id, worksheet, start_row, end_row, saved_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (submission_id, kind, sheet_id, worksheet, start_row, end_row, time.time())
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO submission_emails (email, submission_id) VALUES (?, ?)",
+            [(email.strip().lower(), submission_id) for email in emails if email.strip()]
+        )
+
+def get_row_location(submission_id: str) -> Optional[Dict[str, Any]]:
+    row = _connect().execute(
+        f"SELECT {', '.join(_LOCATION_COLUMNS)} FROM row_locations WHERE submission_id = ?", (submission_id,)
+    ).fetchone()
+    return dict(zip(_LOCATION_COLUMNS, row)) if row else None
+
+def find_row_location(email: str) -> Optional[Dict[str, Any]]:
+    """Location of the submission that registered this email, None if not indexed"""
+    row = _connect().execute(
+        "SELECT submission_id FROM submission_emails WHERE email = ?", (email.strip().lower(),)
+    ).fetchone()
+    return get_row_location(row[0]) if row else None
+
+def rename_row_location_worksheet(sheet_id: str, old_title: str, new_title: str):
+    """Follow a worksheet rename, e.g. when a partition is archived"""
+    _connect().execute(
+        "UPDATE row_locations SET worksheet = ? WHERE sheet_id = ? AND worksheet = ?",
+        (new_title, sheet_id, old_title)
+    )
+
+# ---------------------------------------------------------------------------
+# Work queue
+# ---------------------------------------------------------------------------
+
+def enqueue(kind: str, payload: Dict[str, Any]) -> str:
+    job_id = uuid.uuid4().hex
+    _connect().execute(
+        "INSERT INTO jobs (id, kind, payload, created_at) VALUES (?, ?, ?, ?)",
+        (job_id, kind, json.dumps(payload), time.time())
+    )
+    return job_id
+
+def pending_jobs() -> List[Dict[str, Any]]:
+    rows = _connect().execute(
+        "SELECT id, kind, payload, attempts, created_at FROM jobs ORDER BY created_at"
+    ).fetchall()
+    return [{"id": r[0], "kind": r[1], "payload": json.loads(r[2]), "attempts": r[3], "created_at": r[4]}
+            for r in rows]
+
+def pending_job_count() -> int:
+    return _connect().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+def claim_jobs(limit: int = 50) -> List[Dict[str, Any]]:
+    """Claim the oldest unclaimed jobs for this replica"""
+    now = time.time()
+    with _transaction() as conn:
+        rows = conn.execute(
+            "SELECT id, kind, payload, attempts FROM jobs WHERE claimed_until < ? ORDER BY created_at LIMIT ?",
+            (now, limit)
+        ).fetchall()
+        conn.executemany(
+            "UPDATE jobs SET claimed_by = ?, claimed_until = ?, attempts = attempts + 1 WHERE id = ?",
+            [(REPLICA_ID, now + JOB_CLAIM_SECONDS, r[0]) for r in rows]
+        )
+    return [{"id": r[0], "kind": r[1], "payload": json.loads(r[2]), "attempts": r[3] + 1} for r in rows]
+
+def complete_job(job_id: str):
+    _connect().execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+def release_job(job_id: str):
+    _connect().execute("UPDATE jobs SET claimed_by = NULL, claimed_until = 0 WHERE id = ?", (job_id,))
+
+# ---------------------------------------------------------------------------
+# Leader election
+# ---------------------------------------------------------------------------
+
+def try_acquire_lease(name: str = "leader", ttl: float = LEASE_SECONDS) -> bool:
+    """Take or renew a lease; True if this replica holds it afterwards"""
+    now = time.time()
+    with _transaction() as conn:
+        conn.execute(
+            "INSERT INTO leases (name, holder, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET holder = excluded.holder, expires_at = excluded.expires_at "
+            "WHERE leases.holder = excluded.holder OR leases.expires_at < ?",
+            (name, REPLICA_ID, now + ttl, now)
+        )
+        row = conn.execute("SELECT holder FROM leases WHERE name = ?", (name,)).fetchone()
+    return row is not None and row[0] == REPLICA_ID
+
+def lease_holder(name: str = "leader") -> Optional[str]:
+    row = _connect().execute(
+        "SELECT holder FROM leases WHERE name = ? AND expires_at >= ?", (name, time.time())
+    ).fetchone()
+    return row[0] if row else None
+
+# ---------------------------------------------------------------------------
+# Leader-only periodic tasks
+# ---------------------------------------------------------------------------
+
+_tasks: Dict[str, Dict[str, Any]] = {}
+_worker_lock = threading.Lock()
+_worker_started = False
+
+def register_leader_task(name: str, interval: float, func: Callable[[], Any]):
+    """Run func every interval seconds on whichever replica is leader"""
+    with _worker_lock:
+        _tasks[name] = {"interval": interval, "func": func, "last_run": 0.0}
+
+def is_leader() -> bool:
+    return lease_holder() == REPLICA_ID
+
+def _worker_loop():
+    while True:
+        try:
+            if try_acquire_lease():
+                now = time.monotonic()
+                with _worker_lock:
+                    due = [task for task in _tasks.values() if now - task["last_run"] >= task["interval"]]
+                for task in due:
+                    task["last_run"] = now
+                    try:
+                        task["func"]()
+                    except Exception as e:
+                        logger.error("Leader task failed: %s", e)
+        except Exception as e:
+            logger.error("Coordination worker error: %s", e)
+        time.sleep(WORKER_TICK_SECONDS)
+
+def start_worker():
+    """Start this replica's leader-election loop once per process"""
+    global _worker_started
+    with _worker_lock:
+        if _worker_started:
+            return
+        _worker_started = True
+    threading.Thread(target=_worker_loop, name="coordination-worker", daemon=True).start()
+    logger.info("Coordination worker started as %s", REPLICA_ID)
@@ -1,4 +1,7 @@
 import streamlit as st
+import html
+import json
+from utils import get_team_data, get_circle_data
 
 def add_custom_css():
     """Add custom CSS for better mobile experience and clean styling"""
@@ -141,6 +144,20 @@ def add_custom_css():
         margin-left: 0.5rem;
     }
     
+    /* Pre-rendered guideline sections */
+    .guideline-expander {
+        border: 1px solid rgba(250, 250, 250, 0.2);
+        border-radius: 0.5rem;
+        padding: 0.5rem 1rem;
+        margin-bottom: 0.75rem;
+    }
+    
+    .guideline-expander summary {
+        cursor: pointer;
+        font-weight: 600;
+        padding: 0.25rem 0;
+    }
+    
     /* Mobile responsive */
     @media (max-width: 768px) {
         .main-title {
@@ -178,33 +195,54 @@ def display_header():
     </div>
     """, unsafe_allow_html=True)
 
+def _render_section(title, body):
+    """Render one collapsible guideline section as HTML"""
+    return (
+        f'<details class="guideline-expander" open><summary>{html.escape(title)}</summary>'
+        f'{body}</details>'
+    )
+
+def _render_paragraph(text):
+    return f"<p>{html.escape(text)}</p>"
+
+def _render_bullets(items):
+    return "<p>" + "<br>".join(f"• {html.escape(item)}" for item in items) + "</p>"
+
+@st.cache_data(show_spinner=False)
+def render_team_guidelines(team_name, team_info_json):
+    """Render a team's guideline block to a single HTML fragment.
+    
+    The JSON content is part of the cache key, so each content version is
+    rendered once per process and shared by all sessions.
+    """
+    team_info = json.loads(team_info_json)
+    return "".join([
+        f"<h3>📋 {html.escape(team_name)}</h3>",
+        _render_section("✨ Why Join?", _render_paragraph(team_info.get("Why Join", ""))),
+        _render_section("🎯 Key Responsibilities", _render_bullets(team_info.get("Key Responsibilities", []))),
+        _render_section("⚠️ Why Avoid?", _render_paragraph(team_info.get("Why Avoid", ""))),
+    ])
+
+@st.cache_data(show_spinner=False)
+def render_circle_info(circle_info_json):
+    """Render the circle info block to a single HTML fragment"""
+    circle_info = json.loads(circle_info_json)
+    return "".join([
+        "<h3>🌟 Knowledge Sharing Circle</h3>",
+        _render_section("📖 About Us", _render_paragraph(circle_info.get("about", ""))),
+        _render_section("🎯 Our Mission", _render_bullets(circle_info.get("mission", []))),
+        _render_section("🔮 Vision", _render_paragraph(circle_info.get("vision", ""))),
+    ])
+
 def display_team_guidelines():
-    """Display team guidelines using Streamlit components"""
+    """Display team guidelines as one cached HTML element per block"""
     if st.session_state.selectedTeam:
-        team_info = st.session_state.data.get(st.session_state.selectedTeam, {})
-        
-        with st.container():
-            st.write(f"<h3>📋 {st.session_state.selectedTeam}</h3>", unsafe_allow_html=True)
-            
-            with st.expander("✨ Why Join?", expanded=True):
-                st.write(team_info.get("Why Join", ""))
-            
-            with st.expander("🎯 Key Responsibilities", expanded=True):
-                for responsibility in team_info.get("Key Responsibilities", []):
-                    st.write(f"• {responsibility}")
-            
-            with st.expander("⚠️ Why Avoid?", expanded=True):
-                st.write(team_info.get("Why Avoid", ""))
+        team_info = get_team_data().get(st.session_state.selectedTeam, {})
+        content = render_team_guidelines(
+            st.session_state.selectedTeam, json.dumps(team_info, sort_keys=True)
+        )
     else:
-        with st.container():
-            st.write("<h3>🌟 Knowledge Sharing Circle</h3>", unsafe_allow_html=True)
-            
-            with st.expander("📖 About Us", expanded=True):
-                st.write(st.session_state.circle_data.get("circle_info", {}).get("about", ""))
-            
-            with st.expander("🎯 Our Mission", expanded=True):
-                for mission_item in st.session_state.circle_data.get("circle_info", {}).get("mission", []):
-                    st.write(f"• {mission_item}")
-            
-            with st.expander("🔮 Vision", expanded=True):
-                st.write(st.session_state.circle_data.get("circle_info", {}).get("vision", ""))
\ No newline at end of file
+        circle_info = get_circle_data().get("circle_info", {})
+        content = render_circle_info(json.dumps(circle_info, sort_keys=True))
+    
+    st.markdown(content, unsafe_allow_html=True)
@@ -0,0 +1,127 @@
+import streamlit as st
+from utils import validate_form_data
+from sheets_service import get_submission, update_submission, find_team_conflicts
+from client_validation import add_client_validation
+
+def _load_submission(user_email):
+    """The visitor's submission, read once per session from its indexed rows"""
+    cached = st.session_state.get("edit_submission")
+    if cached and cached["email"] == user_email:
+        return cached["submission"]
+    submission = get_submission(user_email)
+    st.session_state.edit_submission = {"email": user_email, "submission": submission}
+    return submission
+
+def _save_edit(submission, response_data, user_email):
+    if update_submission(submission["submission_id"], response_data, user_email):
+        # Read the rows again next time so the form shows what was saved
+        del st.session_state["edit_submission"]
+        st.session_state.edit_saved = True
+        st.rerun()
+    else:
+        st.error("❌ Could not update your application. Please try again or contact KSC.")
+
+def _individual_edit_form(submission, user_email):
+    data = submission["data"]
+    add_client_validation({"👤 Full Name*": "name", "🆔 CRN*": "crn", "📱 Contact*": "contact"})
+
+    with st.form("edit_individual_form"):
+        col1, col2 = st.columns([1, 1])
+
+        with col1:
+            name = st.text_input("👤 Full Name*", value=data["name"])
+            crn = st.text_input("🆔 CRN*", value=data["crn"])
+
+        with col2:
+            contact = st.text_input("📱 Contact*", value=data["contact"])
+            st.text_input("📧 Email*", value=data["email"], disabled=True)
+
+        comments = st.text_area("💬 Comments / Feedback / Suggestions (Optional)", value=data["comments"])
+
+        if st.form_submit_button("💾 Save Changes", use_container_width=True):
+            errors = validate_form_data(name, crn, contact, data["email"])
+            if not errors:
+                # The same duplicate check as a new submission, without this one's own row
+                conflicts = find_team_conflicts([{"crn": crn, "contact": contact, "email": data["email"]}],
+                                                exclude=submission)
+                errors = [conflict.split(": ", 1)[-1] for conflict in conflicts]
+            if errors:
+                for error in errors:
+                    st.error(f"⚠ {error}")
+            else:
+                _save_edit(submission, {
+                    **data,
+                    "name": name.strip(),
+                    "crn": crn,
+                    "contact": contact,
+                    "comments": comments.strip() if comments else ""
+                }, user_email)
+
+def _team_edit_form(submission, user_email):
+    data = submission["data"]
+    add_client_validation({"Full Name*": "name", "CRN*": "crn", "Contact*": "contact"})
+
+    with st.form("edit_team_form"):
+        team_name = st.text_input("🏆 Team Name*", value=data["team_name"])
+
+        members = []
+        for i, member in enumerate(data["members"]):
+            st.markdown("**👤 Team Lead**" if i == 0 else f"**👤 Member {i+1}**")
+            col1, col2 = st.columns([1, 1])
+
+            with col1:
+                name = st.text_input("Full Name*", value=member["name"], key=f"edit_name_{i}")
+                crn = st.text_input("CRN*", value=member["crn"], key=f"edit_crn_{i}")
+
+            with col2:
+                contact = st.text_input("Contact*", value=member["contact"], key=f"edit_contact_{i}")
+                st.text_input("Email*", value=member["email"], key=f"edit_email_{i}", disabled=True)
+
+            members.append({"name": name, "crn": crn, "contact": contact, "email": member["email"]})
+
+        comments = st.text_area("💬 Team Comments / Feedback / Suggestions (Optional)", value=data["comments"])
+
+        if st.form_submit_button("💾 Save Changes", use_container_width=True):
+            team_errors = [] if team_name.strip() else ["Please enter a team name"]
+            for i, member in enumerate(members):
+                member_title = "Team Lead" if i == 0 else f"Member {i+1}"
+                errors = validate_form_data(member["name"], member["crn"], member["contact"], member["email"])
+                team_errors.extend([f"{member_title}: {error}" for error in errors])
+
+            if not team_errors:
+                # The same duplicate check as a new submission, without this team's own rows
+                team_errors = find_team_conflicts(members, exclude=submission)
+
+            if team_errors:
+                st.error("⚠ Please fix the following errors:")
+                for error in team_errors:
+                    st.error(f"   • {error}")
+            else:
+                _save_edit(submission, {
+                    **data,
+                    "team_name": team_name.strip(),
+                    "members": [{**member, "name": member["name"].strip()} for member in members],
+                    "comments": comments.strip() if comments else ""
+                }, user_email)
+
+def edit_application(user_email):
+    """Let an individual or a team lead correct their saved application"""
+    if st.session_state.pop("edit_saved", False):
+        st.success("✅ Your application has been updated.")
+
+    submission = _load_submission(user_email)
+    if submission is None:
+        st.info("For further details or updates, please contact KSC.")
+        return
+
+    if submission["kind"] == "team" and submission["data"]["members"][0]["email"].lower() != user_email.lower():
+        st.info("Only your team lead can edit your team's application. For other changes, please contact KSC.")
+        return
+
+    with st.expander("✏️ Edit my application", expanded=False):
+        st.caption(f"Team: **{submission['data']['selected_team']}**. "
+                   "To change team, team size or emails, please contact KSC.")
+        if submission["kind"] == "team":
+            _team_edit_form(submission, user_email)
+        else:
+            _individual_edit_form(submission, user_email)
@@ -4,22 +4,45 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.utils import formataddr
 import logging
+import time
 from datetime import datetime
+from functools import lru_cache
+from circuit_breaker import get_breaker, get_resilience_config
+import journal
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+smtp_breaker = get_breaker("smtp")
+
+def open_smtp_connection(smtp_config):
+    """Open an authenticated SMTP connection with connect and read deadlines"""
+    config = get_resilience_config()
+    server = smtplib.SMTP(smtp_config['server'], smtp_config['port'], timeout=config["SMTP_CONNECT_TIMEOUT"])
+    try:
+        # smtplib has a single timeout; tighten or relax it once connected
+        server.sock.settimeout(config["SMTP_READ_TIMEOUT"])
+        server.starttls()
+        server.login(smtp_config['username'], smtp_config['password'])
+    except Exception:
+        server.close()
+        raise
+    return server
+
+@lru_cache(maxsize=None)
+def _read_template(template_name):
+    with open(template_name, 'r', encoding='utf-8') as f:
+        return f.read()
+
 def load_email_template(template_name="lead_mail.txt"):
-    """Load email template from file"""
+    """Load email template from file, read once per process"""
     try:
-        with open(template_name, 'r', encoding='utf-8') as f:
-            return f.read()
+        return _read_template(template_name)
     except FileNotFoundError:
-        logger.error(f"Email template file {template_name} not found")
+        logger.error("Email template file %s not found", template_name)
         return None
     except Exception as e:
-        logger.error(f"Error loading email template {template_name}: {str(e)}")
+        logger.error("Error loading email template %s: %s", template_name, e)
         return None
 
 def get_smtp_config():
@@ -35,10 +58,10 @@ def get_smtp_config():
         }
         return smtp_config
     except KeyError as e:
-        logger.error(f"Missing email configuration: {str(e)}")
+        logger.error("Missing email configuration: %s", e)
         return None
     except Exception as e:
-        logger.error(f"Error getting SMTP configuration: {str(e)}")
+        logger.error("Error getting SMTP configuration: %s", e)
         return None
 
 def create_email_content(recipient_name, team_name, submission_type, team_details=None, email_type="general"):
@@ -95,8 +118,44 @@ Team Members: {team_details['member_count']} members
     
     return content
 
-def send_confirmation_email(recipient_email, recipient_name, team_name, submission_type, team_details=None, email_type="general"):
-    """Send confirmation email to the recipient"""
+def build_confirmation_message(smtp_config, recipient_email, recipient_name, team_name, submission_type, team_details=None, email_type="general"):
+    """Build the confirmation message, or return None if the template is missing"""
+    # Create email content
+    email_content = create_email_content(
+        recipient_name, team_name, submission_type, team_details, email_type
+    )
+    if not email_content:
+        logger.error("Failed to create email content")
+        return None
+    
+    # Create message
+    msg = MIMEMultipart()
+    msg['From'] = formataddr((smtp_config['sender_name'], smtp_config['sender_email']))
+    msg['To'] = recipient_email
+    
+    # Subject line based on submission type and email type
+    if submission_type == "Team":
+        if email_type == "team_member":
+            subject = f"Team Invitation - {team_name} | Knowledge Sharing Circle"
+        else:
+            subject = f"Team Application Confirmed - {team_name} | Knowledge Sharing Circle"
+    else:
+        subject = f"Application Confirmed - {team_name} | Knowledge Sharing Circle"
+    
+    msg['Subject'] = subject
+    
+    # Attach email body
+    msg.attach(MIMEText(email_content, 'plain', 'utf-8'))
+    return msg
+
+def send_confirmation_email(recipient_email, recipient_name, team_name, submission_type, team_details=None, email_type="general", replay=False):
+    """Send confirmation email to the recipient.
+    
+    While the SMTP circuit is open the send is journaled for a later retry
+    and False is returned straight away. replay=True is used when retrying
+    a journaled send, which is not journaled again.
+    """
+    started = time.perf_counter()
     try:
         # Get SMTP configuration
         smtp_config = get_smtp_config()
@@ -104,55 +163,54 @@ def send_confirmation_email(recipient_email, recipient_name, team_name, submissi
             logger.error("Failed to get SMTP configuration")
             return False
         
-        # Create email content
-        email_content = create_email_content(
-            recipient_name, team_name, submission_type, team_details, email_type
+        msg = build_confirmation_message(
+            smtp_config, recipient_email, recipient_name, team_name, submission_type, team_details, email_type
         )
-        if not email_content:
-            logger.error("Failed to create email content")
+        if msg is None:
             return False
         
-        # Create message
-        msg = MIMEMultipart()
-        msg['From'] = formataddr((smtp_config['sender_name'], smtp_config['sender_email']))
-        msg['To'] = recipient_email
-        
-        # Subject line based on submission type and email type
-        if submission_type == "Team":
-            if email_type == "team_member":
-                subject = f"Team Invitation - {team_name} | Knowledge Sharing Circle"
-            else:
-                subject = f"Team Application Confirmed - {team_name} | Knowledge Sharing Circle"
-        else:
-            subject = f"Application Confirmed - {team_name} | Knowledge Sharing Circle"
-        
-        msg['Subject'] = subject
-        
-        # Attach email body
-        msg.attach(MIMEText(email_content, 'plain', 'utf-8'))
+        if not smtp_breaker.allow():
+            logger.warning("SMTP circuit open, not sending email to %s", recipient_email)
+            if not replay:
+                journal.append("email", {
+                    "recipient_email": recipient_email,
+                    "recipient_name": recipient_name,
+                    "team_name": team_name,
+                    "submission_type": submission_type,
+                    "team_details": team_details,
+                    "email_type": email_type
+                })
+            return False
         
         # Send email
-        with smtplib.SMTP(smtp_config['server'], smtp_config['port']) as server:
-            server.starttls()
-            server.login(smtp_config['username'], smtp_config['password'])
-            
+        with open_smtp_connection(smtp_config) as server:
             text = msg.as_string()
             server.sendmail(smtp_config['sender_email'], recipient_email, text)
         
-        logger.info(f"Confirmation email sent successfully to {recipient_email} (type: {email_type})")
+        logger.info("Confirmation email sent to %s", recipient_email, extra={
+            "event": "email.sent", "sampled": True, "email_type": email_type,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        })
+        smtp_breaker.record_success()
+        journal.schedule_flush()
         return True
         
-    except smtplib.SMTPAuthenticationError:
+    except smtplib.SMTPAuthenticationError as e:
+        smtp_breaker.record_failure(e)
         logger.error("SMTP Authentication failed - check username/password")
         return False
     except smtplib.SMTPRecipientsRefused:
-        logger.error(f"Recipient email refused: {recipient_email}")
+        # The server answered, so this says nothing about backend health
+        smtp_breaker.record_success()
+        logger.error("Recipient email refused: %s", recipient_email)
         return False
-    except smtplib.SMTPServerDisconnected:
+    except smtplib.SMTPServerDisconnected as e:
+        smtp_breaker.record_failure(e)
         logger.error("SMTP Server disconnected")
         return False
     except Exception as e:
-        logger.error(f"Error sending email to {recipient_email}: {str(e)}")
+        smtp_breaker.record_failure(e)
+        logger.error("Error sending email to %s: %s", recipient_email, e)
         return False
 
 def test_email_connection():
@@ -162,9 +220,8 @@ def test_email_connection():
         if not smtp_config:
             return False, "Failed to get SMTP configuration"
         
-        with smtplib.SMTP(smtp_config['server'], smtp_config['port']) as server:
-            server.starttls()
-            server.login(smtp_config['username'], smtp_config['password'])
+        with open_smtp_connection(smtp_config):
+            pass
         
         return True, "Email connection successful"
         
@@ -0,0 +1,287 @@
+"""In-process fakes for gspread and smtplib.
+
+Used by benchmarks.py to exercise the service code without network access.
+Only the calls made by sheets_service and email_service are implemented.
+"""
+import re
+import threading
+import gspread
+
+def column_index(letters: str) -> int:
+    """Convert column letters to a 1-based index (A -> 1, AA -> 27)"""
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + (ord(char) - ord("A") + 1)
+    return index
+
+def column_letters(index: int) -> str:
+    """Convert a 1-based column index to letters (1 -> A, 27 -> AA)"""
+    letters = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+_A1_CELL = re.compile(r"^([A-Za-z]*)(\d*)$")
+
+def parse_a1_range(a1: str):
+    """Parse an A1 range like 'C2:E' or 'A5:J9' into 1-based bounds.
+
+    Returns (first_row, first_col, last_row, last_col); open ends are None.
+    """
+    if "!" in a1:
+        a1 = a1.split("!", 1)[1]
+    start, _, end = a1.partition(":")
+    end = end or start
+
+    start_col, start_row = _A1_CELL.match(start).groups()
+    end_col, end_row = _A1_CELL.match(end).groups()
+    return (
+        int(start_row) if start_row else 1,
+        column_index(start_col) if start_col else 1,
+        int(end_row) if end_row else None,
+        column_index(end_col) if end_col else None,
+    )
+
+def grid_to_a1(grid) -> str:
+    """A1 range of a Sheets API GridRange"""
+    start = f"{column_letters(grid['startColumnIndex'] + 1)}{grid['startRowIndex'] + 1}"
+    end = f"{column_letters(grid['endColumnIndex'])}{grid['endRowIndex']}"
+    return f"{start}:{end}"
+
+class FakeCell:
+    def __init__(self, value):
+        self.value = value
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet, title, rows=None):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.rows = [list(row) for row in rows or []]
+        self.merges = []
+        self._lock = threading.Lock()
+
+    @property
+    def id(self):
+        return self.spreadsheet.worksheets().index(self)
+
+    @property
+    def row_count(self):
+        return max(1000, len(self.rows))
+
+    def _slice(self, first_row, first_col, last_row, last_col):
+        last_row = last_row or len(self.rows)
+        result = []
+        for row in self.rows[first_row - 1:last_row]:
+            values = row[first_col - 1:last_col] if last_col else row[first_col - 1:]
+            while values and values[-1] == "":
+                values = values[:-1]
+            result.append(values)
+        while result and not result[-1]:
+            result.pop()
+        return result
+
+    def row_values(self, row):
+        with self._lock:
+            values = list(self.rows[row - 1]) if row <= len(self.rows) else []
+        # Like the API, trailing empty cells are left out
+        while values and values[-1] == "":
+            values.pop()
+        return values
+
+    def col_values(self, col):
+        with self._lock:
+            values = [row[col - 1] if col <= len(row) else "" for row in self.rows]
+        while values and values[-1] == "":
+            values.pop()
+        return values
+
+    def get_all_values(self):
+        with self._lock:
+            return [list(row) for row in self.rows]
+
+    def get(self, a1_range):
+        with self._lock:
+            # gspread returns [[]], not [], for a range with no values
+            return self._slice(*parse_a1_range(a1_range)) or [[]]
+
+    def batch_get(self, ranges):
+        return [self.get(a1_range) for a1_range in ranges]
+
+    def acell(self, label):
+        values = self.get(label)
+        return FakeCell(values[0][0] if values and values[0] else "")
+
+    def clear(self):
+        with self._lock:
+            self.rows = []
+            self.merges = []
+
+    def append_rows(self, rows, value_input_option=None):
+        with self._lock:
+            start = len(self.rows) + 1
+            self.rows.extend([str(value) for value in row] for row in rows)
+            end = len(self.rows)
+        width = max(len(row) for row in rows)
+        return {"updates": {"updatedRange": f"'{self.title}'!A{start}:{column_letters(width)}{end}"}}
+
+    def append_row(self, row, value_input_option=None):
+        return self.append_rows([row], value_input_option)
+
+    def update(self, a1_range, values=None, **kwargs):
+        first_row, first_col, _, _ = parse_a1_range(a1_range)
+        with self._lock:
+            for offset, row in enumerate(values or []):
+                index = first_row - 1 + offset
+                while len(self.rows) <= index:
+                    self.rows.append([])
+                target = self.rows[index]
+                while len(target) < first_col - 1 + len(row):
+                    target.append("")
+                target[first_col - 1:first_col - 1 + len(row)] = [str(value) for value in row]
+
+    def batch_update(self, data, **kwargs):
+        for item in data:
+            self.update(item["range"], item["values"])
+
+    def merge_cells(self, name, merge_type="MERGE_ALL"):
+        """Like Sheets, only the top-left value of a merged range is kept"""
+        first_row, first_col, last_row, last_col = parse_a1_range(name)
+        if merge_type == "MERGE_COLUMNS":
+            for col in range(first_col, last_col + 1):
+                letter = column_letters(col)
+                self.merge_cells(f"{letter}{first_row}:{letter}{last_row}")
+            return
+        with self._lock:
+            self.merges.append(name)
+            for index, row in enumerate(self.rows[first_row - 1:last_row], start=first_row):
+                for col in range(first_col, min(last_col, len(row)) + 1):
+                    if (index, col) != (first_row, first_col):
+                        row[col - 1] = ""
+
+    def unmerge_cells(self, name):
+        """Forget merges inside the range; values merged away stay blank"""
+        first_row, first_col, last_row, last_col = parse_a1_range(name)
+        with self._lock:
+            self.merges = [
+                merge for merge in self.merges
+                if not (first_row <= parse_a1_range(merge)[0] <= last_row
+                        and first_col <= parse_a1_range(merge)[1] <= last_col)
+            ]
+
+    def update_title(self, title):
+        self.title = title
+
+class FakeSpreadsheet:
+    def __init__(self, key, titles=("Sheet1",)):
+        self.id = key
+        self._worksheets = [FakeWorksheet(self, title) for title in titles]
+        self.batch_updates = []
+
+    def get_worksheet(self, index):
+        return self._worksheets[index]
+
+    def worksheet(self, title):
+        for worksheet in self._worksheets:
+            if worksheet.title == title:
+                return worksheet
+        raise gspread.WorksheetNotFound(title)
+
+    def get_worksheet_by_id(self, worksheet_id):
+        for worksheet in self._worksheets:
+            if worksheet.id == worksheet_id:
+                return worksheet
+        raise gspread.WorksheetNotFound(worksheet_id)
+
+    def worksheets(self):
+        return list(self._worksheets)
+
+    def add_worksheet(self, title, rows=1000, cols=26):
+        worksheet = FakeWorksheet(self, title)
+        self._worksheets.append(worksheet)
+        return worksheet
+
+    def batch_update(self, body):
+        """Records every request and applies merges and unmerges like Sheets does"""
+        self.batch_updates.append(body)
+        for request in body.get("requests", []):
+            if "mergeCells" in request:
+                grid = request["mergeCells"]["range"]
+                self._worksheets[grid.get("sheetId", 0)].merge_cells(
+                    grid_to_a1(grid), request["mergeCells"].get("mergeType", "MERGE_ALL")
+                )
+            elif "unmergeCells" in request:
+                grid = request["unmergeCells"]["range"]
+                self._worksheets[grid.get("sheetId", 0)].unmerge_cells(grid_to_a1(grid))
+        return {"replies": []}
+
+class FakeClient:
+    """Stands in for an authorized gspread.Client"""
+
+    def __init__(self):
+        self.spreadsheets = {}
+        self._lock = threading.Lock()
+
+    def open_by_key(self, key):
+        with self._lock:
+            if key not in self.spreadsheets:
+                self.spreadsheets[key] = FakeSpreadsheet(key)
+            return self.spreadsheets[key]
+
+    def set_timeout(self, timeout=None):
+        pass
+
+class _FakeSocket:
+    def settimeout(self, timeout):
+        pass
+
+class FakeSMTP:
+    """Stands in for smtplib.SMTP and records sent messages"""
+
+    sent = []
+
+    def __init__(self, host="", port=0, timeout=None):
+        self.host = host
+        self.port = port
+        self.sock = _FakeSocket()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.quit()
+        return False
+
+    def ehlo(self):
+        return 250, b"ok"
+
+    def starttls(self):
+        return 220, b"ready"
+
+    def login(self, username, password):
+        return 235, b"accepted"
+
+    def noop(self):
+        return 250, b"ok"
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        FakeSMTP.sent.append((from_addr, to_addrs, len(msg)))
+        return {}
+
+    def send_message(self, msg, from_addr=None, to_addrs=None):
+        return self.sendmail(from_addr, to_addrs, msg.as_string())
+
+    def quit(self):
+        return 221, b"bye"
+
+    def close(self):
+        pass
+
+FAKE_SMTP_CONFIG = {
+    "server": "smtp.invalid",
+    "port": 587,
+    "username": "bench",
+    "password": "bench",
+    "sender_name": "Knowledge Sharing Circle",
+    "sender_email": "ksc@example.com",
+}
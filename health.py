@@ -0,0 +1,169 @@
+import json
+import logging
+import os
+import smtplib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Any
+
+import requests
+
+from circuit_breaker import get_breaker_states, get_resilience_config
+from warmup import is_ready, get_warmup_status
+
+logger = logging.getLogger(__name__)
+
+# Seconds between probes of each backend
+PROBE_INTERVAL = 60
+
+GOOGLE_DISCOVERY_URL = "https://accounts.google.com/.well-known/openid-configuration"
+
+# Port of the HTTP health endpoint served next to the app
+HEALTH_PORT = int(os.environ.get("KSC_HEALTH_PORT", 8502))
+
+_lock = threading.Lock()
+_status: Dict[str, Dict[str, Any]] = {}
+_prober_started = False
+_server_started = False
+
+def _probe_sheets():
+    """One metadata read of the individual sheet"""
+    from sheets_service import sheets_service, INDIVIDUAL_SHEET_ID
+
+    if not sheets_service.pool:
+        raise RuntimeError("Google Sheets client not initialized")
+    with sheets_service.pool.acquire() as client:
+        client.open_by_key(INDIVIDUAL_SHEET_ID)
+
+def _probe_smtp():
+    """Connect and EHLO only, no login or mail"""
+    from email_service import get_smtp_config
+
+    smtp_config = get_smtp_config()
+    if not smtp_config:
+        raise RuntimeError("Failed to get SMTP configuration")
+    config = get_resilience_config()
+    with smtplib.SMTP(smtp_config['server'], smtp_config['port'], timeout=config["SMTP_CONNECT_TIMEOUT"]) as server:
+        code, _ = server.ehlo()
+        if code != 250:
+            raise RuntimeError(f"EHLO returned {code}")
+
+def _probe_oauth():
+    """Fetch Google's OpenID discovery document, which the login flow depends on"""
+    response = requests.get(GOOGLE_DISCOVERY_URL, timeout=5)
+    response.raise_for_status()
+
+PROBES: Dict[str, Callable[[], None]] = {
+    "sheets": _probe_sheets,
+    "smtp": _probe_smtp,
+    "google_oauth": _probe_oauth,
+}
+
+def run_probe(name: str):
+    """Probe one backend and record the outcome"""
+    started = time.perf_counter()
+    try:
+        PROBES[name]()
+        ok, error = True, ""
+    except Exception as e:
+        ok, error = False, str(e)
+        logger.warning("Health probe '%s' failed: %s", name, error)
+    latency_ms = (time.perf_counter() - started) * 1000
+
+    with _lock:
+        previous = _status.get(name, {})
+        _status[name] = {
+            "ok": ok,
+            "latency_ms": round(latency_ms, 1),
+            "checked_at": time.time(),
+            "last_error": error or previous.get("last_error", ""),
+            "last_error_at": time.time() if error else previous.get("last_error_at"),
+        }
+
+def _prober_loop():
+    while True:
+        for name in PROBES:
+            run_probe(name)
+        time.sleep(PROBE_INTERVAL)
+
+def start_prober():
+    """Start the background prober once per process"""
+    global _prober_started
+    with _lock:
+        if _prober_started:
+            return
+        _prober_started = True
+    threading.Thread(target=_prober_loop, name="health-prober", daemon=True).start()
+
+def get_health_status() -> Dict[str, Any]:
+    """Cached status of every backend; never calls a backend itself"""
+    with _lock:
+        backends = {name: dict(status) for name, status in _status.items()}
+    for name in PROBES:
+        backends.setdefault(name, {"ok": None, "latency_ms": None, "checked_at": None,
+                                   "last_error": "", "last_error_at": None})
+    return {
+        "healthy": is_ready() and all(status["ok"] for status in backends.values()),
+        "ready": is_ready(),
+        "warmup": get_warmup_status(),
+        "backends": backends,
+        "breakers": get_breaker_states(),
+    }
+
+def get_public_status() -> Dict[str, Any]:
+    """get_health_status without error messages, for unauthenticated probes"""
+    status = get_health_status()
+    return {
+        "healthy": status["healthy"],
+        "ready": status["ready"],
+        "backends": {name: {"ok": backend["ok"], "latency_ms": backend["latency_ms"],
+                            "checked_at": backend["checked_at"]}
+                     for name, backend in status["backends"].items()},
+        "breakers": {name: breaker["state"] for name, breaker in status["breakers"].items()},
+    }
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    """GET /health: 200 when healthy, 503 otherwise. GET /ready: 200 once warmed up"""
+
+    def do_GET(self):
+        if self.path == "/health":
+            status = get_public_status()
+            self._send(200 if status["healthy"] else 503, status)
+        elif self.path == "/ready":
+            self._send(200 if is_ready() else 503, {"ready": is_ready()})
+        else:
+            self._send(404, {"error": "not found"})
+
+    def _send(self, code: int, body: Dict[str, Any]):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # Probes arrive every few seconds; keep them out of the app log
+        pass
+
+def start_health_server(port: int = HEALTH_PORT):
+    """Serve /health and /ready over plain HTTP once per process.
+
+    Called by launch.py before the server starts, and by app.py so that
+    `streamlit run app.py` serves them too, from its first session on.
+    """
+    global _server_started
+    with _lock:
+        if _server_started:
+            return
+        _server_started = True
+    try:
+        server = ThreadingHTTPServer(("0.0.0.0", port), _HealthHandler)
+    except OSError as e:
+        # Another replica on this host may already hold the port
+        logger.error("Health endpoint not started on port %s: %s", port, e)
+        return
+    threading.Thread(target=server.serve_forever, name="health-server", daemon=True).start()
+    logger.info("Health endpoint listening on port %s", port)
@@ -1,10 +1,15 @@
 import streamlit as st
 from utils import validate_form_data
-from email_service import send_confirmation_email
-from sheets_service import save_individual_response
+from sheets_service import check_email_exists
+from async_services import run, submit_individual
+from capacity import seats_error
+from client_validation import add_client_validation
 from datetime import datetime
 
 def individual_form(user_email):
+    # Format errors show while typing; validate_form_data still checks on submit
+    add_client_validation({"👤 Full Name*": "name", "🆔 CRN*": "crn", "📱 Contact*": "contact"})
+
     with st.form("individual_form"):
         st.markdown("### 👤 Individual Registration")
 
@@ -32,6 +37,13 @@ def individual_form(user_email):
                 return
 
             errors = validate_form_data(name, crn, contact, user_email)
+            seats_message = seats_error(st.session_state.selectedTeam, 1)
+            if seats_message:
+                errors.append(seats_message)
+            # Submitting reruns only this form, so look again in case a team
+            # registered this email since the page was loaded
+            if not errors and check_email_exists(user_email):
+                errors.append("This email is already registered")
 
             if errors:
                 for error in errors:
@@ -48,24 +60,12 @@ def individual_form(user_email):
                     "comments": comments.strip() if comments else ""
                 }
 
-                sheets_success = save_individual_response(response_data)
+                result = run(submit_individual(response_data))
 
-                if sheets_success:
-                    try:
-                        email_sent = send_confirmation_email(
-                            recipient_email=user_email.lower(),
-                            recipient_name=name.strip(),
-                            team_name=st.session_state.selectedTeam,
-                            submission_type="Individual"
-                        )
-                        st.session_state.form_submitted = True
-                        st.session_state.submission_type = "individual"
-                        st.session_state.email_sent = email_sent
-                        st.rerun()
-                    except Exception as e:
-                        st.session_state.form_submitted = True
-                        st.session_state.submission_type = "individual"
-                        st.session_state.email_sent = False
-                        st.rerun()
+                if result.saved:
+                    st.session_state.form_submitted = True
+                    st.session_state.submission_type = "individual"
+                    st.session_state.email_sent = result.successful_emails == 1
+                    st.rerun()
                 else:
                     st.error("❌ Failed to save application. Please try again.")
\ No newline at end of file
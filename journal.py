@@ -0,0 +1,81 @@
+import logging
+import threading
+from typing import List, Dict, Any
+
+import coordination
+
+logger = logging.getLogger(__name__)
+
+# Retry interval for the leader's periodic flush
+FLUSH_INTERVAL_SECONDS = 30
+
+_flush_lock = threading.Lock()
+
+def append(kind: str, payload: Dict[str, Any]) -> bool:
+    """Record work for a later retry; kind is 'individual', 'team' or 'email'.
+
+    Entries live in the shared work queue, so any replica can flush them.
+    """
+    try:
+        job_id = coordination.enqueue(kind, payload)
+        logger.warning("Journaled %s entry %s for later retry", kind, job_id)
+        return True
+    except Exception as e:
+        logger.error("Could not write to journal: %s", e)
+        return False
+
+def pending() -> List[Dict[str, Any]]:
+    """Return all journaled entries, oldest first"""
+    try:
+        return coordination.pending_jobs()
+    except Exception as e:
+        logger.error("Could not read journal: %s", e)
+        return []
+
+def _replay(entry) -> bool:
+    # Imported here, both services journal through this module
+    from sheets_service import save_individual_response, save_team_response
+    from email_service import send_confirmation_email
+
+    if entry["kind"] == "individual":
+        return save_individual_response(entry["payload"], replay=True)
+    if entry["kind"] == "team":
+        return save_team_response(entry["payload"], replay=True)
+    if entry["kind"] == "email":
+        return send_confirmation_email(**entry["payload"], replay=True)
+    logger.error("Unknown journal entry kind: %s", entry['kind'])
+    return False
+
+def flush() -> int:
+    """Retry claimed entries in order; stop at the first failure. Returns entries done."""
+    if not _flush_lock.acquire(blocking=False):
+        return 0
+    try:
+        done = 0
+        entries = coordination.claim_jobs()
+        for i, entry in enumerate(entries):
+            if not _replay(entry):
+                for remaining in entries[i:]:
+                    coordination.release_job(remaining["id"])
+                break
+            coordination.complete_job(entry["id"])
+            done += 1
+        if done:
+            logger.info("Flushed %s journaled entries", done)
+        return done
+    finally:
+        _flush_lock.release()
+
+def schedule_flush():
+    """Flush in the background if there is anything journaled"""
+    if _flush_lock.locked():
+        return
+    try:
+        if not coordination.pending_job_count():
+            return
+    except Exception as e:
+        logger.error("Could not read journal: %s", e)
+        return
+    threading.Thread(target=flush, name="journal-flush", daemon=True).start()
+
+coordination.register_leader_task("journal_flush", FLUSH_INTERVAL_SECONDS, flush)
@@ -0,0 +1,31 @@
+"""Start the app with caches and connections warm before the first visitor.
+
+    python launch.py                        # same as streamlit run app.py
+    python launch.py --server.port 8080     # any streamlit run option
+
+The warm-up runs in this process before the Streamlit server starts, and
+the server then runs app.py in the same process, so every session finds
+the authorized clients, filled email indexes and open connections.
+
+Backend health is served as JSON on its own port (KSC_HEALTH_PORT, 8502):
+/ready answers 503 until the warm-up is done, /health 503 while a
+backend probe fails.
+"""
+import os
+import sys
+
+from streamlit.web import cli as stcli
+
+from health import start_health_server, start_prober
+from logging_config import configure_logging
+from warmup import run_warmup
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+if __name__ == "__main__":
+    configure_logging()
+    start_health_server()
+    run_warmup()
+    start_prober()
+    sys.argv = ["streamlit", "run", APP_PATH, *sys.argv[1:]]
+    sys.exit(stcli.main())
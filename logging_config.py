@@ -0,0 +1,110 @@
+"""Process-wide logging: JSON lines written by a background listener thread.
+
+Request threads only put records on a queue; formatting, PII masking and
+I/O happen on the listener. Call configure_logging() once at startup,
+modules just use logging.getLogger(__name__).
+
+Records accept these extras:
+    event        stable event name, e.g. "sheets.save_individual"
+    duration_ms  timing of the operation being logged
+    sampled      True for high-volume INFO events, kept at LOG_SAMPLE_RATE
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_LEVEL = os.environ.get("KSC_LOG_LEVEL", "INFO").upper()
+# Fraction of sampled INFO events that are kept
+LOG_SAMPLE_RATE = float(os.environ.get("KSC_LOG_SAMPLE_RATE", "0.1"))
+# Records dropped instead of blocking when the listener falls this far behind
+LOG_QUEUE_SIZE = 10000
+
+_EXTRA_FIELDS = ("event", "duration_ms", "kind", "email_type", "rows", "count", "partition")
+
+_EMAIL_RE = re.compile(r"([A-Za-z0-9])[A-Za-z0-9._%+-]*@([A-Za-z0-9.-]+\.[A-Za-z]{2,})")
+# Contact numbers and CRNs
+_DIGITS_RE = re.compile(r"\b\d{7,}\b")
+
+_lock = threading.Lock()
+_listener = None
+
+def mask_pii(text: str) -> str:
+    """Mask email addresses and long digit runs in a log message"""
+    text = _EMAIL_RE.sub(r"\1***@\2", text)
+    return _DIGITS_RE.sub("***", text)
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with PII masked in the message"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": mask_pii(record.getMessage()),
+        }
+        for name in _EXTRA_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value
+        if getattr(record, "sampled", False):
+            entry["sample_rate"] = LOG_SAMPLE_RATE
+        if record.exc_info:
+            entry["exc"] = mask_pii(self.formatException(record.exc_info))
+        return json.dumps(entry, default=str)
+
+class SamplingFilter(logging.Filter):
+    """Keep a fraction of INFO records marked sampled=True; never drop warnings"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "sampled", False) and record.levelno <= logging.INFO:
+            return random.random() < LOG_SAMPLE_RATE
+        return True
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """Enqueue the record as is; the listener thread formats it.
+
+    The stock prepare() formats the message on the calling thread so the
+    record can be pickled, which an in-process queue does not need.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+def configure_logging(level: str = LOG_LEVEL, stream=None):
+    """Route all logging through the queue listener; later calls are no-ops"""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            return
+
+        output = logging.StreamHandler(stream or sys.stderr)
+        output.setFormatter(JsonFormatter())
+
+        log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        handler = _NonBlockingQueueHandler(log_queue)
+        handler.addFilter(SamplingFilter())
+
+        root = logging.getLogger()
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(handler)
+        root.setLevel(level)
+
+        _listener = QueueListener(log_queue, output, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
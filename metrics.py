@@ -0,0 +1,22 @@
+import threading
+from collections import Counter
+from typing import Dict
+
+# Process-wide counters shared by all sessions
+_lock = threading.Lock()
+_counters = Counter()
+
+def increment(name: str, amount: int = 1):
+    """Increment a named counter"""
+    with _lock:
+        _counters[name] += amount
+
+def get_counters() -> Dict[str, int]:
+    """Return a snapshot of all counters"""
+    with _lock:
+        return dict(_counters)
+
+def reset_counters():
+    """Reset all counters"""
+    with _lock:
+        _counters.clear()
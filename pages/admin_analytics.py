@@ -0,0 +1,87 @@
+import streamlit as st
+from datetime import datetime
+from admin import is_admin
+from analytics import (
+    get_analytics, request_rebuild,
+    TEAM_REGISTRANTS, TYPE_REGISTRANTS, TYPE_SUBMISSIONS, TEAM_SIZES, DAILY_REGISTRANTS,
+)
+from auth_service import get_user_info
+from coordination import start_worker
+from logging_config import configure_logging
+
+configure_logging()
+
+def main():
+    st.set_page_config(page_title="Registration Analytics", page_icon="📊", layout="wide")
+
+    # The counters are rebuilt by the leader, even if this page is opened first
+    start_worker()
+
+    # Login happens on the registration page, this page only checks it
+    if not st.session_state.get("credentials"):
+        st.info("Log in on the registration page first.")
+        st.stop()
+    user_info = get_user_info()
+    if not user_info or not is_admin(user_info["email"]):
+        st.error("⛔ This page is only available to organizers.")
+        st.stop()
+
+    st.title("📊 Registration Analytics")
+
+    try:
+        analytics = get_analytics()
+    except Exception as e:
+        st.error(f"⚠️ Registration counts are unavailable: {str(e)}")
+        st.stop()
+
+    registrants = analytics[TYPE_REGISTRANTS]
+    submissions = analytics[TYPE_SUBMISSIONS]
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Registrants", sum(registrants.values()))
+    col2.metric("Individual applications", submissions.get("Individual", 0))
+    col3.metric("Team applications", submissions.get("Team", 0))
+    col4.metric("People in teams", registrants.get("Team", 0))
+
+    st.subheader("Registrations by team")
+    by_team = dict(sorted(analytics[TEAM_REGISTRANTS].items(), key=lambda item: item[1], reverse=True))
+    if by_team:
+        st.bar_chart({"Registrants": by_team}, horizontal=True)
+    else:
+        st.caption("No registrations yet.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Individual vs team")
+        st.bar_chart({
+            "Registrants": {kind: registrants.get(kind, 0) for kind in ("Individual", "Team")},
+            "Applications": {kind: submissions.get(kind, 0) for kind in ("Individual", "Team")},
+        }, stack=False)
+    with col2:
+        st.subheader("Team sizes")
+        sizes = analytics[TEAM_SIZES]
+        st.bar_chart({"Teams": {f"{size} members": sizes[size] for size in sorted(sizes, key=int)}})
+
+    st.subheader("Signups over time")
+    daily = dict(sorted(analytics[DAILY_REGISTRANTS].items()))
+    cumulative, total = {}, 0
+    for day, count in daily.items():
+        total += count
+        cumulative[day] = total
+    tab1, tab2 = st.tabs(["Per day", "Cumulative"])
+    with tab1:
+        st.bar_chart({"Registrants": daily})
+    with tab2:
+        st.line_chart({"Registrants": cumulative})
+
+    synced_at = analytics["synced_at"]
+    if synced_at:
+        st.caption(f"Counted as submissions are saved; last full recount from the sheets at "
+                   f"{datetime.fromtimestamp(synced_at).strftime('%Y-%m-%d %H:%M:%S')}.")
+    else:
+        st.caption("Counted as submissions are saved; a full recount from the sheets is pending.")
+    if st.button("🔄 Recount from the sheets"):
+        request_rebuild()
+        st.success("Recount requested, it runs in the background within a minute.")
+
+if __name__ == "__main__":
+    main()
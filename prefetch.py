@@ -0,0 +1,44 @@
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+import streamlit as st
+
+from sheets_service import check_email_exists
+
+logger = logging.getLogger(__name__)
+
+# Shared by all sessions; each task is one duplicate-email lookup
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="prefetch")
+
+# Seconds a session reuses its check before looking again; an open tab
+# may be added to someone else's team in the meantime
+EMAIL_CHECK_TTL = 60
+
+def start_email_check(email: str) -> Future:
+    """Start the duplicate-email check in the background, once per session and email.
+
+    Safe to call as soon as the email is known; later calls within
+    EMAIL_CHECK_TTL return the same future, so the check is not repeated
+    on every rerun.
+    """
+    email = email.strip().lower()
+    prefetch = st.session_state.get("email_check")
+    if prefetch and prefetch["email"] == email and time.monotonic() - prefetch["started"] < EMAIL_CHECK_TTL:
+        return prefetch["future"]
+
+    future = _executor.submit(check_email_exists, email)
+    st.session_state.email_check = {"email": email, "future": future, "started": time.monotonic()}
+    return future
+
+def email_already_registered(email: str) -> bool:
+    """Wait for the prefetched duplicate-email check and return its result"""
+    future = start_email_check(email)
+    if not future.done():
+        with st.spinner("Checking your registration..."):
+            wait([future])
+    try:
+        return future.result()
+    except Exception as e:
+        logger.error("Prefetched email check failed: %s", e)
+        return False
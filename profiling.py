@@ -0,0 +1,149 @@
+import cProfile
+import contextvars
+import json
+import logging
+import os
+import time
+import uuid
+from contextlib import contextmanager
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# Profiling is opt-in: KSC_PROFILE=1 for every session, or ?profile=<token>
+# matching [admin] PROFILE_TOKEN in secrets for a single session.
+PROFILE_ENV_VAR = "KSC_PROFILE"
+PROFILE_DIR = os.environ.get("KSC_PROFILE_DIR", "profiles")
+# Number of most recent reruns kept on disk
+PROFILE_KEEP = int(os.environ.get("KSC_PROFILE_KEEP", "200"))
+
+_current = contextvars.ContextVar("current_rerun_profile", default=None)
+
+class RerunProfile:
+    """Named spans and a cProfile capture for one script rerun"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.wall_time = time.time()
+        self.events = []  # (type, span name, seconds since start)
+        self.profiler = cProfile.Profile()
+
+    def open(self, name):
+        self.events.append(("O", name, time.perf_counter() - self.started))
+
+    def close(self, name):
+        self.events.append(("C", name, time.perf_counter() - self.started))
+
+    def collapsed_stacks(self):
+        """Self time per span stack in microseconds, in collapsed-stack format"""
+        weights = {}
+        stack = []
+        last = 0.0
+        for kind, name, at in self.events:
+            if stack:
+                key = ";".join(stack)
+                weights[key] = weights.get(key, 0) + (at - last)
+            if kind == "O":
+                stack.append(name)
+            else:
+                stack.pop()
+            last = at
+        return "\n".join(f"{key} {int(seconds * 1e6)}" for key, seconds in weights.items()) + "\n"
+
+    def speedscope(self, name):
+        """Evented speedscope profile of the named spans"""
+        frames = []
+        index = {}
+        events = []
+        for kind, span_name, at in self.events:
+            if span_name not in index:
+                index[span_name] = len(frames)
+                frames.append({"name": span_name})
+            events.append({"type": kind, "frame": index[span_name], "at": at * 1000})
+        end = self.events[-1][2] * 1000 if self.events else 0
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "evented",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": end,
+                "events": events,
+            }],
+            "name": name,
+            "exporter": "ksc-forms",
+        }
+
+def is_enabled():
+    """Return True if this rerun should be profiled"""
+    if os.environ.get(PROFILE_ENV_VAR) == "1":
+        return True
+
+    # Remember the query param for the session, login clears query params
+    token = st.query_params.get("profile")
+    if token:
+        try:
+            expected = st.secrets.get("admin", {}).get("PROFILE_TOKEN")
+        except Exception:
+            expected = None
+        st.session_state.profiling = bool(expected) and token == expected
+    return st.session_state.get("profiling", False)
+
+@contextmanager
+def span(name):
+    """Mark a named section of the current rerun; no-op when not profiling"""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    profile.open(name)
+    try:
+        yield
+    finally:
+        profile.close(name)
+
+def _write(profile):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(profile.wall_time))
+    base = os.path.join(PROFILE_DIR, f"rerun-{stamp}-{uuid.uuid4().hex[:8]}")
+
+    with open(f"{base}.speedscope.json", "w") as f:
+        json.dump(profile.speedscope(os.path.basename(base)), f)
+    with open(f"{base}.collapsed.txt", "w") as f:
+        f.write(profile.collapsed_stacks())
+    profile.profiler.dump_stats(f"{base}.prof")
+
+    # Rotate: keep the newest PROFILE_KEEP reruns
+    reruns = sorted({name.split(".", 1)[0] for name in os.listdir(PROFILE_DIR) if name.startswith("rerun-")})
+    for stale in reruns[:-PROFILE_KEEP]:
+        for suffix in (".speedscope.json", ".collapsed.txt", ".prof"):
+            try:
+                os.remove(os.path.join(PROFILE_DIR, stale + suffix))
+            except FileNotFoundError:
+                pass
+
+@contextmanager
+def profile_rerun():
+    """Profile one rerun of the app and write it to PROFILE_DIR"""
+    if not is_enabled():
+        yield
+        return
+
+    profile = RerunProfile()
+    token = _current.set(profile)
+    profile.open("rerun")
+    profile.profiler.enable()
+    try:
+        yield
+    finally:
+        # Also reached when st.rerun()/st.stop() end the script early
+        profile.profiler.disable()
+        profile.close("rerun")
+        _current.reset(token)
+        try:
+            _write(profile)
+        except Exception as e:
+            logger.error("Could not write rerun profile: %s", e)
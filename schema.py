@@ -0,0 +1,148 @@
+"""Submission records and the column layout of the response sheets.
+
+Each layout maps submission fields to sheet columns once at import time;
+headers, row encoding and column lookups in sheets_service all come from it.
+"""
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple
+
+@dataclass(frozen=True, slots=True)
+class Column:
+    header: str
+    field: str
+    index: int  # 1-based
+    letter: str
+
+def _letter(index: int) -> str:
+    letters = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+class SheetLayout:
+    """Ordered columns of one response sheet"""
+
+    __slots__ = ("columns", "headers", "width", "_by_field")
+
+    def __init__(self, spec: List[Tuple[str, str]]):
+        self.columns = tuple(
+            Column(header, name, i, _letter(i)) for i, (header, name) in enumerate(spec, start=1)
+        )
+        self.headers = [column.header for column in self.columns]
+        self.width = len(self.columns)
+        self._by_field = {column.field: column for column in self.columns}
+
+    def column(self, name: str) -> Column:
+        return self._by_field[name]
+
+    def indexes(self, *names: str) -> List[int]:
+        """1-based column indexes of the given fields"""
+        return [self._by_field[name].index for name in names]
+
+    def span(self, first: str, last: str, start_row: int = 2) -> str:
+        """Open-ended A1 range covering the columns from first to last field"""
+        return f"{self._by_field[first].letter}{start_row}:{self._by_field[last].letter}"
+
+    def rows(self, start_row: int, end_row: int) -> str:
+        """A1 range covering every column of rows start_row..end_row"""
+        return f"A{start_row}:{self.columns[-1].letter}{end_row}"
+
+    def fields(self, first: int = 1, last: int = None) -> List[str]:
+        """Field names of the columns first..last (1-based, inclusive)"""
+        return [column.field for column in self.columns[first - 1:last]]
+
+INDIVIDUAL_LAYOUT = SheetLayout([
+    ("Timestamp", "timestamp"),
+    ("Name", "name"),
+    ("CRN", "crn"),
+    ("Contact", "contact"),
+    ("Email", "email"),
+    ("Selected Team", "selected_team"),
+    ("Feedback", "comments"),
+])
+
+_TEAM_COLUMNS = [
+    ("Timestamp", "timestamp"),
+    ("Team Name", "team_name"),
+    ("Selected Team", "selected_team"),
+    ("Member Count", "member_count"),
+    ("Comments", "comments"),
+    ("Member Name", "name"),
+    ("CRN", "crn"),
+    ("Contact", "contact"),
+    ("Email", "email"),
+    ("Team Lead", "team_lead"),
+]
+
+TEAM_LAYOUT = SheetLayout(_TEAM_COLUMNS)
+
+# Merge-free team layout: every member row repeats the team columns and carries
+# the team's ID, added last so all other columns keep their place
+FLAT_TEAM_LAYOUT = SheetLayout(_TEAM_COLUMNS + [("Team ID", "team_id")])
+
+# Team columns shared by every member row (merged A-E), then per-member columns
+TEAM_SHARED_COLUMNS = 5
+
+@dataclass(slots=True)
+class Member:
+    name: str
+    crn: str
+    contact: str
+    email: str
+
+@dataclass(slots=True)
+class IndividualSubmission:
+    timestamp: str
+    name: str
+    crn: str
+    contact: str
+    email: str
+    selected_team: str
+    comments: str = ""
+
+    _encode = attrgetter(*INDIVIDUAL_LAYOUT.fields())
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndividualSubmission":
+        return cls(data["timestamp"], data["name"], data["crn"], data["contact"],
+                   data["email"], data["selected_team"], data.get("comments", ""))
+
+    def to_row(self) -> List[str]:
+        return list(IndividualSubmission._encode(self))
+
+@dataclass(slots=True)
+class TeamSubmission:
+    timestamp: str
+    team_name: str
+    selected_team: str
+    comments: str
+    members: List[Member] = field(default_factory=list)
+
+    _encode_member = attrgetter(*TEAM_LAYOUT.fields(TEAM_SHARED_COLUMNS + 1, TEAM_LAYOUT.width - 1))
+
+    @property
+    def member_count(self) -> int:
+        return len(self.members)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TeamSubmission":
+        members = [Member(m["name"], m["crn"], m["contact"], m["email"]) for m in data["members"]]
+        return cls(data["timestamp"], data["team_name"], data["selected_team"],
+                   data.get("comments", ""), members)
+
+    def shared_values(self) -> List[str]:
+        return [self.timestamp, self.team_name, self.selected_team, str(self.member_count), self.comments]
+
+    def to_rows(self, team_id: Optional[str] = None) -> List[List[str]]:
+        """One row per member; the first member is the team lead.
+
+        With a team_id the rows are in FLAT_TEAM_LAYOUT, ending in the ID.
+        """
+        shared = self.shared_values()
+        suffix = [team_id] if team_id else []
+        return [
+            shared + list(TeamSubmission._encode_member(member)) + ["Yes" if i == 0 else "No"] + suffix
+            for i, member in enumerate(self.members)
+        ]
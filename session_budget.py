@@ -0,0 +1,184 @@
+"""Per-session memory footprint and the compaction that keeps it small.
+
+Every open browser tab holds a Streamlit session for as long as the server
+runs, so whatever a session keeps in st.session_state is multiplied by the
+number of visitors. Two compactions keep that bounded:
+
+- after a successful submission only the flags the confirmation page
+  needs are kept; login credentials, form widgets and background work
+  are dropped
+- a session idle for IDLE_SECONDS loses everything that is rebuilt on
+  demand, without touching what the visitor has typed
+
+The sweeper also logs sessions over SESSION_BUDGET_BYTES with a per-key
+breakdown, so new state that grows a session shows up in the logs.
+"""
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, Iterable, Mapping, MutableMapping
+
+logger = logging.getLogger(__name__)
+
+SESSION_BUDGET_BYTES = int(os.environ.get("KSC_SESSION_BUDGET_BYTES", 32 * 1024))
+IDLE_SECONDS = 15 * 60
+SWEEP_SECONDS = 60
+# Sessions untouched for this long are assumed closed and no longer tracked
+FORGET_SECONDS = 6 * 60 * 60
+
+# All a session needs once its submission is saved
+SUBMISSION_KEYS = (
+    "form_submitted", "submission_type", "email_sent", "team_name",
+    "member_count", "successful_emails", "special_message", "credentials",
+)
+
+# Rebuilt on demand, so safe to drop from an idle session
+REBUILDABLE_KEYS = ("email_check", "token_refresher", "edit_submission")
+
+def deep_sizeof(obj, seen: set) -> int:
+    """Bytes of obj and everything it references that is not already in seen"""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool, type(None))):
+        return size
+    if isinstance(obj, Mapping):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += deep_sizeof(vars(obj), seen)
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            size += deep_sizeof(getattr(obj, slot), seen)
+    return size
+
+def measure_session(state: Mapping, shared: Iterable = ()) -> Dict[str, int]:
+    """Bytes held by each session state key, not counting the shared objects"""
+    seen = set()
+    for obj in shared:
+        seen.add(id(obj))
+    return {key: deep_sizeof(state[key], seen) for key in list(state.keys())}
+
+def compact_after_submission(state: MutableMapping):
+    """Keep only what the confirmation page renders"""
+    for key in list(state.keys()):
+        if key not in SUBMISSION_KEYS:
+            del state[key]
+    # Login is not needed again once the submission is saved
+    state["credentials"] = None
+
+def compact_idle(state: MutableMapping):
+    for key in REBUILDABLE_KEYS:
+        if key in state:
+            del state[key]
+
+# ---------------------------------------------------------------------------
+# Idle sweeper
+# ---------------------------------------------------------------------------
+
+_lock = threading.Lock()
+_sessions: Dict[str, Dict] = {}
+_sweeper_started = False
+# Set once the runtime's sessions cannot be reached from the sweeper thread
+_lookup_failed = False
+
+def touch_session():
+    """Record activity of the session running this script.
+
+    When the sweeper cannot reach session states, a session idle past
+    IDLE_SECONDS is compacted here, from its own script run, instead.
+    """
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return
+    now = time.monotonic()
+    with _lock:
+        entry = _sessions.get(ctx.session_id)
+        _sessions[ctx.session_id] = {"last_active": now, "idle_compacted": False}
+    if (_lookup_failed and entry and not entry["idle_compacted"]
+            and now - entry["last_active"] > IDLE_SECONDS):
+        compact_idle(st.session_state)
+
+def _session_state(session_id: str):
+    """The SessionState of a session the runtime still holds, or None.
+
+    ctx.session_state is a wrapper made for each script run, so the
+    session's own state is looked up through the runtime's session manager.
+    That is not a public Streamlit API; if a Streamlit release changes it,
+    LookupError is raised and sessions are compacted by touch_session.
+    """
+    global _lookup_failed
+    from streamlit import runtime
+
+    if not runtime.exists():
+        return None
+    try:
+        info = runtime.get_instance()._session_mgr.get_session_info(session_id)
+        return info.session.session_state if info else None
+    except Exception as e:
+        if not _lookup_failed:
+            logger.warning("Cannot reach session states from the sweeper, "
+                           "compacting on the next rerun instead: %s", e)
+        _lookup_failed = True
+        raise LookupError(session_id) from e
+
+def sweep() -> Dict[str, int]:
+    """Compact idle sessions and report tracked sessions over budget"""
+    from utils import get_team_data, get_circle_data
+
+    shared = (get_team_data(), get_circle_data())
+    now = time.monotonic()
+    with _lock:
+        entries = list(_sessions.items())
+
+    compacted = over_budget = 0
+    for session_id, entry in entries:
+        idle = now - entry["last_active"]
+        try:
+            state = _session_state(session_id) if idle <= FORGET_SECONDS else None
+        except LookupError:
+            # touch_session compacts it on the session's next rerun
+            continue
+        if state is None:
+            with _lock:
+                _sessions.pop(session_id, None)
+            continue
+        try:
+            if idle > IDLE_SECONDS and not entry["idle_compacted"]:
+                compact_idle(state)
+                entry["idle_compacted"] = True
+                compacted += 1
+            sizes = measure_session(state.filtered_state, shared)
+        except Exception as e:
+            logger.warning("Could not inspect session state: %s", e)
+            continue
+        total = sum(sizes.values())
+        if total > SESSION_BUDGET_BYTES:
+            over_budget += 1
+            largest = sorted(sizes.items(), key=lambda item: item[1], reverse=True)[:5]
+            logger.warning("Session over memory budget: %s bytes, largest keys %s", total, largest)
+    return {"tracked": len(entries), "compacted": compacted, "over_budget": over_budget}
+
+def _sweeper_loop():
+    while True:
+        time.sleep(SWEEP_SECONDS)
+        try:
+            sweep()
+        except Exception as e:
+            logger.error("Session sweep failed: %s", e)
+
+def start_sweeper():
+    """Start the idle-session sweeper once per process"""
+    global _sweeper_started
+    with _lock:
+        if _sweeper_started:
+            return
+        _sweeper_started = True
+    threading.Thread(target=_sweeper_loop, name="session-sweeper", daemon=True).start()
@@ -1,25 +1,170 @@
 import gspread
 import streamlit as st
 from datetime import datetime
+import hashlib
+import json
 import logging
-from typing import List, Dict, Any
+import re
+import threading
+import time
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+import requests
+from contextlib import contextmanager
+import google.auth.transport.requests
+from google.auth.credentials import AnonymousCredentials
 from google.oauth2.service_account import Credentials
+from metrics import increment
+from client_pool import ClientPool, PoolTimeout
+from circuit_breaker import get_breaker, get_resilience_config
+import journal
+import coordination
+import capacity
+import analytics
+from schema import (
+    INDIVIDUAL_LAYOUT, TEAM_LAYOUT, FLAT_TEAM_LAYOUT, TEAM_SHARED_COLUMNS, IndividualSubmission, TeamSubmission
+)
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Google Sheets IDs
 INDIVIDUAL_SHEET_ID = "15R_7NwIfIq66pWApCNtY3xhNR9OLA4UIP5KeKehIaQg"
 TEAM_SHEET_ID = "14wBeJQRbHDki2meDxUEITmBoCYa9GfuwgcNMFEYlK8Q"
 
+# Column layout each response sheet is read with. The flat team layout only
+# adds a trailing Team ID column, so it reads merged-layout rows as well.
+LAYOUTS = {INDIVIDUAL_SHEET_ID: INDIVIDUAL_LAYOUT, TEAM_SHEET_ID: FLAT_TEAM_LAYOUT}
+
+# Email column (1-based) in each response sheet
+EMAIL_COLUMNS = {sheet_id: layout.column("email").index for sheet_id, layout in LAYOUTS.items()}
+
+# Partitioned worksheets are renamed with this prefix when archived
+ARCHIVE_PREFIX = "Archived - "
+
+# Seconds before a partition's email index is re-read from the sheet
+EMAIL_INDEX_TTL = 60
+
+# How often the leader replica rebuilds the shared email index, and how old
+# it may get before lookups fall back to reading the sheets
+EMAIL_INDEX_SYNC_SECONDS = 120
+EMAIL_INDEX_MAX_AGE = 3 * EMAIL_INDEX_SYNC_SECONDS
+
+# Rows fetched per request by the streaming readers
+PAGE_SIZE = 500
+
+# Team fields shared by merged rows, then the per-member fields
+TEAM_FIELDS = TEAM_LAYOUT.fields(1, TEAM_SHARED_COLUMNS)
+MEMBER_FIELDS = TEAM_LAYOUT.fields(TEAM_SHARED_COLUMNS + 1)
+TEAM_ID_COLUMN = FLAT_TEAM_LAYOUT.column("team_id").index
+
+# How often the leader copies new flat-layout team rows to the presentation sheet
+PRESENTATION_SYNC_SECONDS = 300
+
+def _column_letter(index: int) -> str:
+    """Convert a 1-based column index to its letter"""
+    return gspread.utils.rowcol_to_a1(1, index)[:-1]
+
+_UPDATED_RANGE = re.compile(r"!\$?[A-Z]+\$?(\d+)(?::\$?[A-Z]+\$?(\d+))?$")
+
+def _team_id(submission_id: str) -> str:
+    """Short, stable Team ID derived from a team submission's ID"""
+    return submission_id.rsplit(":", 1)[-1][:12]
+
+def _team_columns_range(worksheet_id: int, start_row: int, end_row: int) -> Dict[str, int]:
+    """GridRange of the shared team columns over rows start_row..end_row"""
+    return {
+        "sheetId": worksheet_id,
+        "startRowIndex": start_row - 1,
+        "endRowIndex": end_row,
+        "startColumnIndex": 0,
+        "endColumnIndex": TEAM_SHARED_COLUMNS,
+    }
+
+def _appended_rows(response: Any) -> Optional[Tuple[int, int]]:
+    """First and last row written by an append, from the updatedRange it reports"""
+    try:
+        match = _UPDATED_RANGE.search(response["updates"]["updatedRange"])
+    except (KeyError, TypeError):
+        return None
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2) or match.group(1))
+
+# Clients shared by concurrent sessions unless [sheets] CLIENT_POOL_SIZE says otherwise
+DEFAULT_POOL_SIZE = 4
+
+# Base URL gspread sends Sheets API requests to
+SHEETS_API_BASE_URL = "https://sheets.googleapis.com"
+
+class _RebasedSession(requests.Session):
+    """Session that sends Sheets API requests to another base URL, e.g. a local stand-in"""
+    
+    def __init__(self, base_url: str):
+        super().__init__()
+        self.base_url = base_url.rstrip("/")
+    
+    def request(self, method, url, *args, **kwargs):
+        if url.startswith(SHEETS_API_BASE_URL):
+            url = self.base_url + url[len(SHEETS_API_BASE_URL):]
+        return super().request(method, url, *args, **kwargs)
+
 class SheetsService:
     def __init__(self):
-        self.client = None
+        self.pool = None
+        self.credentials = None
+        self._credentials_lock = threading.Lock()
+        self.pool_size = DEFAULT_POOL_SIZE
+        self.api_url = ""
+        self.partition_by = "none"
+        self.intake_term = ""
+        self.team_storage = "merged"
+        self.presentation_sheet_id = ""
+        self._email_index = {}
+        self._index_lock = threading.Lock()
+        self.breaker = get_breaker("sheets")
+        self.pool_timeout = get_resilience_config()["SHEETS_POOL_TIMEOUT"]
+        self._load_partition_config()
         self._initialize_client()
     
+    def _load_partition_config(self):
+        """Read partitioning and endpoint settings from Streamlit secrets.
+        
+        API_URL overrides the Sheets API endpoint, CLIENT_POOL_SIZE bounds the clients shared by
+        concurrent sessions. PARTITION_BY is "none" (first worksheet), "term" (one worksheet per
+        INTAKE_TERM) or "team" (one worksheet per selected team). TEAM_STORAGE is "merged" (team
+        columns merged over the member rows) or "flat" (FLAT_TEAM_LAYOUT, one append per team);
+        with flat storage, PRESENTATION_SHEET_ID names an optional copy kept merged for reading.
+        """
+        try:
+            config = st.secrets.get("sheets", {})
+            self.partition_by = config.get("PARTITION_BY", "none")
+            self.intake_term = config.get("INTAKE_TERM", "")
+            self.api_url = config.get("API_URL", "")
+            self.pool_size = int(config.get("CLIENT_POOL_SIZE", DEFAULT_POOL_SIZE))
+            self.team_storage = config.get("TEAM_STORAGE", "merged")
+            self.presentation_sheet_id = config.get("PRESENTATION_SHEET_ID", "")
+        except Exception as e:
+            logger.warning("Could not read sheets partition config: %s", e)
+        
+        if self.partition_by == "term" and not self.intake_term:
+            logger.warning("PARTITION_BY is 'term' but INTAKE_TERM is not set, using first worksheet")
+            self.partition_by = "none"
+        elif self.partition_by not in ("none", "term", "team"):
+            logger.warning("Unknown PARTITION_BY '%s', using first worksheet", self.partition_by)
+            self.partition_by = "none"
+        
+        if self.team_storage not in ("merged", "flat"):
+            logger.warning("Unknown TEAM_STORAGE '%s', using merged", self.team_storage)
+            self.team_storage = "merged"
+    
     def _initialize_client(self):
-        """Initialize Google Sheets client using service account credentials"""
+        """Set up the pool of Google Sheets clients using service account credentials"""
+        if self.api_url:
+            # Local API stand-in (sheets_stub_server.py) needs no credentials
+            self._set_pool(lambda: gspread.Client(auth=AnonymousCredentials(), session=_RebasedSession(self.api_url)))
+            logger.info("Google Sheets clients pointed at %s", self.api_url)
+            return
+        
         try:
             # Get credentials from Streamlit secrets
             credentials_info = {
@@ -39,189 +184,850 @@ class SheetsService:
             # Define the scope
             scopes = ['https://www.googleapis.com/auth/spreadsheets']
             
-            # Create credentials
-            credentials = Credentials.from_service_account_info(credentials_info, scopes=scopes)
+            # Create credentials, shared by every pooled client
+            self.credentials = Credentials.from_service_account_info(credentials_info, scopes=scopes)
             
-            # Initialize gspread client
-            self.client = gspread.authorize(credentials)
-            logger.info("Google Sheets client initialized successfully")
+            # Clients are authorized lazily, on first checkout
+            self._set_pool(lambda: gspread.authorize(self.credentials), prepare=self._refresh_credentials)
+            logger.info("Google Sheets client pool initialized with up to %s clients", self.pool_size)
             
         except Exception as e:
-            logger.error(f"Failed to initialize Google Sheets client: {str(e)}")
-            self.client = None
+            logger.error("Failed to initialize Google Sheets client: %s", e)
+            self.pool = None
+    
+    def _set_pool(self, factory, prepare=None):
+        def create():
+            client = factory()
+            self._apply_timeouts(client)
+            return client
+        self.pool = ClientPool("sheets", create, self.pool_size, prepare)
+    
+    def use_client(self, client):
+        """Serve every checkout from one given client, e.g. a thread-safe fake"""
+        self._set_pool(lambda: client)
+    
+    def _refresh_credentials(self):
+        """Refresh the shared token once, before a checked-out client would refresh it itself.
+        
+        Without this every client's authorized session would refresh the same
+        expired credentials concurrently.
+        """
+        if self.credentials.valid:
+            return
+        with self._credentials_lock:
+            if not self.credentials.valid:
+                self.credentials.refresh(google.auth.transport.requests.Request())
+                increment("backend.google.service_token_refresh")
+    
+    @contextmanager
+    def _checkout(self):
+        """Yield a pooled client for one operation, None if the pool could not be set up.
+        
+        Raises PoolTimeout when no client frees up within SHEETS_POOL_TIMEOUT.
+        """
+        if self.pool is None:
+            yield None
+            return
+        with self.pool.acquire(self.pool_timeout) as client:
+            yield client
+    
+    def _apply_timeouts(self, client):
+        """Give every gspread request a (connect, read) deadline"""
+        config = get_resilience_config()
+        client.set_timeout((config["SHEETS_CONNECT_TIMEOUT"], config["SHEETS_READ_TIMEOUT"]))
+    
+    def _fail_fast(self, kind: str, response_data: Dict[str, Any], key: Optional[str],
+                   seats: Optional[Tuple[str, int]] = None, reason: str = "Sheets circuit open") -> bool:
+        """Handle a save that cannot reach Sheets now: journal it unless it is a replay"""
+        logger.warning("%s, not saving %s response", reason, kind)
+        if key is None:
+            return False
+        if journal.append(kind, response_data):
+            return True
+        self._release_submission(key)
+        if seats:
+            capacity.release_seats(*seats)
+        return False
+    
+    def _submission_key(self, kind: str, response_data: Dict[str, Any]) -> str:
+        """Idempotency key for a submission: its content without the timestamp"""
+        content = {k: v for k, v in response_data.items() if k != "timestamp"}
+        digest = hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+        return f"{kind}:{digest}"
+    
+    def _claim_submission(self, kind: str, response_data: Dict[str, Any]) -> Optional[str]:
+        """Claim a submission's key across replicas; None if it was already submitted"""
+        key = self._submission_key(kind, response_data)
+        try:
+            if not coordination.claim_idempotency_key(key):
+                return None
+        except Exception as e:
+            logger.error("Could not claim idempotency key: %s", e)
+        return key
+    
+    def _release_submission(self, key: str):
+        try:
+            coordination.release_idempotency_key(key)
+        except Exception as e:
+            logger.error("Could not release idempotency key: %s", e)
+    
+    def _share_emails(self, emails: List[str]):
+        """Add written emails to the index shared by all replicas"""
+        try:
+            coordination.add_registered_emails(emails)
+        except Exception as e:
+            logger.error("Could not update shared email index: %s", e)
+    
+    def _record_location(self, submission_id: str, kind: str, sheet_id: str, worksheet_title: str,
+                         rows: Optional[Tuple[int, int]], emails: List[str]):
+        """Index where a submission was written, so edits need no scan"""
+        if rows is None:
+            logger.warning("Append reported no range, %s submission location not recorded", kind)
+            return
+        try:
+            coordination.record_row_location(submission_id, kind, sheet_id, worksheet_title, *rows, emails)
+        except Exception as e:
+            logger.error("Could not record submission location: %s", e)
+    
+    def _partition_for(self, response_data: Dict[str, Any]) -> Optional[str]:
+        """Return the worksheet title a response is routed to, None for the first worksheet"""
+        if self.partition_by == "term":
+            return self.intake_term
+        if self.partition_by == "team":
+            return response_data["selected_team"]
+        return None
+    
+    def _get_write_worksheet(self, client, sheet_id: str, partition: Optional[str], headers: List[str]):
+        """Open the worksheet for a partition, creating it on first use"""
+        sheet = client.open_by_key(sheet_id)
+        if partition is None:
+            return sheet.get_worksheet(0)  # First worksheet
+        
+        try:
+            return sheet.worksheet(partition)
+        except gspread.WorksheetNotFound:
+            logger.info("Creating partition worksheet: %s", partition)
+            return sheet.add_worksheet(title=partition, rows=1000, cols=len(headers))
+    
+    def _get_live_worksheets(self, client, sheet_id: str) -> list:
+        """Return the worksheets that make up the current intake"""
+        sheet = client.open_by_key(sheet_id)
+        if self.partition_by == "none":
+            return [sheet.get_worksheet(0)]
+        if self.partition_by == "term":
+            try:
+                return [sheet.worksheet(self.intake_term)]
+            except gspread.WorksheetNotFound:
+                return []
+        return [ws for ws in sheet.worksheets() if not ws.title.startswith(ARCHIVE_PREFIX)]
+    
+    def _get_partition_emails(self, sheet_id: str, worksheet) -> set:
+        """Return the lowercased emails of one partition, re-reading after EMAIL_INDEX_TTL"""
+        key = (sheet_id, worksheet.title)
+        with self._index_lock:
+            entry = self._email_index.get(key)
+            if entry and time.monotonic() - entry[0] < EMAIL_INDEX_TTL:
+                return entry[1]
+        
+        emails = {e.strip().lower() for e in worksheet.col_values(EMAIL_COLUMNS[sheet_id])[1:] if e.strip()}
+        with self._index_lock:
+            self._email_index[key] = (time.monotonic(), emails)
+        return emails
+    
+    def _remember_emails(self, sheet_id: str, worksheet_title: str, emails: List[str]):
+        """Add freshly written emails to a partition's index"""
+        with self._index_lock:
+            entry = self._email_index.get((sheet_id, worksheet_title))
+            if entry:
+                entry[1].update(e.lower() for e in emails)
     
     def _ensure_headers(self, worksheet, headers: List[str]):
-        """Ensure the worksheet has the correct headers"""
+        """Ensure the worksheet has the correct headers.
+        
+        Headers that extend or are extended by the expected ones are compatible, so replicas on
+        either team layout share a worksheet. A worksheet holding data rows is never cleared.
+        """
         try:
             # Get current headers
             current_headers = worksheet.row_values(1)
+            if current_headers == headers:
+                return
+            
+            # Rows written with the other team layout are read with either set of headers
+            if current_headers and current_headers[:len(headers)] == headers:
+                return
             
-            # If no headers or headers don't match, update them
-            if not current_headers or current_headers != headers:
-                worksheet.clear()
-                worksheet.append_row(headers)
-                logger.info(f"Headers updated for worksheet: {worksheet.title}")
+            # A layout that only adds columns keeps the rows already written
+            if current_headers and headers[:len(current_headers)] == current_headers:
+                worksheet.update(f"A1:{_column_letter(len(headers))}1", [headers])
+                logger.info("Headers extended for worksheet: %s", worksheet.title)
+                return
+            
+            if current_headers and any(worksheet.row_values(2)):
+                logger.error("Headers of worksheet %s do not match the expected layout: %s",
+                             worksheet.title, current_headers)
+                raise ValueError(f"Unexpected headers in worksheet {worksheet.title}")
+            
+            # No data rows yet, so the header row can be written in place
+            width = max(len(headers), len(current_headers))
+            worksheet.update(f"A1:{_column_letter(width)}1", [headers + [""] * (width - len(headers))])
+            logger.info("Headers updated for worksheet: %s", worksheet.title)
                 
         except Exception as e:
-            logger.error(f"Error ensuring headers: {str(e)}")
+            logger.error("Error ensuring headers: %s", e)
             raise
     
-    def save_individual_response(self, response_data: Dict[str, Any]) -> bool:
-        """Save individual response to Google Sheets"""
+    def save_individual_response(self, response_data: Dict[str, Any], replay: bool = False) -> bool:
+        """Save individual response to Google Sheets.
+        
+        Identical resubmissions, from any replica, are accepted once. While
+        the Sheets circuit is open the response is journaled and saved on a
+        later flush; replay=True marks such a retry.
+        """
+        increment("backend.sheets.save_individual_response")
+        started = time.perf_counter()
+        if self.pool is None:
+            logger.error("Google Sheets client not initialized")
+            return False
+        key = None
+        seats = None
         try:
-            if not self.client:
-                logger.error("Google Sheets client not initialized")
-                return False
+            if not replay:
+                key = self._claim_submission("individual", response_data)
+                if key is None:
+                    logger.warning("Duplicate individual submission ignored")
+                    return True
+                
+                seats = (response_data["selected_team"], 1)
+                if not capacity.reserve_seats(*seats):
+                    logger.warning("Team full, individual submission rejected")
+                    self._release_submission(key)
+                    return False
+            
+            if not self.breaker.allow():
+                return self._fail_fast("individual", response_data, key, seats)
+            
+            submission = IndividualSubmission.from_dict(response_data)
             
-            # Open the individual responses sheet
-            sheet = self.client.open_by_key(INDIVIDUAL_SHEET_ID)
-            worksheet = sheet.get_worksheet(0)  # First worksheet
-            
-            # Define headers for individual responses
-            headers = [
-                "Timestamp", "Name", "CRN", "Contact", "Email", 
-                "Selected Team", "Feedback"
-            ]
-            
-            # Ensure headers are correct
-            self._ensure_headers(worksheet, headers)
-            
-            # Prepare row data
-            row_data = [
-                response_data["timestamp"],
-                response_data["name"],
-                response_data["crn"],
-                response_data["contact"],
-                response_data["email"],
-                response_data["selected_team"],
-                response_data["comments"]
-            ]
-            
-            # Append the row
-            worksheet.append_row(row_data)
-            logger.info(f"Individual response saved for: {response_data['name']}")
+            # A pooled client is held only for the Sheets calls
+            try:
+                with self._checkout() as client:
+                    # Open the partition of the individual responses sheet
+                    worksheet = self._get_write_worksheet(
+                        client, INDIVIDUAL_SHEET_ID, self._partition_for(response_data), INDIVIDUAL_LAYOUT.headers
+                    )
+                    
+                    # Ensure headers are correct
+                    self._ensure_headers(worksheet, INDIVIDUAL_LAYOUT.headers)
+                    
+                    # Append the row
+                    response = worksheet.append_row(submission.to_row())
+            except PoolTimeout:
+                self.breaker.release()
+                return self._fail_fast("individual", response_data, key, seats, "No Sheets client free")
+            
+            self._remember_emails(INDIVIDUAL_SHEET_ID, worksheet.title, [response_data["email"]])
+            self._record_location(
+                key or self._submission_key("individual", response_data), "individual",
+                INDIVIDUAL_SHEET_ID, worksheet.title, _appended_rows(response), [response_data["email"]]
+            )
+            self._share_emails([response_data["email"]])
+            logger.info("Individual response saved to %s", worksheet.title, extra={
+                "event": "sheets.save_individual", "sampled": True,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            })
+            self.breaker.record_success()
+            analytics.record_submission("Individual", response_data)
+            journal.schedule_flush()
             return True
             
         except Exception as e:
-            logger.error(f"Error saving individual response: {str(e)}")
+            self.breaker.record_failure(e)
+            if key:
+                self._release_submission(key)
+            if seats:
+                capacity.release_seats(*seats)
+            logger.error("Error saving individual response: %s", e)
             return False
     
-    def save_team_response(self, response_data: Dict[str, Any]) -> bool:
-        """Save team response to Google Sheets with merged cells for same team"""
+    def save_team_response(self, response_data: Dict[str, Any], replay: bool = False) -> bool:
+        """Save team response to Google Sheets, one row per member.
+        
+        With merged storage the team columns are merged over the team's rows;
+        with flat storage every row carries them and the team's ID instead,
+        so the whole team is a single append.
+        """
+        increment("backend.sheets.save_team_response")
+        started = time.perf_counter()
+        if self.pool is None:
+            logger.error("Google Sheets client not initialized")
+            return False
+        key = None
+        seats = None
         try:
-            if not self.client:
-                logger.error("Google Sheets client not initialized")
-                return False
+            if not replay:
+                key = self._claim_submission("team", response_data)
+                if key is None:
+                    logger.warning("Duplicate team submission ignored")
+                    return True
+                
+                seats = (response_data["selected_team"], len(response_data["members"]))
+                if not capacity.reserve_seats(*seats):
+                    logger.warning("Team full, team submission rejected")
+                    self._release_submission(key)
+                    return False
             
-            # Open the team responses sheet
-            sheet = self.client.open_by_key(TEAM_SHEET_ID)
-            worksheet = sheet.get_worksheet(0)  # First worksheet
-            
-            # Define headers for team responses
-            headers = [
-                "Timestamp", "Team Name", "Selected Team", "Member Count", 
-                "Comments", "Member Name", "CRN", "Contact", "Email", "Team Lead"
-            ]
-            
-            # Ensure headers are correct
-            self._ensure_headers(worksheet, headers)
-            
-            # Get current row count to know where to start
-            current_rows = len(worksheet.get_all_values())
-            start_row = current_rows + 1
-            
-            # Prepare team data
-            team_info = [
-                response_data["timestamp"],
-                response_data["team_name"],
-                response_data["selected_team"],
-                str(response_data["member_count"]),
-                response_data["comments"]
-            ]
-            
-            # Add each member
-            members = response_data["members"]
-            for i, member in enumerate(members):
-                is_team_lead = "Yes" if i == 0 else "No"
-                
-                row_data = team_info + [
-                    member["name"],
-                    member["crn"],
-                    member["contact"],
-                    member["email"],
-                    is_team_lead
-                ]
-                
-                worksheet.append_row(row_data)
-            
-            # Merge cells for team information (columns A-E) for all rows of this team
-            end_row = start_row + len(members) - 1
-            
-            if len(members) > 1:  # Only merge if more than one member
-                try:
-                    # Merge timestamp column (A)
-                    worksheet.merge_cells(f'A{start_row}:A{end_row}')
-                    # Merge team name column (B)
-                    worksheet.merge_cells(f'B{start_row}:B{end_row}')
-                    # Merge selected team column (C)
-                    worksheet.merge_cells(f'C{start_row}:C{end_row}')
-                    # Merge member count column (D)
-                    worksheet.merge_cells(f'D{start_row}:D{end_row}')
-                    # Merge comments column (E)
-                    worksheet.merge_cells(f'E{start_row}:E{end_row}')
+            if not self.breaker.allow():
+                return self._fail_fast("team", response_data, key, seats)
+            
+            submission = TeamSubmission.from_dict(response_data)
+            submission_id = key or self._submission_key("team", response_data)
+            flat = self.team_storage == "flat"
+            layout = FLAT_TEAM_LAYOUT if flat else TEAM_LAYOUT
+            
+            # A pooled client is held only for the Sheets calls
+            try:
+                with self._checkout() as client:
+                    # Open the partition of the team responses sheet
+                    worksheet = self._get_write_worksheet(
+                        client, TEAM_SHEET_ID, self._partition_for(response_data), layout.headers
+                    )
+                    
+                    # Ensure headers are correct
+                    self._ensure_headers(worksheet, layout.headers)
                     
-                    logger.info(f"Merged cells for team: {response_data['team_name']}")
-                except Exception as merge_error:
-                    logger.warning(f"Could not merge cells: {str(merge_error)}")
+                    # Add one row per member; the append reports where they landed
+                    response = worksheet.append_rows(submission.to_rows(_team_id(submission_id) if flat else None))
+                    rows = _appended_rows(response)
+                    if rows is None:
+                        # Column A is blank under merged rows, every member row has an email
+                        end_row = len(worksheet.col_values(EMAIL_COLUMNS[TEAM_SHEET_ID]))
+                        rows = (end_row - submission.member_count + 1, end_row)
+                    start_row, end_row = rows
+                    
+                    # Merge cells for team information (columns A-E) for all rows of this team
+                    if not flat and submission.member_count > 1:  # Only merge if more than one member
+                        try:
+                            for column in TEAM_LAYOUT.columns[:TEAM_SHARED_COLUMNS]:
+                                worksheet.merge_cells(f'{column.letter}{start_row}:{column.letter}{end_row}')
+                        
+                            logger.debug("Merged cells for rows %s-%s", start_row, end_row)
+                        except Exception as merge_error:
+                            logger.warning("Could not merge cells: %s", merge_error)
+            except PoolTimeout:
+                self.breaker.release()
+                return self._fail_fast("team", response_data, key, seats, "No Sheets client free")
+            
+            emails = [member.email for member in submission.members]
+            self._remember_emails(TEAM_SHEET_ID, worksheet.title, emails)
+            self._share_emails(emails)
+            self._record_location(submission_id, "team", TEAM_SHEET_ID, worksheet.title, rows, emails)
             
-            logger.info(f"Team response saved for: {response_data['team_name']}")
+            logger.info("Team response saved to %s", worksheet.title, extra={
+                "event": "sheets.save_team", "sampled": True, "rows": submission.member_count,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            })
+            self.breaker.record_success()
+            analytics.record_submission("Team", response_data)
+            journal.schedule_flush()
             return True
             
         except Exception as e:
-            logger.error(f"Error saving team response: {str(e)}")
+            self.breaker.record_failure(e)
+            if key:
+                self._release_submission(key)
+            if seats:
+                capacity.release_seats(*seats)
+            logger.error("Error saving team response: %s", e)
             return False
     
+    def _submission_from_rows(self, kind: str, rows: List[List[str]]) -> Dict[str, Any]:
+        """Rebuild a submission's fields from its rows, padded to the layout width"""
+        if kind == "individual":
+            return dict(zip(INDIVIDUAL_LAYOUT.fields(), rows[0]))
+        data = dict(zip(TEAM_FIELDS, rows[0][:TEAM_SHARED_COLUMNS]))
+        data["team_id"] = rows[0][TEAM_ID_COLUMN - 1]
+        data["members"] = [dict(zip(MEMBER_FIELDS, row[TEAM_SHARED_COLUMNS:])) for row in rows]
+        return data
+    
+    def get_submission(self, email: str) -> Optional[Dict[str, Any]]:
+        """Read back the submission that registered an email from its indexed rows.
+        
+        Returns the row location with the fields under "data", or None when
+        the email is not indexed or its rows no longer hold it.
+        """
+        increment("backend.sheets.get_submission")
+        try:
+            location = coordination.find_row_location(email)
+            if location is None:
+                return None
+            
+            layout = LAYOUTS[location["sheet_id"]]
+            with self._checkout() as client:
+                if not client:
+                    logger.error("Google Sheets client not initialized")
+                    return None
+                worksheet = client.open_by_key(location["sheet_id"]).worksheet(location["worksheet"])
+                values = worksheet.get(layout.rows(location["start_row"], location["end_row"]))
+            
+            rows = [row + [""] * (layout.width - len(row)) for row in values]
+            if len(rows) == location["end_row"] - location["start_row"] + 1:
+                data = self._submission_from_rows(location["kind"], rows)
+                members = data["members"] if location["kind"] == "team" else [data]
+                if email.strip().lower() in {member["email"].strip().lower() for member in members}:
+                    return {**location, "data": data}
+            
+            logger.warning("Indexed rows in %s no longer hold the submission", location["worksheet"])
+            return None
+        
+        except Exception as e:
+            logger.error("Error reading submission: %s", e)
+            return None
+    
+    def update_submission(self, submission_id: str, response_data: Dict[str, Any], editor_email: str) -> bool:
+        """Rewrite a submission's rows in place with one ranged update.
+        
+        The number of rows and the emails cannot change, and only the
+        individual or the team lead may edit. Team rows are merged again
+        afterwards in a single request.
+        """
+        increment("backend.sheets.update_submission")
+        started = time.perf_counter()
+        try:
+            location = coordination.get_row_location(submission_id)
+            if location is None:
+                logger.error("No row location for submission %s", submission_id)
+                return False
+            if location["worksheet"].startswith(ARCHIVE_PREFIX):
+                logger.warning("Submission %s is archived, not edited", submission_id)
+                return False
+            
+            kind, start_row, end_row = location["kind"], location["start_row"], location["end_row"]
+            if kind == "team":
+                # Rows with a Team ID are in the flat layout and keep it
+                rows = TeamSubmission.from_dict(response_data).to_rows(response_data.get("team_id"))
+                emails = [member["email"].strip().lower() for member in response_data["members"]]
+            else:
+                rows = [IndividualSubmission.from_dict(response_data).to_row()]
+                emails = [response_data["email"].strip().lower()]
+            if len(rows) != end_row - start_row + 1:
+                logger.error("Edit of %s changes its row count, not saved", submission_id)
+                return False
+            if emails[0] != editor_email.strip().lower():
+                logger.error("Edit of %s not made by its lead, not saved", submission_id)
+                return False
+            
+            layout = LAYOUTS[location["sheet_id"]]
+            if self.pool is None:
+                logger.error("Google Sheets client not initialized")
+                return False
+            if not self.breaker.allow():
+                logger.warning("Sheets circuit open, edit of %s not saved", submission_id)
+                return False
+            
+            with self._checkout() as client:
+                worksheet = client.open_by_key(location["sheet_id"]).worksheet(location["worksheet"])
+                
+                # The indexed rows must still hold this submission's emails
+                email_letter = layout.column("email").letter
+                current = worksheet.get(f"{email_letter}{start_row}:{email_letter}{end_row}")
+                if [row[0].strip().lower() if row else "" for row in current] != emails:
+                    # The sheet answered, so this says nothing about backend health
+                    self.breaker.record_success()
+                    logger.warning("Indexed rows of %s no longer hold the submission, not edited", submission_id)
+                    return False
+                
+                worksheet.batch_update([{"range": layout.rows(start_row, end_row), "values": rows}])
+                if kind == "team" and not response_data.get("team_id") and len(rows) > 1:
+                    self._merge_team_rows(worksheet, start_row, end_row)
+                
+                logger.info("Submission updated in %s", worksheet.title, extra={
+                    "event": "sheets.update_submission", "rows": len(rows),
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                })
+                self.breaker.record_success()
+                return True
+        
+        except PoolTimeout:
+            self.breaker.release()
+            logger.warning("No Sheets client free, edit of %s not saved", submission_id)
+            return False
+        except Exception as e:
+            self.breaker.record_failure(e)
+            logger.error("Error updating submission: %s", e)
+            return False
+    
+    def _merge_team_rows(self, worksheet, start_row: int, end_row: int):
+        """Merge each shared team column over the team's rows, in one batchUpdate"""
+        grid_range = _team_columns_range(worksheet.id, start_row, end_row)
+        worksheet.spreadsheet.batch_update({"requests": [
+            {"unmergeCells": {"range": grid_range}},
+            {"mergeCells": {"range": grid_range, "mergeType": "MERGE_COLUMNS"}},
+        ]})
+    
     def check_email_exists(self, email: str) -> bool:
         """Check if the email exists in individual or team responses"""
+        increment("backend.sheets.check_email_exists")
+        # The shared index answers without touching the sheets while it is fresh
+        email = email.strip().lower()
         try:
-            if not self.client:
-                logger.error("Google Sheets client not initialized")
+            if coordination.is_email_registered(email):
+                return True
+            age = coordination.email_index_age()
+            if age is not None and age < EMAIL_INDEX_MAX_AGE:
                 return False
+        except Exception as e:
+            logger.error("Shared email index unavailable: %s", e)
+        
+        if self.pool is None:
+            logger.error("Google Sheets client not initialized")
+            return False
+        if not self.breaker.allow():
+            logger.warning("Sheets circuit open, skipping email check")
+            return False
+        
+        try:
+            with self._checkout() as client:
+                # Check the live partitions of the individual and team sheets
+                exists = False
+                for sheet_id in (INDIVIDUAL_SHEET_ID, TEAM_SHEET_ID):
+                    for worksheet in self._get_live_worksheets(client, sheet_id):
+                        if email in self._get_partition_emails(sheet_id, worksheet):
+                            exists = True
+                            break
+                    if exists:
+                        break
+            
+            self.breaker.record_success()
+            return exists
             
-            # Check individual sheet
-            sheet = self.client.open_by_key(INDIVIDUAL_SHEET_ID)
-            worksheet = sheet.get_worksheet(0)
-            emails = worksheet.col_values(5)[1:]  # Column E, skip header
-            if email.lower() in [e.lower() for e in emails]:
+        except PoolTimeout:
+            self.breaker.release()
+            logger.warning("No Sheets client free, skipping email check")
+            return False
+        except Exception as e:
+            self.breaker.record_failure(e)
+            logger.error("Error checking email existence: %s", e)
+            return False
+    
+    def sync_email_index(self) -> bool:
+        """Rebuild the shared email index from the live partitions of both sheets"""
+        try:
+            with self._checkout() as client:
+                if not client:
+                    logger.error("Google Sheets client not initialized")
+                    return False
+                
+                read_started_at = time.time()
+                emails = set()
+                for sheet_id in (INDIVIDUAL_SHEET_ID, TEAM_SHEET_ID):
+                    for worksheet in self._get_live_worksheets(client, sheet_id):
+                        emails.update(e.strip().lower() for e in worksheet.col_values(EMAIL_COLUMNS[sheet_id])[1:])
+                
+                coordination.replace_registered_emails(emails, read_started_at)
+                logger.info("Shared email index synced with %s emails", len(emails))
                 return True
             
-            # Check team sheet
-            sheet = self.client.open_by_key(TEAM_SHEET_ID)
-            worksheet = sheet.get_worksheet(0)
-            emails = worksheet.col_values(9)[1:]  # Column I, skip header
-            if email.lower() in [e.lower() for e in emails]:
+        except Exception as e:
+            logger.error("Error syncing shared email index: %s", e)
+            return False
+    
+    def warm_email_index(self):
+        """Read the emails of every live partition into the local index"""
+        with self._checkout() as client:
+            if not client:
+                raise RuntimeError("Google Sheets client not initialized")
+            for sheet_id in (INDIVIDUAL_SHEET_ID, TEAM_SHEET_ID):
+                for worksheet in self._get_live_worksheets(client, sheet_id):
+                    self._get_partition_emails(sheet_id, worksheet)
+    
+    def _load_registration_snapshot(self, client, exclude: Optional[Dict[str, Any]] = None) -> Dict[str, set]:
+        """Read CRN, contact and email columns of both sheets into lookup sets.
+        
+        exclude is a row location whose rows are left out, e.g. of a submission being edited.
+        """
+        snapshot = {"crn": set(), "contact": set(), "email": set()}
+        
+        # Only the CRN, Contact and Email columns of each sheet are read
+        for sheet_id, layout in LAYOUTS.items():
+            value_range = layout.span("crn", "email")
+            rows = []
+            for worksheet in self._get_live_worksheets(client, sheet_id):
+                values = worksheet.get(value_range)
+                if exclude and (exclude["sheet_id"], exclude["worksheet"]) == (sheet_id, worksheet.title):
+                    # The range starts at row 2
+                    values = [row for i, row in enumerate(values)
+                              if not exclude["start_row"] <= i + 2 <= exclude["end_row"]]
+                rows.extend(values)
+            for row in rows:
+                row = row + [""] * (3 - len(row))
+                crn, contact, email = (value.strip() for value in row[:3])
+                if crn:
+                    snapshot["crn"].add(crn)
+                if contact:
+                    snapshot["contact"].add(contact)
+                if email:
+                    snapshot["email"].add(email.lower())
+        
+        return snapshot
+    
+    def find_team_conflicts(self, members: List[Dict[str, str]],
+                            exclude: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Check all team members against existing registrations and each other.
+        
+        Both sheets are read once per call, so a whole team costs a single lookup.
+        An edit passes its submission's row location as exclude, so its own
+        rows are not reported. Returns a list of error messages, empty when
+        there are no conflicts.
+        """
+        increment("backend.sheets.find_team_conflicts")
+        if self.pool is None:
+            logger.error("Google Sheets client not initialized")
+            return []
+        if not self.breaker.allow():
+            logger.warning("Sheets circuit open, skipping team duplicate check")
+            return []
+        
+        try:
+            with self._checkout() as client:
+                snapshot = self._load_registration_snapshot(client, exclude)
+            self.breaker.record_success()
+            
+        except PoolTimeout:
+            self.breaker.release()
+            logger.warning("No Sheets client free, skipping team duplicate check")
+            return []
+        except Exception as e:
+            self.breaker.record_failure(e)
+            logger.error("Error loading registration snapshot: %s", e)
+            return []
+        
+        fields = (("email", "Email"), ("crn", "CRN"), ("contact", "Contact number"))
+        seen = {field: {} for field, _ in fields}
+        errors = []
+        
+        for i, member in enumerate(members):
+            member_title = "Team Lead" if i == 0 else f"Member {i+1}"
+            for field, label in fields:
+                value = member.get(field, "").strip()
+                if field == "email":
+                    value = value.lower()
+                if not value:
+                    continue
+                
+                if value in snapshot[field]:
+                    errors.append(f"{member_title}: {label} is already registered")
+                elif value in seen[field]:
+                    errors.append(f"{member_title}: {label} is the same as {seen[field][value]}")
+                else:
+                    seen[field][value] = member_title
+        
+        return errors
+    
+    def _iter_pages(self, sheet_id: str, worksheet_id: int, columns: List[int], page_size: int,
+                    start_row: int) -> Iterator[Tuple[int, List[str]]]:
+        """Yield (row number, values) for the given columns, one A1-range page at a time.
+        
+        Each page is read with its own pooled client, given back before any of
+        its rows are yielded, so a slow or abandoned consumer holds no client.
+        """
+        while True:
+            with self._checkout() as client:
+                worksheet = client.open_by_key(sheet_id).get_worksheet_by_id(worksheet_id)
+                row_count = worksheet.row_count
+                if start_row > row_count:
+                    return
+                end_row = min(start_row + page_size - 1, row_count)
+                
+                if columns == list(range(columns[0], columns[-1] + 1)):
+                    # Contiguous columns come back in one range
+                    first, last = _column_letter(columns[0]), _column_letter(columns[-1])
+                    page = worksheet.get(f"{first}{start_row}:{last}{end_row}")
+                else:
+                    # Scattered columns: one value range per column, zipped into rows
+                    ranges = [f"{_column_letter(c)}{start_row}:{_column_letter(c)}{end_row}" for c in columns]
+                    column_pages = [[row[0] if row else "" for row in values] for values in worksheet.batch_get(ranges)]
+                    height = max((len(values) for values in column_pages), default=0)
+                    page = [
+                        [values[i] if i < len(values) else "" for values in column_pages]
+                        for i in range(height)
+                    ]
+            
+            if not any(any(row) for row in page):
+                # Responses are appended, so a fully empty page means the data has ended.
+                # An empty range comes back as [[]], not [].
+                return
+            
+            for offset, row in enumerate(page):
+                yield start_row + offset, row + [""] * (len(columns) - len(row))
+            
+            start_row = end_row + 1
+    
+    def iter_rows(self, sheet_id: str, columns: Optional[List[int]] = None,
+                  page_size: int = PAGE_SIZE, include_archived: bool = False) -> Iterator[Tuple[str, int, List[str]]]:
+        """Stream response rows as (worksheet title, row number, values).
+        
+        Rows are read in pages of page_size, so only one page is held in memory.
+        columns is a list of 1-based column indexes; all columns are read when omitted.
+        """
+        columns = columns or list(range(1, LAYOUTS[sheet_id].width + 1))
+        with self._checkout() as client:
+            if not client:
+                logger.error("Google Sheets client not initialized")
+                return
+            
+            if include_archived:
+                worksheets = client.open_by_key(sheet_id).worksheets()
+            else:
+                worksheets = self._get_live_worksheets(client, sheet_id)
+            worksheets = [(worksheet.id, worksheet.title) for worksheet in worksheets]
+        
+        for worksheet_id, title in worksheets:
+            for row_number, values in self._iter_pages(sheet_id, worksheet_id, columns, page_size, start_row=2):
+                yield title, row_number, values
+    
+    def iter_team_groups(self, page_size: int = PAGE_SIZE, include_archived: bool = False) -> Iterator[Dict[str, Any]]:
+        """Stream team submissions, rebuilding each team from its rows.
+        
+        Flat-layout rows are grouped by their Team ID. In the merged layout a
+        new team starts at every row with a timestamp in column A, and the
+        rows below it with blank A-E cells belong to the same team.
+        """
+        team = None
+        for title, row_number, values in self.iter_rows(TEAM_SHEET_ID, page_size=page_size,
+                                                         include_archived=include_archived):
+            team_values, member_values = values[:TEAM_SHARED_COLUMNS], values[TEAM_SHARED_COLUMNS:]
+            team_id = values[TEAM_ID_COLUMN - 1]
+            
+            if (team is None or team["worksheet"] != title or team["team_id"] != team_id
+                    or (not team_id and team_values[0])):
+                if team is not None:
+                    yield team
+                team = dict(zip(TEAM_FIELDS, team_values))
+                team.update(worksheet=title, start_row=row_number, team_id=team_id, members=[])
+            
+            team["end_row"] = row_number
+            team["members"].append(dict(zip(MEMBER_FIELDS, member_values)))
+        
+        if team is not None:
+            yield team
+    
+    def sync_presentation_sheet(self) -> bool:
+        """Copy new flat-layout team rows to the presentation sheet and merge them there.
+        
+        Each live team worksheet is copied to the worksheet of the same title in
+        PRESENTATION_SHEET_ID. How many rows were copied is kept in the
+        coordination metadata, so each run reads only the rows added since.
+        """
+        if self.team_storage != "flat" or not self.presentation_sheet_id:
+            return True
+        try:
+            with self._checkout() as client:
+                if not client:
+                    logger.error("Google Sheets client not initialized")
+                    return False
+                
+                copied = 0
+                for worksheet in self._get_live_worksheets(client, TEAM_SHEET_ID):
+                    copied += self._present_worksheet(client, worksheet)
+                if copied:
+                    logger.info("Copied %s team rows to the presentation sheet", copied)
                 return True
             
+        except Exception as e:
+            logger.error("Error syncing presentation sheet: %s", e)
             return False
+    
+    def _present_worksheet(self, client, worksheet) -> int:
+        """Copy one worksheet's new rows and merge each flat-layout team among them"""
+        meta_key = f"presentation_rows:{worksheet.title}"
+        next_row = coordination.get_meta(meta_key, 2)
+        width = FLAT_TEAM_LAYOUT.width
+        # Teams are appended whole, so the rows read never end mid-team. With no
+        # new rows the API returns a single empty one, which is not copied.
+        values = worksheet.get(f"A{next_row}:{FLAT_TEAM_LAYOUT.columns[-1].letter}")
+        read = max((i + 1 for i, row in enumerate(values) if any(row)), default=0)
+        rows = [row + [""] * (width - len(row)) for row in values[:read] if any(row)]
+        if not rows:
+            return 0
+        
+        target = self._get_write_worksheet(client, self.presentation_sheet_id, worksheet.title,
+                                           FLAT_TEAM_LAYOUT.headers)
+        self._ensure_headers(target, FLAT_TEAM_LAYOUT.headers)
+        target_rows = _appended_rows(target.append_rows(rows))
+        coordination.set_meta(meta_key, next_row + read)
+        if target_rows is None:
+            logger.warning("Append reported no range, presentation rows of %s not merged", worksheet.title)
+            return len(rows)
+        
+        batch_requests = []
+        group_start = 0
+        for i in range(1, len(rows) + 1):
+            team_id = rows[group_start][TEAM_ID_COLUMN - 1]
+            if i < len(rows) and team_id and rows[i][TEAM_ID_COLUMN - 1] == team_id:
+                continue
+            if i - group_start > 1:
+                grid_range = _team_columns_range(target.id, target_rows[0] + group_start, target_rows[0] + i - 1)
+                batch_requests.append({"mergeCells": {"range": grid_range, "mergeType": "MERGE_COLUMNS"}})
+            group_start = i
+        if batch_requests:
+            target.spreadsheet.batch_update({"requests": batch_requests})
+        return len(rows)
+    
+    def archive_partition(self, partition: str) -> bool:
+        """Roll a closed partition out of the live path in both response sheets"""
+        try:
+            with self._checkout() as client:
+                if not client:
+                    logger.error("Google Sheets client not initialized")
+                    return False
+                
+                if partition.startswith(ARCHIVE_PREFIX):
+                    logger.error("Partition already archived: %s", partition)
+                    return False
+                
+                archived = False
+                for sheet_id in (INDIVIDUAL_SHEET_ID, TEAM_SHEET_ID):
+                    sheet = client.open_by_key(sheet_id)
+                    try:
+                        worksheet = sheet.worksheet(partition)
+                    except gspread.WorksheetNotFound:
+                        continue
+                
+                    worksheet.update_title(f"{ARCHIVE_PREFIX}{partition}")
+                    coordination.rename_row_location_worksheet(sheet_id, partition, f"{ARCHIVE_PREFIX}{partition}")
+                    with self._index_lock:
+                        self._email_index.pop((sheet_id, partition), None)
+                    archived = True
+                
+                if archived:
+                    capacity.reset_team_counts()
+                    # Archived emails may register again; lookups read the live partitions until the next sync
+                    coordination.clear_registered_emails()
+                    logger.info("Archived partition: %s", partition)
+                else:
+                    logger.warning("No worksheet found for partition: %s", partition)
+                return archived
             
         except Exception as e:
-            logger.error(f"Error checking email existence: {str(e)}")
+            logger.error("Error archiving partition %s: %s", partition, e)
             return False
     
     def test_connection(self) -> tuple[bool, str]:
         """Test the connection to Google Sheets"""
         try:
-            if not self.client:
-                return False, "Google Sheets client not initialized"
-            
-            # Try to open a test sheet
-            sheet = self.client.open_by_key(INDIVIDUAL_SHEET_ID)
-            worksheet = sheet.get_worksheet(0)
-            
-            # Try to read the first cell
-            test_value = worksheet.acell('A1').value
-            
-            return True, "Google Sheets connection successful"
+            with self._checkout() as client:
+                if not client:
+                    return False, "Google Sheets client not initialized"
+                
+                # Try to open a test sheet
+                sheet = client.open_by_key(INDIVIDUAL_SHEET_ID)
+                worksheet = sheet.get_worksheet(0)
+                
+                # Try to read the first cell
+                test_value = worksheet.acell('A1').value
+                
+                return True, "Google Sheets connection successful"
             
         except Exception as e:
             return False, f"Google Sheets connection failed: {str(e)}"
@@ -229,18 +1035,47 @@ class SheetsService:
 # Global instance
 sheets_service = SheetsService()
 
-def save_individual_response(response_data: Dict[str, Any]) -> bool:
+# Only the leader replica reads the sheets to rebuild the shared index
+coordination.register_leader_task("email_index_sync", EMAIL_INDEX_SYNC_SECONDS, sheets_service.sync_email_index)
+coordination.register_leader_task("presentation_sync", PRESENTATION_SYNC_SECONDS, sheets_service.sync_presentation_sheet)
+
+def save_individual_response(response_data: Dict[str, Any], replay: bool = False) -> bool:
     """Convenience function to save individual response"""
-    return sheets_service.save_individual_response(response_data)
+    return sheets_service.save_individual_response(response_data, replay)
 
-def save_team_response(response_data: Dict[str, Any]) -> bool:
+def save_team_response(response_data: Dict[str, Any], replay: bool = False) -> bool:
     """Convenience function to save team response"""
-    return sheets_service.save_team_response(response_data)
+    return sheets_service.save_team_response(response_data, replay)
 
 def check_email_exists(email: str) -> bool:
     """Convenience function to check if email exists"""
     return sheets_service.check_email_exists(email)
 
+def find_team_conflicts(members: List[Dict[str, str]], exclude: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Convenience function to check team members for duplicate registrations"""
+    return sheets_service.find_team_conflicts(members, exclude)
+
+def iter_rows(sheet_id: str, columns: Optional[List[int]] = None, page_size: int = PAGE_SIZE,
+              include_archived: bool = False) -> Iterator[Tuple[str, int, List[str]]]:
+    """Convenience function to stream response rows"""
+    return sheets_service.iter_rows(sheet_id, columns, page_size, include_archived)
+
+def iter_team_groups(page_size: int = PAGE_SIZE, include_archived: bool = False) -> Iterator[Dict[str, Any]]:
+    """Convenience function to stream team submissions"""
+    return sheets_service.iter_team_groups(page_size, include_archived)
+
+def get_submission(email: str) -> Optional[Dict[str, Any]]:
+    """Convenience function to read back a submission by one of its emails"""
+    return sheets_service.get_submission(email)
+
+def update_submission(submission_id: str, response_data: Dict[str, Any], editor_email: str) -> bool:
+    """Convenience function to edit a submission in place"""
+    return sheets_service.update_submission(submission_id, response_data, editor_email)
+
+def archive_partition(partition: str) -> bool:
+    """Convenience function to archive a closed partition"""
+    return sheets_service.archive_partition(partition)
+
 def test_sheets_connection() -> tuple[bool, str]:
     """Convenience function to test connection"""
     return sheets_service.test_connection()
\ No newline at end of file
@@ -0,0 +1,294 @@
+"""Local stand-in for the subset of the Google Sheets v4 API used by gspread here.
+
+Serves spreadsheet metadata, values get/batchGet/update/append/clear and
+batchUpdate (mergeCells, unmergeCells, addSheet, updateSheetProperties) from memory, with
+configurable latency, quota errors and failure injection:
+
+    python sheets_stub_server.py --port 8765 --latency-ms 80 --failure-rate 0.02
+
+Point SheetsService at it with API_URL under [sheets] in secrets.toml:
+
+    [sheets]
+    API_URL = "http://127.0.0.1:8765"
+
+Settings can be changed while running with POST /_control (JSON body with
+latency_ms, jitter_ms, failure_rate or quota_per_minute) and all data
+dropped with POST /_reset.
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+import fakes
+
+class StubConfig:
+    def __init__(self, latency_ms=0, jitter_ms=0, failure_rate=0.0, quota_per_minute=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.quota_per_minute = quota_per_minute
+        self._requests = deque()
+        self._lock = threading.Lock()
+
+    def update(self, values):
+        for field in ("latency_ms", "jitter_ms", "failure_rate", "quota_per_minute"):
+            if field in values:
+                setattr(self, field, type(getattr(self, field))(values[field]))
+
+    def over_quota(self) -> bool:
+        """Sliding one-minute request window, like the per-user Sheets quota"""
+        if not self.quota_per_minute:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            while self._requests and now - self._requests[0] > 60:
+                self._requests.popleft()
+            if len(self._requests) >= self.quota_per_minute:
+                return True
+            self._requests.append(now)
+            return False
+
+class StubStore:
+    """Spreadsheets held in memory, created on first access"""
+
+    def __init__(self):
+        self.client = fakes.FakeClient()
+        self.lock = threading.RLock()
+
+    def spreadsheet(self, key):
+        return self.client.open_by_key(key)
+
+    def resolve(self, spreadsheet, range_name):
+        """Split 'Title'!A1:B2 into (worksheet, a1 or None for the whole sheet)"""
+        range_name = unquote(range_name)
+        if "!" in range_name:
+            title, a1 = range_name.rsplit("!", 1)
+        elif range_name.startswith("'"):
+            title, a1 = range_name, None
+        elif re.match(r"^[A-Za-z]*\d*(:[A-Za-z]*\d*)?$", range_name):
+            title, a1 = None, range_name
+        else:
+            title, a1 = range_name, None
+
+        if title is None:
+            return spreadsheet.get_worksheet(0), a1
+        title = title.strip()
+        if title.startswith("'") and title.endswith("'"):
+            title = title[1:-1].replace("''", "'")
+        return spreadsheet.worksheet(title), a1
+
+def _sheet_properties(worksheet):
+    return {
+        "sheetId": worksheet.id,
+        "title": worksheet.title,
+        "index": worksheet.id,
+        "sheetType": "GRID",
+        "gridProperties": {"rowCount": max(1000, len(worksheet.rows)), "columnCount": 26},
+    }
+
+class StubHandler(BaseHTTPRequestHandler):
+    store = None
+    config = None
+
+    def log_message(self, format, *args):
+        pass
+
+    # -- helpers -----------------------------------------------------------
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _error(self, status, message, reason):
+        self._send(status, {"error": {"code": status, "message": message, "status": reason}})
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _inject(self) -> bool:
+        """Apply latency, quota and failure settings; True if the request was answered"""
+        delay = self.config.latency_ms + random.uniform(0, self.config.jitter_ms)
+        if delay:
+            time.sleep(delay / 1000)
+        if self.config.over_quota():
+            self._error(429, "Quota exceeded for quota metric 'Read requests'", "RESOURCE_EXHAUSTED")
+            return True
+        if self.config.failure_rate and random.random() < self.config.failure_rate:
+            self._error(503, "The service is currently unavailable.", "UNAVAILABLE")
+            return True
+        return False
+
+    def _route(self, method):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+
+        if url.path == "/_control" and method == "POST":
+            self.config.update(self._body())
+            return self._send(200, {
+                "latency_ms": self.config.latency_ms,
+                "jitter_ms": self.config.jitter_ms,
+                "failure_rate": self.config.failure_rate,
+                "quota_per_minute": self.config.quota_per_minute,
+            })
+        if url.path == "/_reset" and method == "POST":
+            self.store.client = fakes.FakeClient()
+            return self._send(200, {})
+
+        match = re.match(r"^/v4/spreadsheets/([^/:]+)(.*)$", url.path)
+        if not match:
+            return self._error(404, f"Unknown path {url.path}", "NOT_FOUND")
+        if self._inject():
+            return
+
+        key, rest = match.groups()
+        with self.store.lock:
+            spreadsheet = self.store.spreadsheet(key)
+            try:
+                return self._dispatch(method, spreadsheet, rest, params)
+            except Exception as e:
+                if e.__class__.__name__ == "WorksheetNotFound":
+                    return self._error(400, f"Unable to parse range: {e}", "INVALID_ARGUMENT")
+                return self._error(500, str(e), "INTERNAL")
+
+    def _dispatch(self, method, spreadsheet, rest, params):
+        if rest == "" and method == "GET":
+            return self._send(200, {
+                "spreadsheetId": spreadsheet.id,
+                "properties": {"title": spreadsheet.id, "locale": "en_US", "timeZone": "Etc/GMT"},
+                "sheets": [{"properties": _sheet_properties(ws)} for ws in spreadsheet.worksheets()],
+            })
+
+        if rest == ":batchUpdate" and method == "POST":
+            return self._send(200, {
+                "spreadsheetId": spreadsheet.id,
+                "replies": [self._apply_request(spreadsheet, request) for request in self._body().get("requests", [])],
+            })
+
+        if rest == "/values:batchGet" and method == "GET":
+            return self._send(200, {
+                "spreadsheetId": spreadsheet.id,
+                "valueRanges": [self._read(spreadsheet, name, params) for name in params.get("ranges", [])],
+            })
+
+        if rest == "/values:batchUpdate" and method == "POST":
+            body = self._body()
+            for item in body.get("data", []):
+                worksheet, a1 = self.store.resolve(spreadsheet, item["range"])
+                worksheet.update(a1 or "A1", item.get("values", []))
+            return self._send(200, {"spreadsheetId": spreadsheet.id, "totalUpdatedRows": len(body.get("data", []))})
+
+        match = re.match(r"^/values/(.+?)(:append|:clear)?$", rest)
+        if not match:
+            return self._error(404, f"Unknown path {rest}", "NOT_FOUND")
+        range_name, action = match.groups()
+
+        if action is None and method == "GET":
+            return self._send(200, self._read(spreadsheet, range_name, params))
+        if action is None and method == "PUT":
+            worksheet, a1 = self.store.resolve(spreadsheet, range_name)
+            worksheet.update(a1 or "A1", self._body().get("values", []))
+            return self._send(200, {"spreadsheetId": spreadsheet.id, "updatedRange": unquote(range_name)})
+        if action == ":append" and method == "POST":
+            worksheet, _ = self.store.resolve(spreadsheet, range_name)
+            values = self._body().get("values", [])
+            result = worksheet.append_rows(values)
+            return self._send(200, {
+                "spreadsheetId": spreadsheet.id,
+                "tableRange": f"'{worksheet.title}'!A1",
+                "updates": dict(result["updates"], updatedRows=len(values)),
+            })
+        if action == ":clear" and method == "POST":
+            worksheet, a1 = self.store.resolve(spreadsheet, range_name)
+            if a1 is None:
+                worksheet.clear()
+            else:
+                first_row, first_col, last_row, last_col = fakes.parse_a1_range(a1)
+                for row in worksheet.rows[first_row - 1:last_row]:
+                    for col in range(first_col - 1, min(last_col or len(row), len(row))):
+                        row[col] = ""
+            return self._send(200, {"spreadsheetId": spreadsheet.id, "clearedRange": unquote(range_name)})
+
+        return self._error(405, f"{method} not supported for {rest}", "INVALID_ARGUMENT")
+
+    def _read(self, spreadsheet, range_name, params):
+        worksheet, a1 = self.store.resolve(spreadsheet, range_name)
+        values = worksheet.get(a1) if a1 else worksheet.get_all_values()
+        major_dimension = params.get("majorDimension", ["ROWS"])[0]
+        if major_dimension == "COLUMNS":
+            width = max((len(row) for row in values), default=0)
+            values = [[row[i] if i < len(row) else "" for row in values] for i in range(width)]
+        body = {"range": f"'{worksheet.title}'!{a1 or 'A1:Z'}", "majorDimension": major_dimension}
+        # Like the API, a range with no values has no "values" field
+        if any(values):
+            body["values"] = values
+        return body
+
+    def _apply_request(self, spreadsheet, request):
+        if "mergeCells" in request:
+            grid = request["mergeCells"]["range"]
+            worksheet = spreadsheet.worksheets()[grid.get("sheetId", 0)]
+            worksheet.merge_cells(fakes.grid_to_a1(grid), request["mergeCells"].get("mergeType", "MERGE_ALL"))
+            return {}
+        if "unmergeCells" in request:
+            grid = request["unmergeCells"]["range"]
+            spreadsheet.worksheets()[grid.get("sheetId", 0)].unmerge_cells(fakes.grid_to_a1(grid))
+            return {}
+        if "addSheet" in request:
+            title = request["addSheet"].get("properties", {}).get("title") or f"Sheet{len(spreadsheet.worksheets()) + 1}"
+            worksheet = spreadsheet.add_worksheet(title)
+            return {"addSheet": {"properties": _sheet_properties(worksheet)}}
+        if "updateSheetProperties" in request:
+            properties = request["updateSheetProperties"]["properties"]
+            worksheet = spreadsheet.worksheets()[properties.get("sheetId", 0)]
+            if "title" in properties:
+                worksheet.update_title(properties["title"])
+            return {}
+        raise ValueError(f"Unsupported batchUpdate request: {list(request)}")
+
+    def do_GET(self):
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    def do_PUT(self):
+        self._route("PUT")
+
+def create_server(host="127.0.0.1", port=8765, config=None):
+    """Build a stub server; call serve_forever() on it, e.g. from a thread in tests"""
+    handler = type("BoundStubHandler", (StubHandler,), {"store": StubStore(), "config": config or StubConfig()})
+    return ThreadingHTTPServer((host, port), handler)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local Google Sheets API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every API request")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra delay up to this value")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--quota-per-minute", type=int, default=0, help="Requests per minute before 429 (0 = unlimited)")
+    args = parser.parse_args(argv)
+
+    config = StubConfig(args.latency_ms, args.jitter_ms, args.failure_rate, args.quota_per_minute)
+    server = create_server(args.host, args.port, config)
+    print(f"Sheets API stand-in listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,15 @@
 import streamlit as st
 from utils import validate_form_data, has_any_field_filled, add_tab, remove_tab
-from email_service import send_confirmation_email
-from sheets_service import save_team_response, save_individual_response
+from sheets_service import find_team_conflicts
+from async_services import run, submit_team, submit_individual
+from capacity import seats_error
+from client_validation import add_client_validation
 from datetime import datetime
 
 def team_form(user_email):
+    # Format errors show while typing; validate_form_data still checks on submit
+    add_client_validation({"Full Name*": "name", "CRN*": "crn", "Contact*": "contact", "Email*": "email"})
+
     with st.form("team_form"):
         st.markdown("### 👥 Team Registration")
         
@@ -45,17 +50,15 @@ def team_form(user_email):
         # Team member control buttons
         col1, col2 = st.columns(2)
         
+        # Callbacks change the member count before the rerun the click starts,
+        # which is only the registration fragment
         with col1:
             if st.session_state.num_tabs < 5:
-                if st.form_submit_button("➕ Add Team Member", use_container_width=True):
-                    add_tab()
-                    st.rerun()
+                st.form_submit_button("➕ Add Team Member", on_click=add_tab, use_container_width=True)
         
         with col2:
             if st.session_state.num_tabs > 1:
-                if st.form_submit_button("🗑️ Remove Last Member", use_container_width=True):
-                    remove_tab()
-                    st.rerun()
+                st.form_submit_button("🗑️ Remove Last Member", on_click=remove_tab, use_container_width=True)
         
         st.markdown("---")
         
@@ -111,6 +114,15 @@ def team_form(user_email):
                 st.error("⚠ Please complete all required fields for the team members you've started filling")
                 return
                 
+            if not team_errors:
+                # One lookup for the whole team against both sheets
+                team_errors = find_team_conflicts(valid_members)
+            
+            if not team_errors:
+                seats_message = seats_error(st.session_state.selectedTeam, len(valid_members))
+                if seats_message:
+                    team_errors.append(seats_message)
+            
             if team_errors:
                 st.error("⚠ Please fix the following errors:")
                 for error in team_errors:
@@ -129,28 +141,14 @@ def team_form(user_email):
                         "comments": comments.strip() if comments else ""
                     }
                     
-                    sheets_success = save_individual_response(response_data)
+                    result = run(submit_individual(response_data))
                     
-                    if sheets_success:
-                        # Send confirmation email
-                        try:
-                            email_sent = send_confirmation_email(
-                                recipient_email=valid_members[0]["email"],
-                                recipient_name=valid_members[0]["name"],
-                                team_name=st.session_state.selectedTeam,
-                                submission_type="Individual"
-                            )
-                            st.session_state.form_submitted = True
-                            st.session_state.submission_type = "individual"
-                            st.session_state.email_sent = email_sent
-                            st.session_state.special_message = "Recorded as individual form since only one member was added."
-                            st.rerun()
-                        except Exception as e:
-                            st.session_state.form_submitted = True
-                            st.session_state.submission_type = "individual"
-                            st.session_state.email_sent = False
-                            st.session_state.special_message = "Recorded as individual form since only one member was added."
-                            st.rerun()
+                    if result.saved:
+                        st.session_state.form_submitted = True
+                        st.session_state.submission_type = "individual"
+                        st.session_state.email_sent = result.successful_emails == 1
+                        st.session_state.special_message = "Recorded as individual form since only one member was added."
+                        st.rerun()
                     else:
                         st.error("❌ Failed to save application. Please try again.")
                 else:
@@ -165,37 +163,15 @@ def team_form(user_email):
                         "comments": comments.strip() if comments else ""
                     }
                     
-                    sheets_success = save_team_response(response_data)
+                    # Saves the rows, then emails every member concurrently
+                    result = run(submit_team(response_data))
                     
-                    if sheets_success:
-                        # Send confirmation emails to all team members
-                        email_results = []
-                        for i, member in enumerate(valid_members):
-                            try:
-                                # Use different email templates for team lead and members
-                                email_type = "team_lead" if i == 0 else "team_member"
-                                email_sent = send_confirmation_email(
-                                    recipient_email=member["email"],
-                                    recipient_name=member["name"],
-                                    team_name=st.session_state.selectedTeam,
-                                    submission_type="Team",
-                                    team_details={
-                                        "team_name": team_name.strip(),
-                                        "member_count": len(valid_members),
-                                        "team_lead_name": valid_members[0]["name"]
-                                    },
-                                    email_type=email_type
-                                )
-                                email_results.append(email_sent)
-                            except Exception as e:
-                                email_results.append(False)
-                                st.error(f"Email error for {member['name']}: {str(e)}")
-                        
+                    if result.saved:
                         st.session_state.form_submitted = True
                         st.session_state.submission_type = "team"
                         st.session_state.team_name = team_name.strip()
                         st.session_state.member_count = len(valid_members)
-                        st.session_state.successful_emails = sum(email_results)
+                        st.session_state.successful_emails = result.successful_emails
                         st.rerun()
                     else:
                         st.error("❌ Failed to save team application. Please try again.")
\ No newline at end of file
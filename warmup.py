@@ -0,0 +1,123 @@
+"""One-time warm-up of caches and connections when the server process starts.
+
+launch.py runs the warm-up before the Streamlit server accepts connections,
+so no visitor waits for it. Under plain `streamlit run app.py` there is no
+startup hook, so app.py starts it in the background on the first run and
+pages render without waiting. Each step is timed and recorded; a failed
+step is logged and skipped, since the request path still works without
+it, only slower. Readiness is served at /ready by health.py.
+"""
+import logging
+import threading
+import time
+from contextlib import ExitStack
+from typing import Dict, Any
+
+logger = logging.getLogger(__name__)
+
+# Google hosts used by the login flow; one request each opens a pooled TLS connection
+GOOGLE_AUTH_URLS = (
+    "https://oauth2.googleapis.com/token",
+    "https://www.googleapis.com/oauth2/v1/userinfo",
+)
+
+_lock = threading.Lock()
+_done = threading.Event()
+_started = False
+_status: Dict[str, Any] = {"state": "pending", "started_at": None, "finished_at": None, "steps": {}}
+
+def _warm_sheets():
+    """Authorize every pooled client and open both sheets on each of them"""
+    from sheets_service import sheets_service, INDIVIDUAL_SHEET_ID, TEAM_SHEET_ID
+
+    if not sheets_service.pool:
+        raise RuntimeError("Google Sheets client not initialized")
+    with ExitStack() as stack:
+        clients = [stack.enter_context(sheets_service.pool.acquire()) for _ in range(sheets_service.pool.size)]
+        for client in clients:
+            for sheet_id in (INDIVIDUAL_SHEET_ID, TEAM_SHEET_ID):
+                client.open_by_key(sheet_id)
+
+def _warm_email_index():
+    """Fill the per-partition email index, and the shared one if it was never synced"""
+    import coordination
+    from sheets_service import sheets_service
+
+    if coordination.email_index_age() is None:
+        sheets_service.sync_email_index()
+    sheets_service.warm_email_index()
+
+def _warm_content():
+    """Parse the guideline and validation rule files and read the email templates"""
+    from utils import load_json, VALIDATION_RULES_PATH
+    from email_service import load_email_template
+
+    load_json("team_guidelines.json")
+    load_json("circle_info.json")
+    load_json(VALIDATION_RULES_PATH)
+    for template_name in ("lead_mail.txt", "members_mail.txt"):
+        if load_email_template(template_name) is None:
+            raise RuntimeError(f"Email template {template_name} could not be read")
+
+def _warm_google_auth():
+    """Open the login flow's pooled connections to Google"""
+    from auth_service import _http_session
+
+    for url in GOOGLE_AUTH_URLS:
+        # Any response will do, the point is the TLS handshake
+        _http_session.head(url, timeout=5)
+
+def _warm_health():
+    """Probe every backend once so /health has a status from the start"""
+    from health import PROBES, run_probe
+
+    for name in PROBES:
+        run_probe(name)
+
+STEPS = (
+    ("sheets_clients", _warm_sheets),
+    ("email_index", _warm_email_index),
+    ("content", _warm_content),
+    ("google_auth", _warm_google_auth),
+    ("health_probes", _warm_health),
+)
+
+def run_warmup():
+    """Run every warm-up step in order and record how each went"""
+    global _started
+    with _lock:
+        _started = True
+        _status.update(state="running", started_at=time.time())
+    for name, step in STEPS:
+        started = time.perf_counter()
+        try:
+            step()
+            error = ""
+        except Exception as e:
+            error = str(e)
+            logger.warning("Warm-up step %s failed: %s", name, e)
+        duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        with _lock:
+            _status["steps"][name] = {"ok": not error, "duration_ms": duration_ms, "error": error}
+
+    with _lock:
+        _status.update(state="ready", finished_at=time.time())
+        total_ms = round((_status["finished_at"] - _status["started_at"]) * 1000, 1)
+    _done.set()
+    logger.info("Warm-up finished", extra={"event": "warmup.ready", "duration_ms": total_ms})
+
+def start_warmup():
+    """Start the warm-up in the background, unless it already ran in this process"""
+    global _started
+    with _lock:
+        if _started:
+            return
+        _started = True
+    threading.Thread(target=run_warmup, name="warmup", daemon=True).start()
+
+def is_ready() -> bool:
+    return _done.is_set()
+
+def get_warmup_status() -> Dict[str, Any]:
+    with _lock:
+        return {**_status, "steps": {name: dict(step) for name, step in _status["steps"].items()}}